@@ -1,9 +1,22 @@
+import os
+import sys
 from fastapi import FastAPI
 from routes.products import router as product_router
 import uvicorn
 
+# The limiter is imported as the rate_limiter package from the repository
+# root, so its modules cannot clash with this app's own top-level names.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from rate_limiter.algorithms.token_bucket import TokenBucket
+from rate_limiter.async_limiter import AsyncRateLimiter, event_loop_store
+from rate_limiter.middleware import RateLimitMiddleware
+
 app = FastAPI()
 app.include_router(product_router, prefix="/products")
+app.add_middleware(
+    RateLimitMiddleware,
+    limiter=AsyncRateLimiter(TokenBucket(capacity=20, refill_rate=10, store_factory=event_loop_store)),
+)
 
 if __name__ == '__main__':
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
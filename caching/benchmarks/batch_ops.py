@@ -0,0 +1,86 @@
+"""
+Per-key cost of get_many/put_many compared with a loop of single get/put calls.
+
+Misses are part of the workload: the "raise" loop pays for a raised
+NotFoundError on each one, the "present" loop uses get_if_present, and
+get_many reports them in a set.
+
+Run from the caching directory:
+    python -m benchmarks.batch_ops --batch-sizes 50 500
+"""
+import argparse
+import random
+import time
+from cache import Cache
+from exceptions.exception import NotFoundError
+from storage.store import MISSING
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from sharded_cache import ShardedCache
+from storage.memory_store import MemoryStore
+
+
+def build(kind: str, capacity: int, ttl_seconds):
+    if kind == "cache":
+        return Cache(store=MemoryStore(capacity=capacity), eviction_policy=LeastRecentlyUsedPolicy(), ttl_seconds=ttl_seconds)
+    return ShardedCache(
+        store_factory=lambda: MemoryStore(capacity=capacity // 16),
+        policy_factory=LeastRecentlyUsedPolicy,
+        num_shards=16,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+def single_loop(cache, batches: list) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        for key in batch:
+            try:
+                cache.get(key)
+            except NotFoundError:
+                cache.put(key, key)
+    return time.perf_counter() - start
+
+
+def present_loop(cache, batches: list) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        for key in batch:
+            if cache.get_if_present(key, MISSING) is MISSING:
+                cache.put(key, key)
+    return time.perf_counter() - start
+
+
+def batched(cache, batches: list) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        _, misses = cache.get_many(batch)
+        if misses:
+            cache.put_many((key, key) for key in misses)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--keys", type=int, default=400_000, help="total keys looked up per run")
+    parser.add_argument("--capacity", type=int, default=100_000)
+    parser.add_argument("--key-space", type=int, default=150_000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    print(f"{'cache':>8} {'ttl':>5} {'batch':>6} {'raise ns/key':>13} {'present ns/key':>15} "
+          f"{'batch ns/key':>13} {'speedup':>8}")
+    for kind in ("cache", "sharded"):
+        for ttl in (None, 300):
+            for size in args.batch_sizes:
+                batches = [[rng.randrange(args.key_space) for _ in range(size)] for _ in range(args.keys // size)]
+                total = len(batches) * size
+                loop_s = single_loop(build(kind, args.capacity, ttl), batches)
+                present_s = present_loop(build(kind, args.capacity, ttl), batches)
+                batch_s = batched(build(kind, args.capacity, ttl), batches)
+                print(f"{kind:>8} {str(ttl):>5} {size:>6} {loop_s / total * 1e9:>13.0f} "
+                      f"{present_s / total * 1e9:>15.0f} {batch_s / total * 1e9:>13.0f} {loop_s / batch_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
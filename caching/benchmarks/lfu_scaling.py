@@ -0,0 +1,58 @@
+"""
+Per-operation latency of LeastFrequentlyUsedPolicy as the number of tracked keys grows.
+
+Every key sits at frequency 1, which is the worst case for list-based
+frequency buckets. With O(1) buckets the nanoseconds per operation should
+stay flat across sizes.
+
+Run from the caching directory:
+    python -m benchmarks.lfu_scaling --sizes 10000 100000 1000000 10000000
+"""
+import argparse
+import gc
+import random
+import time
+from policies.lfu_policy import LeastFrequentlyUsedPolicy
+
+
+def measure(size: int, ops: int) -> dict:
+    policy = LeastFrequentlyUsedPolicy[int]()
+    for key in range(size):
+        policy.record_access(key)
+
+    rng = random.Random(7)
+    hits = [rng.randrange(size) for _ in range(ops)]
+    next_key = size
+
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    for key in hits:
+        policy.record_access(key)
+    access_ns = (time.perf_counter() - start) / ops * 1e9
+
+    start = time.perf_counter()
+    for _ in range(ops):
+        policy.evict()
+        policy.record_access(next_key)
+        next_key += 1
+    churn_ns = (time.perf_counter() - start) / ops * 1e9
+    gc.enable()
+
+    return {"size": size, "access_ns": access_ns, "evict_insert_ns": churn_ns}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'keys':>12} {'access ns/op':>14} {'evict+insert ns/op':>20}")
+    for size in args.sizes:
+        result = measure(size, args.ops)
+        print(f"{result['size']:>12,} {result['access_ns']:>14.0f} {result['evict_insert_ns']:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Per-key memory overhead of Cache bookkeeping, excluding the keys and values themselves.
+
+Keys and values are allocated before measuring, so the figure covers the
+store's dict, the TTL/expiry metadata and the eviction policy's nodes.
+
+Run from the caching directory:
+    python -m benchmarks.memory_overhead --keys 200000
+"""
+import argparse
+import gc
+import tracemalloc
+from cache import Cache
+from policies.lfu_policy import LeastFrequentlyUsedPolicy
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from storage.memory_store import MemoryStore
+
+POLICIES = {
+    "lru": LeastRecentlyUsedPolicy,
+    "lfu": LeastFrequentlyUsedPolicy,
+}
+
+
+def measure(policy_name: str, keys: int, ttl_seconds) -> float:
+    names = [f"key-{i}" for i in range(keys)]
+    value = b"x" * 100
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cache = Cache(store=MemoryStore(capacity=keys), eviction_policy=POLICIES[policy_name](), ttl_seconds=ttl_seconds)
+    for name in names:
+        cache.put(name, value)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'policy':>8} {'ttl':>6} {'bytes/key':>10}")
+    for policy_name in POLICIES:
+        for ttl in (None, 3600):
+            print(f"{policy_name:>8} {str(ttl):>6} {measure(policy_name, args.keys, ttl):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Restart time and read latency of MmapStore compared with MemoryStore.
+
+"Restart" for MemoryStore means repopulating it from scratch, which is a
+lower bound on a real cold start (the origin would be far slower). For
+MmapStore it means reopening the log, with and without an index snapshot,
+and adopting the entries into a Cache with warm_start().
+
+Run from the caching directory:
+    python -m benchmarks.mmap_store --entries 200000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from cache import Cache
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from storage.memory_store import MemoryStore
+from storage.mmap_store import MmapStore
+
+
+def read_latency_ns(store, keys: list) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        store.get(key)
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--value-size", type=int, default=512)
+    parser.add_argument("--reads", type=int, default=200_000)
+    args = parser.parse_args()
+
+    keys = [f"key-{i}" for i in range(args.entries)]
+    value = os.urandom(args.value_size)
+    rng = random.Random(3)
+    read_keys = [rng.choice(keys) for _ in range(args.reads)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.log")
+        store = MmapStore(path, initial_size=args.entries * (args.value_size + 64))
+        for key in keys:
+            store.put(key, value)
+        store.flush()
+        store.close()
+        os.remove(path + ".idx")
+
+        start = time.perf_counter()
+        store = MmapStore(path)
+        Cache(store=store, eviction_policy=LeastRecentlyUsedPolicy()).warm_start()
+        replay_s = time.perf_counter() - start
+        store.close()
+
+        start = time.perf_counter()
+        store = MmapStore(path)
+        Cache(store=store, eviction_policy=LeastRecentlyUsedPolicy()).warm_start()
+        snapshot_s = time.perf_counter() - start
+        mmap_read = read_latency_ns(store, read_keys)
+        store.close()
+
+    start = time.perf_counter()
+    memory = MemoryStore(capacity=args.entries)
+    for key in keys:
+        memory.put(key, value)
+    refill_s = time.perf_counter() - start
+    memory_read = read_latency_ns(memory, read_keys)
+
+    print(f"entries: {args.entries:,}  value size: {args.value_size} B")
+    print(f"MemoryStore refill:             {refill_s * 1e3:10.1f} ms")
+    print(f"MmapStore reopen (log replay):  {replay_s * 1e3:10.1f} ms")
+    print(f"MmapStore reopen (snapshot):    {snapshot_s * 1e3:10.1f} ms")
+    print(f"MemoryStore get:                {memory_read:10.0f} ns")
+    print(f"MmapStore get (memoryview):     {mmap_read:10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
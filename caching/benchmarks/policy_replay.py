@@ -0,0 +1,102 @@
+"""
+Trace-replay harness reporting hit ratio and throughput for each eviction policy.
+
+Each trace is replayed through a Cache backed by a MemoryStore: a hit is a
+successful get, a miss is followed by a put of the key. Synthetic traces:
+
+    zipf  - keys drawn from a Zipf distribution over the key space
+    scan  - the zipf trace interleaved with long sequential scans of
+            one-off keys, which flush recency-only policies
+
+A recorded trace can be replayed with --trace-file (one key per line).
+
+Run from the caching directory:
+    python -m benchmarks.policy_replay --capacity 1000
+"""
+import argparse
+import bisect
+import itertools
+import random
+import time
+from typing import Callable, Dict, List
+from cache import Cache
+from policies.arc_policy import AdaptiveReplacementCachePolicy
+from policies.eviction_policy import EvictionPolicy
+from policies.lfu_policy import LeastFrequentlyUsedPolicy
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from policies.tinylfu_policy import WindowTinyLFUPolicy
+from policies.two_queue_policy import TwoQueuePolicy
+from storage.memory_store import MemoryStore
+from storage.store import MISSING
+
+POLICIES: Dict[str, Callable[[int], EvictionPolicy]] = {
+    "lru": lambda capacity: LeastRecentlyUsedPolicy(),
+    "lfu": lambda capacity: LeastFrequentlyUsedPolicy(),
+    "w-tinylfu": WindowTinyLFUPolicy,
+    "arc": AdaptiveReplacementCachePolicy,
+    "2q": TwoQueuePolicy,
+}
+
+
+def zipf_trace(length: int, key_space: int, skew: float, seed: int) -> List[int]:
+    weights = [1.0 / (rank ** skew) for rank in range(1, key_space + 1)]
+    cdf = list(itertools.accumulate(weights))
+    total = cdf[-1]
+    rng = random.Random(seed)
+    return [bisect.bisect_left(cdf, rng.random() * total) for _ in range(length)]
+
+
+def scan_trace(length: int, key_space: int, skew: float, seed: int, scan_length: int, scan_every: int) -> List[int]:
+    base = zipf_trace(length, key_space, skew, seed)
+    trace: List[int] = []
+    next_scan_key = key_space
+    for start in range(0, len(base), scan_every):
+        trace.extend(base[start:start + scan_every])
+        trace.extend(range(next_scan_key, next_scan_key + scan_length))
+        next_scan_key += scan_length
+    return trace
+
+
+def replay(trace: list, policy: EvictionPolicy, capacity: int) -> dict:
+    cache = Cache(store=MemoryStore(capacity=capacity), eviction_policy=policy)
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get_if_present(key, MISSING) is MISSING:
+            cache.put(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return {"hit_ratio": hits / len(trace), "ops_per_sec": len(trace) / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacity", type=int, default=1_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--length", type=int, default=300_000)
+    parser.add_argument("--skew", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=list(POLICIES))
+    parser.add_argument("--trace-file", help="replay a recorded trace instead of the synthetic ones")
+    args = parser.parse_args()
+
+    if args.trace_file:
+        with open(args.trace_file) as f:
+            traces = {args.trace_file: [line.strip() for line in f if line.strip()]}
+    else:
+        traces = {
+            "zipf": zipf_trace(args.length, args.key_space, args.skew, args.seed),
+            "scan": scan_trace(args.length, args.key_space, args.skew, args.seed,
+                               scan_length=args.capacity * 2, scan_every=args.capacity * 10),
+        }
+
+    print(f"{'trace':>10} {'policy':>10} {'hit ratio':>10} {'ops/s':>12}")
+    for trace_name, trace in traces.items():
+        for name in args.policies:
+            result = replay(trace, POLICIES[name](args.capacity), args.capacity)
+            print(f"{trace_name:>10} {name:>10} {result['hit_ratio']:>10.2%} {result['ops_per_sec']:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Multithreaded throughput benchmark: ShardedCache vs a single-lock Cache.
+
+A ShardedCache with one shard is exactly a Cache guarded by one global lock,
+so it is used as the baseline.
+
+Run from the caching directory:
+    python -m benchmarks.sharded_cache
+"""
+import argparse
+import random
+import threading
+import time
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from sharded_cache import ShardedCache
+from storage.memory_store import MemoryStore
+from storage.store import MISSING
+
+
+def build_cache(num_shards: int, capacity: int) -> ShardedCache[int, int]:
+    per_shard = max(1, capacity // num_shards)
+    return ShardedCache[int, int](
+        store_factory=lambda: MemoryStore[int, int](capacity=per_shard),
+        policy_factory=LeastRecentlyUsedPolicy[int],
+        num_shards=num_shards,
+    )
+
+
+def worker(cache: ShardedCache[int, int], keys: list, ops: int, barrier: threading.Barrier) -> None:
+    barrier.wait()
+    for i in range(ops):
+        key = keys[i % len(keys)]
+        if cache.get_if_present(key, MISSING) is MISSING:
+            cache.put(key, key)
+
+
+def run(num_shards: int, threads: int, ops_per_thread: int, capacity: int, key_space: int) -> float:
+    cache = build_cache(num_shards, capacity)
+    barrier = threading.Barrier(threads + 1)
+    rng = random.Random(42)
+    workers = []
+    for _ in range(threads):
+        keys = [int(rng.paretovariate(1.2)) % key_space for _ in range(ops_per_thread)]
+        workers.append(threading.Thread(target=worker, args=(cache, keys, ops_per_thread, barrier)))
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, default=32)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ops", type=int, default=100_000, help="operations per thread")
+    parser.add_argument("--capacity", type=int, default=50_000)
+    parser.add_argument("--key-space", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'single-lock ops/s':>18} {f'{args.shards}-shard ops/s':>18} {'speedup':>8}")
+    for threads in args.threads:
+        single = run(1, threads, args.ops, args.capacity, args.key_space)
+        sharded = run(args.shards, threads, args.ops, args.capacity, args.key_space)
+        print(f"{threads:>8} {single:>18,.0f} {sharded:>18,.0f} {sharded / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Multi-process benchmark: a private Cache per worker vs TieredCache with a shared L2.
+
+Each worker process replays a skewed key trace through get_or_load, with a
+loader that sleeps to stand in for the origin. With private caches every
+worker loads every hot key itself; with the tiered cache a key loaded by
+one worker is an L2 hit for the others. A second wave of workers, started
+after the first exits, shows the warm-up a restarted worker gets from L2.
+
+Run from the caching directory:
+    python -m benchmarks.tiered_cache --workers 4
+"""
+import argparse
+import multiprocessing
+import random
+import time
+from cache import Cache
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from storage.memory_store import MemoryStore
+from storage.socket_store import SocketStore, SocketStoreServer
+from tiered_cache import TieredCache
+
+
+def serve(capacity: int, addresses) -> None:
+    server = SocketStoreServer(Cache(store=MemoryStore(capacity=capacity), eviction_policy=LeastRecentlyUsedPolicy()))
+    addresses.put((server.address, server.authkey))
+    server.serve_forever()
+
+
+def worker(mode: str, address, authkey: bytes, seed: int, args, results) -> None:
+    if mode == "private":
+        cache = Cache(store=MemoryStore(capacity=args.l1_capacity), eviction_policy=LeastRecentlyUsedPolicy())
+    else:
+        cache = TieredCache(
+            l1_store=MemoryStore(capacity=args.l1_capacity),
+            l1_policy=LeastRecentlyUsedPolicy(),
+            l2=SocketStore(address, authkey),
+        )
+    origin_loads = 0
+
+    def loader(key):
+        nonlocal origin_loads
+        origin_loads += 1
+        time.sleep(args.origin_ms / 1e3)
+        return key
+
+    rng = random.Random(seed)
+    keys = [int(rng.paretovariate(1.1)) % args.key_space for _ in range(args.ops)]
+    start = time.perf_counter()
+    for key in keys:
+        cache.get_or_load(key, loader)
+    results.put((origin_loads, time.perf_counter() - start))
+
+
+def run_wave(mode: str, address, authkey: bytes, wave: int, args) -> tuple:
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, address, authkey, wave * 1000 + i, args, results)) for i in range(args.workers)]
+    for p in procs:
+        p.start()
+    outcomes = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    loads = sum(loads for loads, _ in outcomes)
+    slowest = max(elapsed for _, elapsed in outcomes)
+    return loads, slowest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=20_000, help="lookups per worker")
+    parser.add_argument("--key-space", type=int, default=20_000)
+    parser.add_argument("--l1-capacity", type=int, default=1_000)
+    parser.add_argument("--l2-capacity", type=int, default=20_000)
+    parser.add_argument("--origin-ms", type=float, default=1.0, help="simulated origin latency")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    addresses = ctx.Queue()
+    server = ctx.Process(target=serve, args=(args.l2_capacity, addresses), daemon=True)
+    server.start()
+    address, authkey = addresses.get()
+
+    print(f"{'mode':>8} {'wave':>5} {'origin loads':>13} {'slowest worker s':>17}")
+    try:
+        for mode in ("private", "tiered"):
+            for wave in (1, 2):
+                loads, slowest = run_wave(mode, address, authkey, wave, args)
+                print(f"{mode:>8} {wave:>5} {loads:>13,} {slowest:>17.2f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,361 @@
-from typing import TypeVar, Generic, Optional, Dict
-from storage.store import Store
+from typing import Callable, TypeVar, Optional, Dict, Iterable, List, Set, Tuple, Union
+from storage.store import Store, MISSING
 from policies.eviction_policy import EvictionPolicy
-from exceptions.exception import CacheFullError
+from exceptions.exception import CacheFullError, NotFoundError
+from data_structures.timer_wheel import TimerWheel
+from read_through import ReadThroughMixin, refresh_due
+from stats import CacheStats
 import time
 
 K = TypeVar('K')
 V = TypeVar('V')
 
-class Cache(Generic[K, V]):
+class Cache(ReadThroughMixin[K, V]):
     """
     Cache class to store and retrieve key-value pairs.
     """
-    def __init__(self, store: Store[K, V], eviction_policy: EvictionPolicy[K], ttl_seconds: Optional[int] = None):
+    def __init__(
+        self,
+        store: Store[K, V],
+        eviction_policy: EvictionPolicy[K],
+        ttl_seconds: Optional[int] = None,
+        expiry_batch_size: int = 64,
+        expiry_tick_seconds: float = 0.1,
+        refresh_beta: float = 1.0,
+        stats: bool = False,
+        on_evict: Optional[Callable[[K, V], None]] = None,
+    ):
         """
         Initialize the cache with a store and an eviction policy.
-        
+
         Args:
             store: An instance of a store (e.g., MemoryStore).
             eviction_policy: An instance of an eviction policy (e.g., LRU).
             ttl_seconds: Optional time-to-live for cache entries in seconds.
+            expiry_batch_size: Maximum number of expired entries reclaimed per
+                get/put, which bounds the extra work any single call does.
+            expiry_tick_seconds: Resolution of the expiry timer wheel.
+            refresh_beta: Eagerness of probabilistic early refresh in get_or_load;
+                0 disables it.
+            stats: Collect hit/miss counts, load times and latency histograms.
+            on_evict: Called with the key and value of each entry evicted to
+                make room; expired and deleted entries are not reported.
         """
         self._store = store
         self._eviction_policy = eviction_policy
         self._ttl_seconds = ttl_seconds
-        self._key_timestamp: Dict[K, float] = {}
+        # Absolute expiry time per key; keys without a TTL take no entry.
+        self._key_expiry: Dict[K, float] = {}
+        # Seconds the last get_or_load loader call took, per loaded key.
+        self._key_load_time: Dict[K, float] = {}
+        self._expiry_batch_size = expiry_batch_size
+        self._expiry = TimerWheel[K](tick_seconds=expiry_tick_seconds, start=time.time())
+        self._evictions = 0
+        self._expirations = 0
+        self._stats: Optional[CacheStats] = CacheStats() if stats else None
+        self._on_evict = on_evict
+        self._init_read_through(refresh_beta)
+
+    @property
+    def evicted_count(self) -> int:
+        """
+        Number of live entries removed by the eviction policy to make room.
+        """
+        return self._evictions
 
-    def get(self, key: K):
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        """
+        The cache-wide time-to-live, or None if entries only expire when given a TTL.
+        """
+        return self._ttl_seconds
+
+    @property
+    def expired_count(self) -> int:
+        """
+        Number of entries removed because their TTL elapsed.
+        """
+        return self._expirations
+
+    def get(self, key: K) -> V:
         """
         Retrieve a value from the cache by key.
-        
+
         Args:
             key: The key to retrieve the value for.
-        
+
         Returns:
             The value associated with the key.
+
+        Raises:
+            NotFoundError: If the key is missing or has expired.
+        """
+        value = self.get_if_present(key, MISSING)
+        if value is MISSING:
+            raise NotFoundError(f"Key '{key}' not found in cache.")
+        return value
+
+    def stats_snapshot(self) -> Dict[str, object]:
         """
+        Snapshot of the cache statistics.
+
+        Eviction and expiration counts are always present; hit/miss counts,
+        load times and latency percentiles only when created with stats=True.
+        """
+        snapshot: Dict[str, object] = self._stats.snapshot() if self._stats is not None else {}
+        snapshot['evictions'] = self._evictions
+        snapshot['expirations'] = self._expirations
+        return snapshot
+
+    def get_if_present(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve a value from the cache by key without raising on a miss.
+
+        Args:
+            key: The key to retrieve the value for.
+            default: Value returned when the key is missing or has expired.
+
+        Returns:
+            The value associated with the key, or `default`.
+        """
+        return self._lookup(key, default, self._stats)
+
+    def _peek(self, key: K):
+        # Uncounted lookup used by the read-through recheck, so a coalesced
+        # miss is not recorded twice.
+        return self._lookup(key, MISSING, None)
+
+    def _lookup(self, key: K, default, stats: Optional[CacheStats]):
+        if stats is not None:
+            start = time.perf_counter()
         now = time.time()
-        if self._ttl_seconds is not None:
-            if key in self._key_timestamp:
-                if now - self._key_timestamp[key] > self._ttl_seconds:
-                    self._store.delete(key)
-                    self._eviction_policy.record_access(key)
-                    self._key_timestamp.pop(key, None)
-                    raise KeyError(f"Key '{key}' has expired and been removed from the cache.")
-            else:
-                raise KeyError(f"Key '{key}' not found in cache.")
-        value = self._store.get(key)
+        self._reclaim_expired(now, self._expiry_batch_size)
+        expires_at = self._key_expiry.get(key)
+        if expires_at is None:
+            value = MISSING if self._ttl_seconds is not None else self._store.get_or(key, MISSING)
+        elif now > expires_at:
+            self._expire(key)
+            value = MISSING
+        else:
+            value = self._store.get_or(key, MISSING)
+
+        if value is MISSING:
+            if stats is not None:
+                stats.misses += 1
+                stats.latency['get'].record(time.perf_counter() - start)
+            return default
         self._eviction_policy.record_access(key)
+        if stats is not None:
+            stats.hits += 1
+            stats.latency['get'].record(time.perf_counter() - start)
         return value
 
-    def put(self, key: K, value: V):
+    def put(self, key: K, value: V, ttl_seconds: Optional[float] = None):
         """
-        Store a key-value pair in the cache.
-        
+        Store a key-value pair in the cache, evicting entries until it fits.
+
         Args:
             key: The key to store.
             value: The value to associate with the key.
+            ttl_seconds: Optional time-to-live for this entry, overriding the
+                cache-wide TTL.
         """
-        try:
-            now = time.time()
-            self._store.put(key, value)
-            self._eviction_policy.record_access(key)
-            self._key_timestamp[key] = now
-        except CacheFullError:
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+        now = time.time()
+        self._reclaim_expired(now, self._expiry_batch_size)
+        while not self._store.try_put(key, value):
             evicted_key = self._eviction_policy.evict()
+            if self._on_evict is not None:
+                self._on_evict(evicted_key, self._store.get(evicted_key))
             self._store.delete(evicted_key)
-            self._key_timestamp.pop(evicted_key, None)
-            self._store.put(key, value)
+            self._forget(evicted_key)
+            self._evictions += 1
+        self._eviction_policy.record_access(key)
+        self._set_expiry(key, now, self._ttl_seconds if ttl_seconds is None else ttl_seconds)
+        if stats is not None:
+            stats.latency['put'].record(time.perf_counter() - start)
+
+    def get_many(self, keys: Iterable[K]) -> Tuple[Dict[K, V], Set[K]]:
+        """
+        Retrieve several keys at once under a single clock read.
+
+        Args:
+            keys: The keys to retrieve.
+
+        Returns:
+            A dict of the keys found with their values, and the set of keys that missed.
+        """
+        keys = list(keys)
+        now = time.time()
+        self._reclaim_expired(now, self._expiry_batch_size)
+        if self._key_expiry or self._ttl_seconds is not None:
+            key_expiry = self._key_expiry
+            candidates: List[K] = []
+            for key in keys:
+                expires_at = key_expiry.get(key)
+                if expires_at is None:
+                    if self._ttl_seconds is None:
+                        candidates.append(key)
+                elif now > expires_at:
+                    self._expire(key)
+                else:
+                    candidates.append(key)
+        else:
+            candidates = keys
+        found = self._store.get_many(candidates)
+        self._eviction_policy.record_accesses(found)
+        misses = {key for key in keys if key not in found}
+        if self._stats is not None:
+            # One hit or miss per key requested, repeats included.
+            hits = sum(key in found for key in keys)
+            self._stats.hits += hits
+            self._stats.misses += len(keys) - hits
+        return found, misses
+
+    def put_many(self, items: Union[Dict[K, V], Iterable[Tuple[K, V]]], ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store several key-value pairs, evicting in batches until they all fit.
+
+        Args:
+            items: A dict or iterable of (key, value) pairs.
+            ttl_seconds: Optional time-to-live for these entries, overriding the
+                cache-wide TTL.
+        """
+        now = time.time()
+        self._reclaim_expired(now, self._expiry_batch_size)
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        pending = list(items.items() if isinstance(items, dict) else items)
+        while pending:
+            remaining = self._store.put_many(pending)
+            stored = pending[:len(pending) - len(remaining)]
+            self._eviction_policy.record_accesses(key for key, _ in stored)
+            for key, _ in stored:
+                self._set_expiry(key, now, ttl)
+            if not remaining:
+                break
+            evicted = self._eviction_policy.evict_many(len(remaining))
+            if not evicted:
+                raise CacheFullError("No entries left to evict for the remaining items.")
+            if self._on_evict is not None:
+                for key, value in self._store.get_many(evicted).items():
+                    self._on_evict(key, value)
+            self._store.delete_many(evicted)
+            for key in evicted:
+                self._forget(key)
+            self._evictions += len(evicted)
+            pending = remaining
+
+    def delete_many(self, keys: Iterable[K]) -> Set[K]:
+        """
+        Remove several keys from the cache.
+
+        Args:
+            keys: The keys to remove.
+
+        Returns:
+            The keys that were not in the cache.
+        """
+        keys = set(keys)
+        deleted = self._store.delete_many(keys)
+        self._eviction_policy.remove_keys(deleted)
+        for key in deleted:
+            self._forget(key)
+        return keys.difference(deleted)
+
+    def keys(self) -> List[K]:
+        """
+        List the keys of the entries that have not expired.
+
+        Returns:
+            The live keys, in the store's iteration order.
+        """
+        now = time.time()
+        self._reclaim_expired(now, self._expiry_batch_size)
+        key_expiry = self._key_expiry
+        live: List[K] = []
+        for key in list(self._store.keys()):
+            expires_at = key_expiry.get(key)
+            if expires_at is None:
+                if self._ttl_seconds is None:
+                    live.append(key)
+            elif now > expires_at:
+                self._expire(key)
+            else:
+                live.append(key)
+        return live
+
+    def expires_at(self, key: K) -> Optional[float]:
+        """
+        The time at which a key's entry expires, or None if it never does or is not cached.
+        """
+        return self._key_expiry.get(key)
+
+    def warm_start(self) -> int:
+        """
+        Adopt the entries already held by a persistent store after a restart.
+
+        Keys are replayed into the eviction policy oldest write first, so
+        recency-based policies resume in approximately their previous order.
+        Restored entries get a fresh cache-wide TTL.
+
+        Returns:
+            The number of entries adopted.
+        """
+        now = time.time()
+        count = 0
+        for key in self._store.keys():
             self._eviction_policy.record_access(key)
-            self._key_timestamp[key] = now
\ No newline at end of file
+            if self._ttl_seconds is not None:
+                self._key_expiry[key] = now + self._ttl_seconds
+                self._expiry.schedule(key, now + self._ttl_seconds)
+            count += 1
+        return count
+
+    def expire(self, max_items: Optional[int] = None) -> int:
+        """
+        Reclaim entries whose TTL has elapsed, without waiting for them to be read.
+
+        Args:
+            max_items: Maximum number of entries to reclaim, or None for all due entries.
+
+        Returns:
+            The number of entries reclaimed.
+        """
+        return self._reclaim_expired(time.time(), max_items)
+
+    def _reclaim_expired(self, now: float, max_items: Optional[int]) -> int:
+        expired_keys = self._expiry.expired(now, max_items)
+        for key in expired_keys:
+            self._expire(key)
+        return len(expired_keys)
+
+    def _expire(self, key: K) -> None:
+        self._store.delete(key)
+        self._eviction_policy.remove_key(key)
+        self._forget(key)
+        self._expirations += 1
+
+    def _set_expiry(self, key: K, now: float, ttl_seconds: Optional[float]) -> None:
+        if ttl_seconds is not None:
+            self._key_expiry[key] = now + ttl_seconds
+            self._expiry.schedule(key, now + ttl_seconds)
+        elif key in self._key_expiry:
+            del self._key_expiry[key]
+            self._expiry.cancel(key)
+
+    def _refresh_due(self, key: K, beta: float) -> bool:
+        return refresh_due(self._key_expiry.get(key), self._key_load_time.get(key), beta, time.time())
+
+    def _record_load(self, key: K, seconds: float, succeeded: bool) -> None:
+        if self._stats is not None:
+            self._stats.record_load(seconds, succeeded)
+        # Only entries that expire can be refreshed early.
+        if succeeded and key in self._key_expiry:
+            self._key_load_time[key] = seconds
+
+    def _forget(self, key: K) -> None:
+        self._key_load_time.pop(key, None)
+        if self._key_expiry.pop(key, None) is not None:
+            self._expiry.cancel(key)
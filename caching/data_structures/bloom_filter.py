@@ -0,0 +1,52 @@
+from typing import Generic, TypeVar
+from .count_min_sketch import indexes
+
+K = TypeVar('K')
+
+class BloomFilter(Generic[K]):
+    """
+    Bloom filter over a fixed-size bit array.
+    """
+    def __init__(self, bits: int, hashes: int = 3):
+        """
+        Initialize an empty filter.
+
+        Args:
+            bits: Number of bits; rounded up to a power of two.
+            hashes: Number of hash functions.
+        """
+        size = 8
+        while size < bits:
+            size <<= 1
+        self._mask = size - 1
+        self._hashes = hashes
+        self._bits = bytearray(size // 8)
+
+    def add(self, key: K) -> bool:
+        """
+        Add a key to the filter.
+
+        Args:
+            key: The key to add.
+
+        Returns:
+            True if the key was (probably) already present.
+        """
+        bits = self._bits
+        present = True
+        for index in indexes(key, self._hashes, self._mask):
+            byte, bit = index >> 3, 1 << (index & 7)
+            if not bits[byte] & bit:
+                present = False
+                bits[byte] |= bit
+        return present
+
+    def __contains__(self, key: K) -> bool:
+        bits = self._bits
+        return all(bits[index >> 3] & (1 << (index & 7)) for index in indexes(key, self._hashes, self._mask))
+
+    def clear(self) -> None:
+        """
+        Remove every key from the filter.
+        """
+        self._bits = bytearray(len(self._bits))
@@ -0,0 +1,86 @@
+from typing import Generic, List, TypeVar
+
+K = TypeVar('K')
+
+MASK_64 = (1 << 64) - 1
+HALVE = bytes(b >> 1 for b in range(256))
+
+def spread_hash(key: object) -> int:
+    """
+    Mix Python's hash of a key into a well-distributed 64-bit value.
+
+    Small integers hash to themselves, so the raw hash is a poor source of
+    independent bits for multiple table indexes.
+    """
+    h = (hash(key) * 0x9E3779B97F4A7C15) & MASK_64
+    return h ^ (h >> 32)
+
+def indexes(key: object, count: int, mask: int) -> List[int]:
+    """
+    Compute `count` table indexes for a key using double hashing.
+    """
+    h = spread_hash(key)
+    h1 = h & 0xFFFFFFFF
+    h2 = (h >> 32) | 1
+    return [(h1 + i * h2) & mask for i in range(count)]
+
+class CountMinSketch(Generic[K]):
+    """
+    Count-min sketch of small saturating counters used to estimate access frequency.
+
+    Uses conservative update (only the smallest counters are incremented),
+    which keeps over-estimation low, and supports halving every counter so
+    that old popularity fades.
+    """
+    def __init__(self, width: int, depth: int = 4, max_count: int = 15):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width: Counters per row; rounded up to a power of two.
+            depth: Number of rows (independent hash functions).
+            max_count: Saturation value of each counter (at most 255).
+        """
+        size = 1
+        while size < max(width, 16):
+            size <<= 1
+        self._width = size
+        self._depth = depth
+        self._max_count = min(max_count, 255)
+        self._offsets = [row * size for row in range(depth)]
+        self._table = bytearray(size * depth)
+
+    def increment(self, key: K) -> None:
+        """
+        Record one occurrence of a key.
+
+        Args:
+            key: The key that occurred.
+        """
+        table = self._table
+        slots = [offset + index for offset, index in zip(self._offsets, indexes(key, self._depth, self._width - 1))]
+        current = min(table[slot] for slot in slots)
+        if current >= self._max_count:
+            return
+        for slot in slots:
+            if table[slot] == current:
+                table[slot] = current + 1
+
+    def estimate(self, key: K) -> int:
+        """
+        Estimate how many times a key occurred.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            An upper bound on the (aged) number of occurrences.
+        """
+        table = self._table
+        return min(table[offset + index] for offset, index in zip(self._offsets, indexes(key, self._depth, self._width - 1)))
+
+    def halve(self) -> None:
+        """
+        Divide every counter by two.
+        """
+        self._table = bytearray(self._table.translate(HALVE))
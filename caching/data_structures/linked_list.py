@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional
 
 K = TypeVar('K')
 
@@ -6,6 +6,8 @@ class Node(Generic[K]):
     """
     Node class for the linked list.
     """
+    __slots__ = ('key', 'next', 'prev')
+
     def __init__(self, key: K):
         self.key = key
         self.next = None
@@ -33,6 +35,19 @@ class DoublyLinkedList(Generic[K]):
         self.head.next.prev = node
         self.head.next = node
 
+    def insert_after(self, anchor: Node[K], node: Node[K]) -> None:
+        """
+        Insert a node directly after another node of the linked list.
+        
+        Args:
+            anchor: The node already in the list (or the head sentinel).
+            node: The node to insert.
+        """
+        node.prev = anchor
+        node.next = anchor.next
+        anchor.next.prev = node
+        anchor.next = node
+
     def remove(self, node: Node[K]) -> None:
         """
         Remove a node from the linked list.
@@ -42,5 +57,32 @@ class DoublyLinkedList(Generic[K]):
         """
         node.next.prev = node.prev
         node.prev.next = node.next
-    
-    
+
+    def remove_last(self) -> Optional[Node[K]]:
+        """
+        Remove and return the node at the back of the linked list.
+        
+        Returns:
+            The removed node, or None if the list is empty.
+        """
+        if self.is_empty():
+            return None
+        node = self.tail.prev
+        self.remove(node)
+        return node
+
+    def is_empty(self) -> bool:
+        """
+        Check whether the linked list holds no nodes.
+        """
+        return self.head.next is self.tail
+
+class SegmentNode(Node[K]):
+    """
+    Node that also records which segment (list) of a segmented policy it is in.
+    """
+    __slots__ = ('segment',)
+
+    def __init__(self, key: K, segment: int):
+        super().__init__(key)
+        self.segment = segment
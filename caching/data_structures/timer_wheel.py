@@ -0,0 +1,173 @@
+import math
+from typing import Dict, Generic, List, Optional, TypeVar
+
+K = TypeVar('K')
+
+DUE = -1
+
+class TimerWheel(Generic[K]):
+    """
+    Hierarchical timing wheel that tracks expiry deadlines for keys.
+
+    Level 0 has `slots` buckets of `tick_seconds` each; every higher level has
+    the same number of buckets, each spanning a full rotation of the level below.
+    Scheduling and cancelling are O(1). Advancing the clock fires level-0
+    buckets and cascades higher-level buckets down as their time comes, so
+    expired keys are found without scanning live ones.
+    """
+    def __init__(self, tick_seconds: float = 0.1, slots: int = 64, levels: int = 4, start: float = 0.0):
+        """
+        Initialize an empty timing wheel.
+
+        Args:
+            tick_seconds: Resolution of the wheel; deadlines are rounded up to a tick.
+            slots: Number of buckets per level.
+            levels: Number of levels. Deadlines beyond slots ** levels ticks are
+                parked in the outermost level and re-cascaded until due.
+            start: Current time the wheel starts from.
+        """
+        if tick_seconds <= 0 or slots < 2 or levels < 1:
+            raise ValueError("Invalid timer wheel dimensions")
+        self._tick = tick_seconds
+        self._slots = slots
+        self._levels = levels
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._current_tick = int(start // tick_seconds)
+        self._wheels: List[List[Dict[K, int]]] = [[{} for _ in range(slots)] for _ in range(levels)]
+        # Location of each key as level * slots + slot, or DUE once it fired.
+        self._locations: Dict[K, int] = {}
+        self._due: Dict[K, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._locations
+
+    def schedule(self, key: K, deadline: float) -> None:
+        """
+        Schedule (or reschedule) a key to expire at the given time.
+
+        Args:
+            key: The key to track.
+            deadline: Absolute time at which the key expires.
+        """
+        self.cancel(key)
+        self._place(key, math.ceil(deadline / self._tick))
+
+    def cancel(self, key: K) -> None:
+        """
+        Stop tracking a key. Does nothing if the key is not scheduled.
+
+        Args:
+            key: The key to forget.
+        """
+        location = self._locations.pop(key, None)
+        if location is None:
+            return
+        if location == DUE:
+            del self._due[key]
+        else:
+            level, slot = divmod(location, self._slots)
+            del self._wheels[level][slot][key]
+
+    def expired(self, now: float, limit: Optional[int] = None) -> List[K]:
+        """
+        Advance the wheel to `now` and remove up to `limit` expired keys.
+
+        Keys that are due but exceed the limit stay queued for the next call.
+
+        Args:
+            now: The current time.
+            limit: Maximum number of keys to return, or None for all of them.
+
+        Returns:
+            The expired keys, oldest deadline first within each tick.
+        """
+        self._advance(int(now // self._tick))
+        if not self._due:
+            return []
+        if limit is None or limit >= len(self._due):
+            keys = list(self._due)
+            self._due.clear()
+        else:
+            keys = []
+            for key in self._due:
+                keys.append(key)
+                if len(keys) == limit:
+                    break
+            for key in keys:
+                del self._due[key]
+        for key in keys:
+            del self._locations[key]
+        return keys
+
+    def _advance(self, target_tick: int) -> None:
+        if target_tick <= self._current_tick:
+            return
+        if len(self._due) == len(self._locations):
+            # Nothing is parked in the wheels, so there is nothing to fire.
+            self._current_tick = target_tick
+            return
+        slots = self._slots
+        while True:
+            # Ticks with no non-empty bucket to fire or cascade are no-ops, so
+            # jump straight to the next one that has work instead of stepping.
+            tick = self._next_busy_tick()
+            if tick > target_tick:
+                self._current_tick = target_tick
+                return
+            self._current_tick = tick
+            for level in range(self._levels - 1, 0, -1):
+                span = self._spans[level]
+                if tick % span == 0:
+                    self._cascade(level, (tick // span) % slots)
+            bucket = self._wheels[0][tick % slots]
+            if bucket:
+                self._wheels[0][tick % slots] = {}
+                for key, deadline_tick in bucket.items():
+                    self._place(key, deadline_tick)
+
+    def _next_busy_tick(self) -> int:
+        """
+        The first tick after the current one at which a non-empty bucket fires
+        (level 0) or cascades (higher levels).
+        """
+        slots = self._slots
+        best = math.inf
+        for level, wheel in enumerate(self._wheels):
+            span = self._spans[level]
+            # Index of the next rotation boundary of this level.
+            boundary = self._current_tick // span + 1
+            for slot, bucket in enumerate(wheel):
+                if bucket:
+                    tick = (boundary + (slot - boundary) % slots) * span
+                    if tick < best:
+                        best = tick
+        return best
+
+    def _cascade(self, level: int, slot: int) -> None:
+        bucket = self._wheels[level][slot]
+        if not bucket:
+            return
+        self._wheels[level][slot] = {}
+        for key, deadline_tick in bucket.items():
+            self._place(key, deadline_tick)
+
+    def _place(self, key: K, deadline_tick: int) -> None:
+        delta = deadline_tick - self._current_tick
+        if delta <= 0:
+            self._due[key] = None
+            self._locations[key] = DUE
+            return
+        for level in range(self._levels):
+            if delta < self._spans[level + 1]:
+                slot = (deadline_tick // self._spans[level]) % self._slots
+                break
+        else:
+            # Too far out for the wheel: park it in the last bucket of the
+            # outermost level; it is re-placed each time that bucket cascades.
+            level = self._levels - 1
+            slot = (self._current_tick // self._spans[level] - 1) % self._slots
+        self._wheels[level][slot][key] = deadline_tick
+        self._locations[key] = level * self._slots + slot
@@ -1,4 +1,4 @@
-class NotFoundError(Exception):
+class NotFoundError(KeyError):
     """
     Exception raised when a requested key is not found.
     """
@@ -10,3 +10,8 @@ class CacheFullError(Exception):
     """
     pass
 
+class EntryTooLargeError(Exception):
+    """
+    Exception raised when a single entry exceeds the store's entire byte budget.
+    """
+    pass
@@ -0,0 +1,107 @@
+from typing import Dict
+from .eviction_policy import EvictionPolicy, K
+from data_structures.linked_list import DoublyLinkedList, SegmentNode
+
+T1 = 0
+T2 = 1
+B1 = 2
+B2 = 3
+
+class AdaptiveReplacementCachePolicy(EvictionPolicy[K]):
+    """
+    Adaptive Replacement Cache (ARC) eviction policy implementation.
+
+    Resident keys seen once live in T1 and keys seen at least twice live in
+    T2. Evicted keys are remembered (without values) in the ghost lists B1
+    and B2; a miss that hits a ghost list shifts the target size `p` of T1
+    towards recency or frequency. A one-off scan only cycles through T1, so
+    the frequently used keys in T2 survive it.
+
+    The cache calls `evict` before it knows the incoming key, so the
+    replacement decision uses the current `p` and ghost hits adapt `p` for
+    the next eviction.
+    """
+    def __init__(self, capacity: int):
+        """
+        Initialize the policy.
+
+        Args:
+            capacity: Number of entries the cache holds.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.p = 0.0
+        self.nodes: Dict[K, SegmentNode[K]] = {}
+        self.lists = [DoublyLinkedList[K]() for _ in range(4)]
+        self.sizes = [0, 0, 0, 0]
+
+    def evict(self) -> K:
+        """
+        Evict a resident key, remembering it in the matching ghost list.
+
+        Returns:
+            The key that was evicted.
+        """
+        t1, t2 = self.sizes[T1], self.sizes[T2]
+        if t1 == 0 and t2 == 0:
+            raise ValueError("No keys to evict.")
+        if t1 and (t1 > self.p or t2 == 0):
+            node = self.lists[T1].tail.prev
+            self._move(node, B1)
+        else:
+            node = self.lists[T2].tail.prev
+            self._move(node, B2)
+        return node.key
+
+    def record_access(self, key: K) -> None:
+        """
+        Record an access to a key, updating the policy state accordingly.
+        Args:
+            key: The key that was accessed.
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            self._trim_ghosts()
+            node = SegmentNode(key, T1)
+            self.nodes[key] = node
+            self.lists[T1].add_to_front(node)
+            self.sizes[T1] += 1
+            return
+
+        if node.segment == B1:
+            self.p = min(float(self.capacity), self.p + max(self.sizes[B2] / self.sizes[B1], 1.0))
+        elif node.segment == B2:
+            self.p = max(0.0, self.p - max(self.sizes[B1] / self.sizes[B2], 1.0))
+        self._move(node, T2)
+
+    def remove_key(self, key: K) -> None:
+        """
+        Remove a key manually from eviction tracking.
+
+        Args:
+            key: The key to remove.
+        """
+        node = self.nodes.get(key)
+        if node is None or node.segment in (B1, B2):
+            raise KeyError(f"Key '{key}' not found in eviction policy.")
+        self._drop(node)
+
+    def _trim_ghosts(self) -> None:
+        sizes = self.sizes
+        if sizes[T1] + sizes[B1] >= self.capacity and sizes[B1]:
+            self._drop(self.lists[B1].tail.prev)
+        elif sum(sizes) >= 2 * self.capacity and sizes[B2]:
+            self._drop(self.lists[B2].tail.prev)
+
+    def _move(self, node: SegmentNode[K], segment: int) -> None:
+        self.lists[node.segment].remove(node)
+        self.sizes[node.segment] -= 1
+        self.lists[segment].add_to_front(node)
+        self.sizes[segment] += 1
+        node.segment = segment
+
+    def _drop(self, node: SegmentNode[K]) -> None:
+        self.lists[node.segment].remove(node)
+        self.sizes[node.segment] -= 1
+        del self.nodes[node.key]
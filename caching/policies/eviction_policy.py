@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterable, List
 
 K = TypeVar('K')
 
@@ -33,4 +33,33 @@ class EvictionPolicy(Generic[K], ABC):
         """
         Optional: Remove a key manually from eviction tracking.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def evict_many(self, count: int) -> List[K]:
+        """
+        Evict up to `count` keys in one pass.
+
+        Returns:
+            The keys that were evicted; fewer than `count` if the policy ran out.
+        """
+        evicted: List[K] = []
+        try:
+            for _ in range(count):
+                evicted.append(self.evict())
+        except ValueError:
+            pass
+        return evicted
+
+    def record_accesses(self, keys: Iterable[K]) -> None:
+        """
+        Record an access to each key, in order.
+        """
+        for key in keys:
+            self.record_access(key)
+
+    def remove_keys(self, keys: Iterable[K]) -> None:
+        """
+        Remove several keys from eviction tracking.
+        """
+        for key in keys:
+            self.remove_key(key)
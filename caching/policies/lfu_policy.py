@@ -1,71 +1,115 @@
-import sys
-from typing import Dict, List
+from typing import Dict, Optional
 from .eviction_policy import EvictionPolicy, K
+from data_structures.linked_list import DoublyLinkedList, Node
+
+class FrequencyBucket(Node[int]):
+    """
+    Node in the list of frequency buckets; holds every key accessed `key` times.
+    """
+    __slots__ = ('items',)
+
+    def __init__(self, frequency: int):
+        super().__init__(frequency)
+        self.items: DoublyLinkedList[K] = DoublyLinkedList()
+
+class FrequencyNode(Node[K]):
+    """
+    Node for a single key, linked inside the bucket of its current frequency.
+    """
+    __slots__ = ('bucket',)
+
+    def __init__(self, key: K):
+        super().__init__(key)
+        self.bucket: Optional[FrequencyBucket] = None
 
 class LeastFrequentlyUsedPolicy(EvictionPolicy[K]):
     """
     Least Frequently Used (LFU) eviction policy implementation.
     This policy evicts the least frequently accessed key when the cache is full.
+
+    Buckets are kept in a linked list ordered by ascending frequency, and each
+    bucket keeps its keys in recency order, so access, eviction and removal
+    are all O(1). Ties at the lowest frequency are broken by evicting the
+    least recently used key.
     """
     def __init__(self):
-        self.freq: Dict[K, int] = {}
-        self.freq_list: Dict[int, List[K]] = {}
-        self.min_freq: int = sys.maxsize
+        self.nodes: Dict[K, FrequencyNode[K]] = {}
+        self.buckets = DoublyLinkedList[int]()
+        self._spare_bucket: Optional[FrequencyBucket] = None
+
+    @property
+    def min_freq(self) -> int:
+        """
+        The lowest access frequency currently tracked, or 0 when empty.
+        """
+        first = self.buckets.head.next
+        return 0 if first is self.buckets.tail else first.key
 
     def evict(self) -> K:
         """
         Evict the least frequently used key from the cache.
-        
+
         Returns:
             The key that was evicted.
         """
-        if self.min_freq == sys.maxsize:
+        bucket = self.buckets.head.next
+        if bucket is self.buckets.tail:
             raise ValueError("No items to evict")
-        
-        evict_key = self.freq_list[self.min_freq].pop(0)
-        if not self.freq_list[self.min_freq]:
-            del self.freq_list[self.min_freq]
-            self.min_freq += 1
-        del self.freq[evict_key]
-        return evict_key
-    
+
+        node = bucket.items.remove_last()
+        if bucket.items.is_empty():
+            self._release_bucket(bucket)
+        del self.nodes[node.key]
+        return node.key
+
     def record_access(self, key: K) -> None:
         """
         Record an access to a key, updating the policy state accordingly.
         Args:
             key: The key that was accessed.
         """
-        if key not in self.freq:
-            self.freq[key] = 1
-            self.freq_list.setdefault(1, []).append(key)
-            self.min_freq = min(self.min_freq, 1)
+        node = self.nodes.get(key)
+        if node is None:
+            node = FrequencyNode(key)
+            self.nodes[key] = node
+            anchor = self.buckets.head
+            new_freq = 1
         else:
-            current_freq = self.freq[key]
-            new_freq = current_freq + 1
-            self.freq[key] = new_freq
-            
-            self.freq_list[current_freq].remove(key)
-            if not self.freq_list[current_freq]:
-                del self.freq_list[current_freq]
-                if current_freq == self.min_freq:
-                    self.min_freq += 1
-            
-            self.freq_list.setdefault(new_freq, []).append(key)
+            anchor = node.bucket
+            new_freq = anchor.key + 1
+
+        target = anchor.next
+        if target is self.buckets.tail or target.key != new_freq:
+            target = self._spare_bucket or FrequencyBucket(new_freq)
+            self._spare_bucket = None
+            target.key = new_freq
+            self.buckets.insert_after(anchor, target)
+
+        if node.bucket is not None:
+            self._unlink(node)
+        target.items.add_to_front(node)
+        node.bucket = target
 
     def remove_key(self, key: K) -> None:
         """
         Remove a key manually from eviction tracking.
-        
+
         Args:
             key: The key to remove.
         """
-        if key in self.freq:
-            current_freq = self.freq[key]
-            self.freq_list[current_freq].remove(key)
-            if not self.freq_list[current_freq]:
-                del self.freq_list[current_freq]
-                if current_freq == self.min_freq:
-                    self.min_freq += 1
-            del self.freq[key]
-        else:
-            raise KeyError(f"Key '{key}' not found in eviction policy.")
\ No newline at end of file
+        node = self.nodes.pop(key, None)
+        if node is None:
+            raise KeyError(f"Key '{key}' not found in eviction policy.")
+        self._unlink(node)
+
+    def _unlink(self, node: FrequencyNode[K]) -> None:
+        bucket = node.bucket
+        bucket.items.remove(node)
+        if bucket.items.is_empty():
+            self._release_bucket(bucket)
+
+    def _release_bucket(self, bucket: FrequencyBucket) -> None:
+        # Keep one emptied bucket around: evict-then-insert churn would
+        # otherwise allocate a fresh bucket and its sentinels on every put.
+        self.buckets.remove(bucket)
+        self._spare_bucket = bucket
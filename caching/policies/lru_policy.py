@@ -19,7 +19,7 @@ class LeastRecentlyUsedPolicy(EvictionPolicy[K]):
         Returns:
             The key that was evicted.
         """
-        if not self.list.head.next or not self.list.tail.prev:
+        if self.list.is_empty():
             raise ValueError("No keys to evict.")
         
         lru_node = self.list.tail.prev
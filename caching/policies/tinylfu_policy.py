@@ -0,0 +1,138 @@
+from typing import Dict
+from .eviction_policy import EvictionPolicy, K
+from data_structures.linked_list import DoublyLinkedList, SegmentNode
+from data_structures.count_min_sketch import CountMinSketch
+from data_structures.bloom_filter import BloomFilter
+
+WINDOW = 0
+PROBATION = 1
+PROTECTED = 2
+
+class WindowTinyLFUPolicy(EvictionPolicy[K]):
+    """
+    Window TinyLFU (W-TinyLFU) eviction policy implementation.
+
+    New keys enter a small LRU window. When room is needed, the window's LRU
+    key (the candidate) competes with the main region's probation LRU key
+    (the victim) and whichever has the lower estimated frequency is evicted.
+    The main region is a segmented LRU: keys hit while in probation are
+    promoted to the protected segment. One-off scans therefore churn only
+    the window and never displace the frequently used keys in main.
+
+    Frequencies come from a count-min sketch fronted by a doorkeeper bloom
+    filter, so keys seen only once never reach the sketch. All counters are
+    halved every `sample_factor * capacity` accesses.
+    """
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8, sample_factor: int = 10):
+        """
+        Initialize the policy.
+
+        Args:
+            capacity: Number of entries the cache holds.
+            window_ratio: Fraction of the capacity given to the admission window.
+            protected_ratio: Fraction of the main region given to the protected segment.
+            sample_factor: Accesses (as a multiple of capacity) between counter halvings.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.window_max = max(1, int(capacity * window_ratio))
+        self.main_max = max(0, capacity - self.window_max)
+        self.protected_max = int(self.main_max * protected_ratio)
+        self.nodes: Dict[K, SegmentNode[K]] = {}
+        self.segments = [DoublyLinkedList[K]() for _ in range(3)]
+        self.sizes = [0, 0, 0]
+        self.sketch = CountMinSketch[K](width=capacity)
+        self.doorkeeper = BloomFilter[K](bits=capacity * 8)
+        self._sample_size = sample_factor * capacity
+        self._samples = 0
+
+    def frequency(self, key: K) -> int:
+        """
+        Estimate how often a key has been accessed recently.
+
+        Args:
+            key: The key to look up.
+        """
+        return self.sketch.estimate(key) + (1 if key in self.doorkeeper else 0)
+
+    def evict(self) -> K:
+        """
+        Evict a key to make room for an incoming one.
+
+        Returns:
+            The key that was evicted.
+        """
+        if not self.nodes:
+            raise ValueError("No keys to evict.")
+        main_size = self.sizes[PROBATION] + self.sizes[PROTECTED]
+        victim_segment = PROBATION if self.sizes[PROBATION] else PROTECTED
+        if main_size == 0:
+            return self._drop(WINDOW)
+        if self.sizes[WINDOW] < self.window_max:
+            return self._drop(victim_segment)
+
+        candidate = self.segments[WINDOW].tail.prev
+        victim = self.segments[victim_segment].tail.prev
+        if self.frequency(candidate.key) > self.frequency(victim.key):
+            self._move(candidate, PROBATION)
+            return self._drop(victim_segment)
+        return self._drop(WINDOW)
+
+    def record_access(self, key: K) -> None:
+        """
+        Record an access to a key, updating the policy state accordingly.
+        Args:
+            key: The key that was accessed.
+        """
+        self._increment(key)
+        node = self.nodes.get(key)
+        if node is None:
+            node = SegmentNode(key, WINDOW)
+            self.nodes[key] = node
+            self.segments[WINDOW].add_to_front(node)
+            self.sizes[WINDOW] += 1
+            if self.sizes[WINDOW] > self.window_max and self.sizes[PROBATION] + self.sizes[PROTECTED] < self.main_max:
+                self._move(self.segments[WINDOW].tail.prev, PROBATION)
+        elif node.segment == PROBATION:
+            self._move(node, PROTECTED)
+            if self.sizes[PROTECTED] > self.protected_max:
+                self._move(self.segments[PROTECTED].tail.prev, PROBATION)
+        else:
+            segment = self.segments[node.segment]
+            segment.remove(node)
+            segment.add_to_front(node)
+
+    def remove_key(self, key: K) -> None:
+        """
+        Remove a key manually from eviction tracking.
+
+        Args:
+            key: The key to remove.
+        """
+        node = self.nodes.pop(key, None)
+        if node is None:
+            raise KeyError(f"Key '{key}' not found in eviction policy.")
+        self.segments[node.segment].remove(node)
+        self.sizes[node.segment] -= 1
+
+    def _increment(self, key: K) -> None:
+        if self.doorkeeper.add(key):
+            self.sketch.increment(key)
+        self._samples += 1
+        if self._samples >= self._sample_size:
+            self._samples = 0
+            self.sketch.halve()
+            self.doorkeeper.clear()
+
+    def _move(self, node: SegmentNode[K], segment: int) -> None:
+        self.segments[node.segment].remove(node)
+        self.sizes[node.segment] -= 1
+        self.segments[segment].add_to_front(node)
+        self.sizes[segment] += 1
+        node.segment = segment
+
+    def _drop(self, segment: int) -> K:
+        node = self.segments[segment].remove_last()
+        self.sizes[segment] -= 1
+        del self.nodes[node.key]
+        return node.key
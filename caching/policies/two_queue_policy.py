@@ -0,0 +1,91 @@
+from typing import Dict
+from .eviction_policy import EvictionPolicy, K
+from data_structures.linked_list import DoublyLinkedList, SegmentNode
+
+A1_IN = 0
+A1_OUT = 1
+AM = 2
+
+class TwoQueuePolicy(EvictionPolicy[K]):
+    """
+    2Q eviction policy implementation.
+
+    New keys enter the FIFO queue A1in. Keys evicted from A1in are
+    remembered (without values) in the ghost FIFO A1out; a key requested
+    again while in A1out is promoted to the main LRU queue Am. Keys accessed
+    only once, such as those from a scan, therefore never reach Am.
+    """
+    def __init__(self, capacity: int, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        """
+        Initialize the policy.
+
+        Args:
+            capacity: Number of entries the cache holds.
+            in_ratio: Fraction of the capacity A1in may hold before it is evicted from first.
+            out_ratio: Number of ghost keys kept in A1out, as a fraction of the capacity.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.in_max = max(1, int(capacity * in_ratio))
+        self.out_max = max(1, int(capacity * out_ratio))
+        self.nodes: Dict[K, SegmentNode[K]] = {}
+        self.queues = [DoublyLinkedList[K]() for _ in range(3)]
+        self.sizes = [0, 0, 0]
+
+    def evict(self) -> K:
+        """
+        Evict a resident key from A1in when it is over its share, otherwise from Am.
+
+        Returns:
+            The key that was evicted.
+        """
+        if self.sizes[A1_IN] and (self.sizes[A1_IN] > self.in_max or self.sizes[AM] == 0):
+            node = self.queues[A1_IN].tail.prev
+            self._move(node, A1_OUT)
+            if self.sizes[A1_OUT] > self.out_max:
+                self._drop(self.queues[A1_OUT].tail.prev)
+            return node.key
+        if self.sizes[AM]:
+            node = self.queues[AM].tail.prev
+            self._drop(node)
+            return node.key
+        raise ValueError("No keys to evict.")
+
+    def record_access(self, key: K) -> None:
+        """
+        Record an access to a key, updating the policy state accordingly.
+        Args:
+            key: The key that was accessed.
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            node = SegmentNode(key, A1_IN)
+            self.nodes[key] = node
+            self.queues[A1_IN].add_to_front(node)
+            self.sizes[A1_IN] += 1
+        elif node.segment != A1_IN:
+            self._move(node, AM)
+
+    def remove_key(self, key: K) -> None:
+        """
+        Remove a key manually from eviction tracking.
+
+        Args:
+            key: The key to remove.
+        """
+        node = self.nodes.get(key)
+        if node is None or node.segment == A1_OUT:
+            raise KeyError(f"Key '{key}' not found in eviction policy.")
+        self._drop(node)
+
+    def _move(self, node: SegmentNode[K], segment: int) -> None:
+        self.queues[node.segment].remove(node)
+        self.sizes[node.segment] -= 1
+        self.queues[segment].add_to_front(node)
+        self.sizes[segment] += 1
+        node.segment = segment
+
+    def _drop(self, node: SegmentNode[K]) -> None:
+        self.queues[node.segment].remove(node)
+        self.sizes[node.segment] -= 1
+        del self.nodes[node.key]
@@ -0,0 +1,124 @@
+import asyncio
+import math
+import random
+import time
+from typing import Awaitable, Callable, Generic, Optional, Set, TypeVar
+from storage.store import MISSING
+from single_flight import SingleFlight, AsyncSingleFlight
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+class ReadThroughMixin(Generic[K, V]):
+    """
+    Read-through loading with request coalescing and probabilistic early refresh.
+
+    Concurrent misses for the same key share one loader call. A hit may also
+    trigger an early refresh (the "XFetch" scheme). The chance grows as the
+    entry nears its expiry, scaled by how long the loader took last time, so
+    a hot key is usually reloaded by a single caller before it expires.
+
+    Classes using the mixin provide `get_if_present`, `put`, `_peek`,
+    `_refresh_due` and `_record_load`, and call `_init_read_through` from `__init__`.
+    """
+    def _init_read_through(self, refresh_beta: float) -> None:
+        self._refresh_beta = refresh_beta
+        self._loads: SingleFlight[K, V] = SingleFlight()
+        self._async_loads: AsyncSingleFlight[K, V] = AsyncSingleFlight()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    def get_or_load(self, key: K, loader: Callable[[K], V], ttl_seconds: Optional[float] = None) -> V:
+        """
+        Return the cached value for a key, loading and caching it on a miss.
+
+        Args:
+            key: The key to retrieve.
+            loader: Called with the key to produce the value on a miss.
+            ttl_seconds: Optional time-to-live for the loaded entry.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        value = self.get_if_present(key, MISSING)
+        if value is MISSING:
+            return self._loads.do(key, lambda: self._load(key, loader, ttl_seconds, recheck=True))
+        if not self._loads.in_flight(key) and self._refresh_due(key, self._refresh_beta):
+            # This caller won the early-refresh draw and reloads synchronously;
+            # everyone else keeps getting the cached value meanwhile.
+            return self._loads.do(key, lambda: self._load(key, loader, ttl_seconds, recheck=False))
+        return value
+
+    async def aget_or_load(self, key: K, loader: Callable[[K], Awaitable[V]], ttl_seconds: Optional[float] = None) -> V:
+        """
+        asyncio flavour of get_or_load; early refreshes run in the background.
+
+        Args:
+            key: The key to retrieve.
+            loader: Coroutine function called with the key to produce the value on a miss.
+            ttl_seconds: Optional time-to-live for the loaded entry.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        value = self.get_if_present(key, MISSING)
+        if value is MISSING:
+            return await self._async_loads.do(key, lambda: self._aload(key, loader, ttl_seconds, recheck=True))
+        if not self._async_loads.in_flight(key) and self._refresh_due(key, self._refresh_beta):
+            task = asyncio.ensure_future(
+                self._async_loads.do(key, lambda: self._aload(key, loader, ttl_seconds, recheck=False))
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_done)
+        return value
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_tasks.discard(task)
+        if not task.cancelled():
+            # A failed background refresh keeps serving the cached value.
+            task.exception()
+
+    def _load(self, key: K, loader: Callable[[K], V], ttl_seconds: Optional[float], recheck: bool) -> V:
+        if recheck:
+            # Another caller may have finished loading between our miss and
+            # becoming the leader for this key.
+            value = self._peek(key)
+            if value is not MISSING:
+                return value
+        start = time.perf_counter()
+        try:
+            value = loader(key)
+        except Exception:
+            self._record_load(key, time.perf_counter() - start, succeeded=False)
+            raise
+        self.put(key, value, ttl_seconds)
+        self._record_load(key, time.perf_counter() - start, succeeded=True)
+        return value
+
+    async def _aload(self, key: K, loader: Callable[[K], Awaitable[V]], ttl_seconds: Optional[float], recheck: bool) -> V:
+        if recheck:
+            value = self._peek(key)
+            if value is not MISSING:
+                return value
+        start = time.perf_counter()
+        try:
+            value = await loader(key)
+        except Exception:
+            self._record_load(key, time.perf_counter() - start, succeeded=False)
+            raise
+        self.put(key, value, ttl_seconds)
+        self._record_load(key, time.perf_counter() - start, succeeded=True)
+        return value
+
+def refresh_due(expires_at: Optional[float], load_time: Optional[float], beta: float, now: float) -> bool:
+    """
+    XFetch test: should an entry be refreshed now, ahead of its expiry?
+
+    Args:
+        expires_at: Absolute expiry time of the entry, if it has one.
+        load_time: Seconds the last load of the entry took, if known.
+        beta: Values above 1 favour earlier refreshes, below 1 later ones.
+        now: The current time.
+    """
+    if expires_at is None or load_time is None:
+        return False
+    return now - load_time * beta * math.log(1.0 - random.random()) >= expires_at
@@ -0,0 +1,238 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from cache import Cache, K, V
+from read_through import ReadThroughMixin
+from stats import CacheStats
+from storage.store import Store
+from policies.eviction_policy import EvictionPolicy
+
+
+class ShardedCache(ReadThroughMixin[K, V]):
+    """
+    Thread-safe cache that partitions keys across independent shards.
+
+    Each shard owns its own store, eviction policy, TTL map and lock, so
+    threads working on keys in different shards never contend with each other.
+    """
+    def __init__(
+        self,
+        store_factory: Callable[[], Store[K, V]],
+        policy_factory: Callable[[], EvictionPolicy[K]],
+        num_shards: int = 16,
+        ttl_seconds: Optional[int] = None,
+        refresh_beta: float = 1.0,
+        stats: bool = False,
+    ):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            store_factory: Callable returning a fresh store for one shard. The
+                total capacity is the sum of the capacities of all shard stores.
+            policy_factory: Callable returning a fresh eviction policy for one shard.
+            num_shards: Number of independent shards (and locks).
+            ttl_seconds: Optional time-to-live for cache entries in seconds.
+            refresh_beta: Eagerness of probabilistic early refresh in get_or_load;
+                0 disables it.
+            stats: Collect hit/miss counts, load times and latency histograms per shard.
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        self._num_shards = num_shards
+        self._shards: List[Cache[K, V]] = [
+            Cache(store=store_factory(), eviction_policy=policy_factory(), ttl_seconds=ttl_seconds, stats=stats)
+            for _ in range(num_shards)
+        ]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(num_shards)]
+        self._expiry_thread: Optional[threading.Thread] = None
+        self._stop_expiry = threading.Event()
+        self._init_read_through(refresh_beta)
+
+    @property
+    def evicted_count(self) -> int:
+        """
+        Number of live entries evicted across all shards.
+        """
+        return sum(shard.evicted_count for shard in self._shards)
+
+    @property
+    def expired_count(self) -> int:
+        """
+        Number of entries removed across all shards because their TTL elapsed.
+        """
+        return sum(shard.expired_count for shard in self._shards)
+
+    def stats_snapshot(self) -> Dict[str, object]:
+        """
+        Statistics summed over all shards; see Cache.stats_snapshot.
+        """
+        parts = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                if shard._stats is not None:
+                    parts.append(shard._stats)
+        snapshot: Dict[str, object] = CacheStats.combine(parts).snapshot() if parts else {}
+        snapshot['evictions'] = self.evicted_count
+        snapshot['expirations'] = self.expired_count
+        return snapshot
+
+    def _shard_index(self, key: K) -> int:
+        return hash(key) % self._num_shards
+
+    def get(self, key: K) -> V:
+        """
+        Retrieve a value from the shard that owns the key.
+
+        Args:
+            key: The key to retrieve the value for.
+
+        Returns:
+            The value associated with the key.
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+
+    def get_if_present(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve a value from the shard that owns the key without raising on a miss.
+
+        Args:
+            key: The key to retrieve the value for.
+            default: Value returned when the key is missing or has expired.
+
+        Returns:
+            The value associated with the key, or `default`.
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].get_if_present(key, default)
+
+    def _peek(self, key: K):
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index]._peek(key)
+
+    def put(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a key-value pair in the shard that owns the key.
+
+        Args:
+            key: The key to store.
+            value: The value to associate with the key.
+            ttl_seconds: Optional time-to-live for this entry, overriding the
+                cache-wide TTL.
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            self._shards[index].put(key, value, ttl_seconds)
+
+    def _refresh_due(self, key: K, beta: float) -> bool:
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index]._refresh_due(key, beta)
+
+    def _record_load(self, key: K, seconds: float, succeeded: bool) -> None:
+        index = self._shard_index(key)
+        with self._locks[index]:
+            self._shards[index]._record_load(key, seconds, succeeded)
+
+    def get_many(self, keys: Iterable[K]) -> Tuple[Dict[K, V], Set[K]]:
+        """
+        Retrieve several keys, taking each shard's lock once.
+
+        Args:
+            keys: The keys to retrieve.
+
+        Returns:
+            A dict of the keys found with their values, and the set of keys that missed.
+        """
+        found: Dict[K, V] = {}
+        misses: Set[K] = set()
+        for index, shard_keys in self._group_by_shard(keys).items():
+            with self._locks[index]:
+                shard_found, shard_misses = self._shards[index].get_many(shard_keys)
+            found.update(shard_found)
+            misses |= shard_misses
+        return found, misses
+
+    def put_many(self, items: Union[Dict[K, V], Iterable[Tuple[K, V]]], ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store several key-value pairs, taking each shard's lock once.
+
+        Args:
+            items: A dict or iterable of (key, value) pairs.
+            ttl_seconds: Optional time-to-live for these entries, overriding the
+                cache-wide TTL.
+        """
+        groups: Dict[int, List[Tuple[K, V]]] = {}
+        for key, value in (items.items() if isinstance(items, dict) else items):
+            groups.setdefault(self._shard_index(key), []).append((key, value))
+        for index, shard_items in groups.items():
+            with self._locks[index]:
+                self._shards[index].put_many(shard_items, ttl_seconds)
+
+    def delete_many(self, keys: Iterable[K]) -> Set[K]:
+        """
+        Remove several keys, taking each shard's lock once.
+
+        Args:
+            keys: The keys to remove.
+
+        Returns:
+            The keys that were not in the cache.
+        """
+        misses: Set[K] = set()
+        for index, shard_keys in self._group_by_shard(keys).items():
+            with self._locks[index]:
+                misses |= self._shards[index].delete_many(shard_keys)
+        return misses
+
+    def _group_by_shard(self, keys: Iterable[K]) -> Dict[int, List[K]]:
+        groups: Dict[int, List[K]] = {}
+        for key in keys:
+            groups.setdefault(self._shard_index(key), []).append(key)
+        return groups
+
+    def expire(self, max_items_per_shard: Optional[int] = None) -> int:
+        """
+        Reclaim expired entries from every shard, one shard lock at a time.
+
+        Args:
+            max_items_per_shard: Maximum number of entries reclaimed per shard,
+                or None for all due entries.
+
+        Returns:
+            The number of entries reclaimed.
+        """
+        reclaimed = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                reclaimed += shard.expire(max_items_per_shard)
+        return reclaimed
+
+    def start_expiry(self, interval: float = 1.0, max_items_per_shard: Optional[int] = 1024) -> None:
+        """
+        Start a background thread that periodically reclaims expired entries.
+
+        Args:
+            interval: Seconds between sweeps.
+            max_items_per_shard: Bound on the work done under a shard lock per sweep.
+        """
+        def expiry_loop():
+            while not self._stop_expiry.wait(interval):
+                self.expire(max_items_per_shard)
+
+        self.stop_expiry()
+        self._stop_expiry.clear()
+        self._expiry_thread = threading.Thread(target=expiry_loop, daemon=True)
+        self._expiry_thread.start()
+
+    def stop_expiry(self) -> None:
+        """
+        Stop the background expiry thread, if one is running.
+        """
+        self._stop_expiry.set()
+        if self._expiry_thread:
+            self._expiry_thread.join()
+            self._expiry_thread = None
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+class _Call(Generic[V]):
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[V] = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight(Generic[K, V]):
+    """
+    Collapses concurrent calls for the same key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs block until it finishes and receive the same result or exception.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[K, _Call[V]] = {}
+
+    def in_flight(self, key: K) -> bool:
+        """
+        Check whether a call for the key is currently running.
+        """
+        return key in self._calls
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        """
+        Run `fn` for the key, or wait for the call already running for it.
+
+        Args:
+            key: The key identifying the call.
+            fn: Function producing the value.
+
+        Returns:
+            The value produced by whichever caller ran `fn`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+class AsyncSingleFlight(Generic[K, V]):
+    """
+    asyncio flavour of SingleFlight: concurrent awaits for the same key share one coroutine run.
+
+    The run is a task owned by the flight rather than by the first caller, so
+    cancelling any caller, the first one included, leaves the others waiting
+    on the shared result.
+    """
+    def __init__(self):
+        self._tasks: Dict[K, asyncio.Task] = {}
+
+    def in_flight(self, key: K) -> bool:
+        """
+        Check whether a call for the key is currently running.
+        """
+        return key in self._tasks
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """
+        Await `fn()` for the key, or the call already running for it.
+
+        Args:
+            key: The key identifying the call.
+            fn: Coroutine function producing the value.
+
+        Returns:
+            The value produced by the shared run of `fn`.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        # Shield so that a cancelled caller does not cancel the shared call.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled.
+            task.exception()
@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, List
+
+BUCKETS = 48
+
+class LatencyHistogram:
+    """
+    Histogram of operation latencies in power-of-two nanosecond buckets.
+
+    Bucket i counts samples of roughly 2^(i-1) to 2^i nanoseconds, so
+    recording a sample is a bit_length call and a list increment.
+    """
+    __slots__ = ('counts', 'total')
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKETS
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        index = int(seconds * 1e9).bit_length()
+        self.counts[index if index < BUCKETS else BUCKETS - 1] += 1
+        self.total += 1
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Upper bound, in microseconds, of the bucket holding the given fraction of samples.
+        """
+        if not self.total:
+            return 0.0
+        threshold = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return (1 << index) / 1e3
+        return (1 << (BUCKETS - 1)) / 1e3
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'count': self.total,
+            'p50_us': self.percentile(0.50),
+            'p90_us': self.percentile(0.90),
+            'p99_us': self.percentile(0.99),
+            'max_us': self.percentile(1.0),
+        }
+
+class CacheStats:
+    """
+    Hit/miss counters, loader timings and per-operation latency histograms for a cache.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_failures = 0
+        self.load_time = 0.0
+        self.latency: Dict[str, LatencyHistogram] = {
+            'get': LatencyHistogram(),
+            'put': LatencyHistogram(),
+            'load': LatencyHistogram(),
+        }
+
+    def record_load(self, seconds: float, succeeded: bool = True) -> None:
+        if succeeded:
+            self.loads += 1
+        else:
+            self.load_failures += 1
+        self.load_time += seconds
+        self.latency['load'].record(seconds)
+
+    @classmethod
+    def combine(cls, parts: Iterable['CacheStats']) -> 'CacheStats':
+        """
+        Sum several stats objects, e.g. one per shard, into a new one.
+        """
+        total = cls()
+        for part in parts:
+            total.hits += part.hits
+            total.misses += part.misses
+            total.loads += part.loads
+            total.load_failures += part.load_failures
+            total.load_time += part.load_time
+            for op, histogram in part.latency.items():
+                total.latency[op].merge(histogram)
+        return total
+
+    def snapshot(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'loads': self.loads,
+            'load_failures': self.load_failures,
+            'load_time_seconds': self.load_time,
+            'latency': {op: histogram.snapshot() for op, histogram in self.latency.items()},
+        }
@@ -1,26 +1,106 @@
-from typing import Dict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from .store import Store, K, V
-from exceptions.exception import NotFoundError, CacheFullError
+from .sizing import getsizeof_sizer
+from exceptions.exception import NotFoundError, CacheFullError, EntryTooLargeError
 
 class MemoryStore(Store[K, V]):
     """
     Concrete implementation of Store using an in-memory dictionary.
+
+    The store can be bounded by entry count (`capacity`), by total value size
+    (`max_bytes`), or both. Value sizes come from `sizer`, which may be one of
+    the helpers in storage.sizing or any callable returning a size in bytes.
     """
-    def __init__(self, capacity: int):
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizer: Callable[[V], int] = getsizeof_sizer,
+    ):
+        if capacity is None and max_bytes is None:
+            raise ValueError("MemoryStore needs a capacity, a max_bytes budget, or both.")
         self._store: Dict[K, V] = {}
         self._capacity = capacity
+        self._max_bytes = max_bytes
+        self._sizer = sizer
+        self._sizes: Dict[K, int] = {}
+        self._used_bytes = 0
+
+    @property
+    def used_bytes(self) -> int:
+        """
+        Total size of the stored values; always 0 when no byte budget is set.
+        """
+        return self._used_bytes
 
     def get(self, key: K) -> V:
         if key not in self._store:
             raise NotFoundError(f"Key {key!r} not found in store.")
         return self._store[key]
 
+    def get_or(self, key: K, default=None):
+        return self._store.get(key, default)
+
     def put(self, key: K, value: V) -> None:
-        if len(self._store) >= self._capacity:
+        if not self.try_put(key, value):
             raise CacheFullError("Store capacity exceeded.")
-        self._store[key] = value
+
+    def try_put(self, key: K, value: V) -> bool:
+        store = self._store
+        if key not in store and self._capacity is not None and len(store) >= self._capacity:
+            return False
+        if self._max_bytes is not None:
+            size = self._sizer(value)
+            if size > self._max_bytes:
+                raise EntryTooLargeError(f"Value of {size} bytes exceeds the store budget of {self._max_bytes} bytes.")
+            used = self._used_bytes - self._sizes.get(key, 0) + size
+            if used > self._max_bytes:
+                return False
+            self._sizes[key] = size
+            self._used_bytes = used
+        store[key] = value
+        return True
 
     def delete(self, key: K) -> None:
         if key not in self._store:
             raise NotFoundError(f"Key {key!r} not found in store.")
         del self._store[key]
+        if self._max_bytes is not None:
+            self._used_bytes -= self._sizes.pop(key)
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        store = self._store
+        return {key: store[key] for key in keys if key in store}
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> List[Tuple[K, V]]:
+        store = self._store
+        items = list(items)
+        if self._max_bytes is not None:
+            return self._put_many_sized(items)
+        for index, (key, value) in enumerate(items):
+            if key not in store and len(store) >= self._capacity:
+                return items[index:]
+            store[key] = value
+        return []
+
+    def _put_many_sized(self, items: List[Tuple[K, V]]) -> List[Tuple[K, V]]:
+        # Size the whole batch first, so an oversized value rejects it before
+        # anything is stored that the caller would not know to track.
+        sizes = [self._sizer(value) for _, value in items]
+        for size in sizes:
+            if size > self._max_bytes:
+                raise EntryTooLargeError(f"Value of {size} bytes exceeds the store budget of {self._max_bytes} bytes.")
+        store = self._store
+        for index, ((key, value), size) in enumerate(zip(items, sizes)):
+            if key not in store and self._capacity is not None and len(store) >= self._capacity:
+                return items[index:]
+            used = self._used_bytes - self._sizes.get(key, 0) + size
+            if used > self._max_bytes:
+                return items[index:]
+            self._sizes[key] = size
+            self._used_bytes = used
+            store[key] = value
+        return []
+
+    def keys(self) -> Iterator[K]:
+        return iter(list(self._store))
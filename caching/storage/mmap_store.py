@@ -0,0 +1,244 @@
+import marshal
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+from .store import Store
+from exceptions.exception import NotFoundError, CacheFullError
+
+FILE_HEADER = struct.Struct('<4sBQ')
+FILE_MAGIC = b'KVLG'
+FILE_VERSION = 1
+
+RECORD_HEADER = struct.Struct('<IBIII')
+RECORD_MAGIC = 0x5245434B
+PUT = 0
+DELETE = 1
+
+class MmapStore(Store[str, bytes]):
+    """
+    Persistent Store backed by an append-only log in a memory-mapped file.
+
+    Every put or delete appends a record (header, key, value) to the log and
+    updates an in-memory index of key -> (value offset, value length).
+    Reads return zero-copy memoryview slices of the mapping. Space held by
+    overwritten and deleted records is reclaimed by compaction, which
+    rewrites the live records into a fresh file.
+
+    `close()` (or `checkpoint()`) also writes the index to a snapshot file
+    next to the log. Reopening loads that snapshot and only scans records
+    appended after it, so a warm restart does not re-read the whole log.
+    """
+    def __init__(
+        self,
+        path: str,
+        capacity: Optional[int] = None,
+        initial_size: int = 1 << 20,
+        compact_ratio: float = 0.5,
+    ):
+        """
+        Open (or create) a log-backed store.
+
+        Args:
+            path: Path of the log file; the index snapshot is kept at `path + '.idx'`.
+            capacity: Optional maximum number of entries, as in MemoryStore.
+            initial_size: Size the file is pre-allocated to; it doubles when full.
+            compact_ratio: Compact automatically once this fraction of the log is dead records.
+        """
+        self._path = path
+        self._index_path = path + '.idx'
+        self._capacity = capacity
+        self._compact_ratio = compact_ratio
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._dead_bytes = 0
+
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < FILE_HEADER.size:
+            self._generation = int.from_bytes(os.urandom(8), 'little')
+            self._file.truncate(max(initial_size, FILE_HEADER.size + RECORD_HEADER.size))
+            self._file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, self._generation))
+            self._file.flush()
+        self._map(mmap.mmap(self._file.fileno(), 0))
+        magic, version, self._generation = FILE_HEADER.unpack_from(self._mm, 0)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError(f"{path!r} is not a MmapStore log.")
+        self._end = self._load_snapshot()
+        self._end = self._replay(self._end)
+
+    def get(self, key: str) -> memoryview:
+        location = self._index.get(key)
+        if location is None:
+            raise NotFoundError(f"Key {key!r} not found in store.")
+        offset, length = location
+        return self._view[offset:offset + length]
+
+    def get_or(self, key: str, default=None):
+        location = self._index.get(key)
+        if location is None:
+            return default
+        offset, length = location
+        return self._view[offset:offset + length]
+
+    def put(self, key: str, value: bytes) -> None:
+        previous = self._index.get(key)
+        if previous is None and self._capacity is not None and len(self._index) >= self._capacity:
+            raise CacheFullError("Store capacity exceeded.")
+        encoded = key.encode()
+        value_offset = self._append(PUT, encoded, value)
+        if previous is not None:
+            self._dead_bytes += RECORD_HEADER.size + len(encoded) + previous[1]
+            del self._index[key]
+        self._index[key] = (value_offset, len(value))
+        self._maybe_compact()
+
+    def delete(self, key: str) -> None:
+        previous = self._index.pop(key, None)
+        if previous is None:
+            raise NotFoundError(f"Key {key!r} not found in store.")
+        encoded = key.encode()
+        self._append(DELETE, encoded, b'')
+        self._dead_bytes += 2 * (RECORD_HEADER.size + len(encoded)) + previous[1]
+        self._maybe_compact()
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def flush(self) -> None:
+        """
+        Flush written records to disk.
+        """
+        self._mm.flush()
+
+    def checkpoint(self) -> None:
+        """
+        Flush the log and write an index snapshot for fast reopening.
+        """
+        self.flush()
+        tmp_path = self._index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps((self._generation, self._end, self._dead_bytes, self._index)))
+        os.replace(tmp_path, self._index_path)
+
+    def close(self) -> None:
+        """
+        Checkpoint and release the mapping and the file.
+        Values returned by `get` stay readable until they are released.
+        """
+        self.checkpoint()
+        self._release_mapping()
+        self._file.close()
+
+    def compact(self) -> None:
+        """
+        Rewrite the live records into a new log, dropping overwritten and deleted ones.
+        """
+        tmp_path = self._path + '.compact'
+        live = sum(RECORD_HEADER.size + len(key.encode()) + length for key, (_, length) in self._index.items())
+        generation = int.from_bytes(os.urandom(8), 'little')
+        index: Dict[str, Tuple[int, int]] = {}
+        with open(tmp_path, 'w+b') as f:
+            f.truncate(max(FILE_HEADER.size + live, self._file_size() // 2, FILE_HEADER.size + RECORD_HEADER.size))
+            with mmap.mmap(f.fileno(), 0) as mm:
+                mm[:FILE_HEADER.size] = FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, generation)
+                end = FILE_HEADER.size
+                for key, (offset, length) in self._index.items():
+                    encoded = key.encode()
+                    value = self._mm[offset:offset + length]
+                    end = self._write_record(mm, end, PUT, encoded, value)
+                    index[key] = (end - length, length)
+                mm.flush()
+        self._release_mapping()
+        self._file.close()
+        os.replace(tmp_path, self._path)
+        self._file = open(self._path, 'r+b')
+        self._map(mmap.mmap(self._file.fileno(), 0))
+        self._generation = generation
+        self._index = index
+        self._end = end
+        self._dead_bytes = 0
+
+    def _append(self, flags: int, key: bytes, value: bytes) -> int:
+        size = RECORD_HEADER.size + len(key) + len(value)
+        if self._end + size > len(self._mm):
+            self._grow(self._end + size)
+        self._end = self._write_record(self._mm, self._end, flags, key, value)
+        return self._end - len(value)
+
+    @staticmethod
+    def _write_record(mm: mmap.mmap, offset: int, flags: int, key: bytes, value: bytes) -> int:
+        start = offset + RECORD_HEADER.size
+        mm[start:start + len(key)] = key
+        mm[start + len(key):start + len(key) + len(value)] = value
+        crc = zlib.crc32(value, zlib.crc32(key))
+        # The header goes last so a torn write never looks like a valid record.
+        RECORD_HEADER.pack_into(mm, offset, RECORD_MAGIC, flags, len(key), len(value), crc)
+        return start + len(key) + len(value)
+
+    def _grow(self, needed: int) -> None:
+        size = len(self._mm)
+        while size < needed:
+            size *= 2
+        self._mm.flush()
+        self._release_mapping()
+        self._file.truncate(size)
+        self._map(mmap.mmap(self._file.fileno(), 0))
+
+    def _map(self, mm: mmap.mmap) -> None:
+        self._mm = mm
+        self._view = memoryview(mm)
+
+    def _release_mapping(self) -> None:
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # Callers still hold memoryviews into this mapping. Dropping our
+            # reference lets it be unmapped once the last view is released.
+            pass
+
+    def _file_size(self) -> int:
+        return os.fstat(self._file.fileno()).st_size
+
+    def _maybe_compact(self) -> None:
+        if self._dead_bytes > (1 << 20) and self._dead_bytes > self._compact_ratio * self._end:
+            self.compact()
+
+    def _load_snapshot(self) -> int:
+        try:
+            with open(self._index_path, 'rb') as f:
+                generation, end, dead_bytes, index = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return FILE_HEADER.size
+        if generation != self._generation or end > len(self._mm):
+            return FILE_HEADER.size
+        self._index = index
+        self._dead_bytes = dead_bytes
+        return end
+
+    def _replay(self, offset: int) -> int:
+        mm = self._mm
+        limit = len(mm)
+        while offset + RECORD_HEADER.size <= limit:
+            magic, flags, key_len, value_len, crc = RECORD_HEADER.unpack_from(mm, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + key_len + value_len
+            if magic != RECORD_MAGIC or end > limit:
+                break
+            key_bytes = mm[start:start + key_len]
+            if zlib.crc32(mm[start + key_len:end], zlib.crc32(key_bytes)) != crc:
+                break
+            key = key_bytes.decode()
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self._dead_bytes += RECORD_HEADER.size + key_len + previous[1]
+            if flags == PUT:
+                self._index[key] = (start + key_len, value_len)
+            else:
+                self._dead_bytes += RECORD_HEADER.size + key_len
+            offset = end
+        return offset
@@ -0,0 +1,15 @@
+import sys
+from typing import Any
+
+def getsizeof_sizer(value: Any) -> int:
+    """
+    Size a value by its shallow in-memory footprint (sys.getsizeof).
+    Does not follow references, so containers are under-counted.
+    """
+    return sys.getsizeof(value)
+
+def len_sizer(value: Any) -> int:
+    """
+    Size a value by its length, e.g. the number of bytes in a bytes object.
+    """
+    return len(value)
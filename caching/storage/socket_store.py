@@ -0,0 +1,233 @@
+import os
+import threading
+import uuid
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from storage.store import Store, K, V, MISSING
+from exceptions.exception import NotFoundError
+from cache import Cache
+
+class SocketStoreServer:
+    """
+    Host-wide store served over a local socket to SocketStore clients.
+
+    The entries live in a Cache owned by the server, so the shared tier has
+    its own capacity, eviction policy and TTL. Every put or delete made by one
+    client is published to the other clients' subscriptions, which lets them
+    drop the key from their in-process tier.
+
+    Requests are pickled, so the authkey is all that keeps other local users
+    from running code in the server; there is no shared default.
+    """
+    def __init__(self, cache: Cache, address: Optional[Any] = None, authkey: Optional[bytes] = None):
+        """
+        Args:
+            cache: The Cache holding the shared entries.
+            address: Listener address; None picks a fresh Unix socket path
+                (a named pipe on Windows).
+            authkey: Shared secret clients must present; None generates a
+                random one, readable from `authkey` to hand to clients.
+        """
+        self._cache = cache
+        self._lock = threading.Lock()
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+        self._subscribers: Dict[str, Connection] = {}
+        self._subscribers_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def start(self) -> None:
+        """
+        Accept clients on a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Accept clients until close() is called, one thread per connection.
+        """
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                # A client with the wrong key is turned away; keep serving.
+                continue
+            except OSError:
+                break
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def close(self) -> None:
+        self._closed = True
+        self._listener.close()
+        with self._subscribers_lock:
+            for conn in self._subscribers.values():
+                conn.close()
+            self._subscribers.clear()
+
+    def _serve(self, conn: Connection) -> None:
+        try:
+            kind, client_id = conn.recv()
+            if kind == 'subscribe':
+                with self._subscribers_lock:
+                    self._subscribers[client_id] = conn
+                return
+            while True:
+                op, args = conn.recv()
+                try:
+                    result = self._handle(client_id, op, args)
+                except Exception as e:
+                    conn.send(('error', e))
+                else:
+                    conn.send(('ok', result))
+        except (EOFError, OSError):
+            conn.close()
+
+    def _handle(self, client_id: str, op: str, args: tuple):
+        cache = self._cache
+        if op == 'get':
+            with self._lock:
+                value = cache.get_if_present(args[0], MISSING)
+            return (False, None) if value is MISSING else (True, value)
+        if op == 'get_many':
+            with self._lock:
+                found, _ = cache.get_many(args[0])
+            return found
+        if op == 'put':
+            key, value = args
+            with self._lock:
+                cache.put(key, value)
+            self._publish(client_id, [key])
+            return None
+        if op == 'put_if_absent':
+            key, value, ttl_seconds = args
+            # The caller's TTL can shorten the shared tier's own, never extend it.
+            if ttl_seconds is not None and cache.ttl_seconds is not None:
+                ttl_seconds = min(ttl_seconds, cache.ttl_seconds)
+            # Nobody else can hold a different value for a key the shared
+            # tier does not have, so there is nothing to invalidate.
+            with self._lock:
+                if cache.get_if_present(key, MISSING) is not MISSING:
+                    return False
+                cache.put(key, value, ttl_seconds)
+            return True
+        if op == 'put_many':
+            items = args[0]
+            with self._lock:
+                cache.put_many(items)
+            self._publish(client_id, [key for key, _ in items])
+            return None
+        if op == 'delete_many':
+            keys = set(args[0])
+            with self._lock:
+                misses = cache.delete_many(keys)
+            deleted = [key for key in keys if key not in misses]
+            self._publish(client_id, deleted)
+            return deleted
+        if op == 'keys':
+            with self._lock:
+                return cache.keys()
+        raise ValueError(f"Unknown operation '{op}'.")
+
+    def _publish(self, origin: str, keys: List) -> None:
+        if not keys:
+            return
+        with self._subscribers_lock:
+            for client_id, conn in list(self._subscribers.items()):
+                if client_id == origin:
+                    continue
+                try:
+                    conn.send(keys)
+                except OSError:
+                    # A client that went away stops getting invalidations.
+                    del self._subscribers[client_id]
+
+class SocketStore(Store[K, V]):
+    """
+    Client for a SocketStoreServer, usable as a Store from any local process.
+
+    Requests from threads of one process share a single connection; each
+    operation is one round trip. Keys and values must be picklable.
+    """
+    def __init__(self, address: Any, authkey: bytes):
+        """
+        Args:
+            address: The server's `address`.
+            authkey: The server's `authkey`.
+        """
+        self._address = address
+        self._authkey = authkey
+        self.client_id = uuid.uuid4().hex
+        self._conn = Client(address, authkey=authkey)
+        self._conn.send(('hello', self.client_id))
+        self._lock = threading.Lock()
+        self._subscription: Optional[Connection] = None
+
+    def _call(self, op: str, *args):
+        with self._lock:
+            self._conn.send((op, args))
+            status, result = self._conn.recv()
+        if status == 'error':
+            raise result
+        return result
+
+    def get(self, key: K) -> V:
+        found, value = self._call('get', key)
+        if not found:
+            raise NotFoundError(f"Key '{key}' not found in store.")
+        return value
+
+    def get_or(self, key: K, default=None):
+        found, value = self._call('get', key)
+        return value if found else default
+
+    def put(self, key: K, value: V) -> None:
+        self._call('put', key, value)
+
+    def put_if_absent(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> bool:
+        return self._call('put_if_absent', key, value, ttl_seconds)
+
+    def delete(self, key: K) -> None:
+        if not self._call('delete_many', [key]):
+            raise NotFoundError(f"Key '{key}' not found in store.")
+
+    def keys(self) -> Iterator[K]:
+        return iter(self._call('keys'))
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        return self._call('get_many', list(keys))
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> List[Tuple[K, V]]:
+        # The server evicts to make room, so every pair is stored.
+        self._call('put_many', list(items))
+        return []
+
+    def delete_many(self, keys: Iterable[K]) -> List[K]:
+        return self._call('delete_many', list(keys))
+
+    def subscribe(self, callback: Callable[[List[K]], None]) -> None:
+        """
+        Call `callback` with the keys other clients write or delete.
+
+        The callback runs on a background thread owned by this store.
+        """
+        conn = Client(self._address, authkey=self._authkey)
+        conn.send(('subscribe', self.client_id))
+        self._subscription = conn
+
+        def listen():
+            try:
+                while True:
+                    callback(conn.recv())
+            except (EOFError, OSError):
+                pass
+
+        threading.Thread(target=listen, daemon=True).start()
+
+    def close(self) -> None:
+        self._conn.close()
+        if self._subscription is not None:
+            self._subscription.close()
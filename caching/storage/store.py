@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterable, Iterator, Dict, List, Optional, Tuple
+from exceptions.exception import NotFoundError, CacheFullError
 
 K = TypeVar('K')
 V = TypeVar('V')
 
+# Default returned by lookups that must tell "missing" apart from a stored None.
+MISSING = object()
+
 class Store(Generic[K, V], ABC):
     """
     Abstract base class for a key-value store.
@@ -27,4 +31,94 @@ class Store(Generic[K, V], ABC):
         """
         Delete the value associated with the given key.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_or(self, key: K, default=None):
+        """
+        Retrieve the value associated with the given key, or `default` if it is not stored.
+        """
+        try:
+            return self.get(key)
+        except NotFoundError:
+            return default
+
+    def try_put(self, key: K, value: V) -> bool:
+        """
+        Store the value associated with the given key if it fits.
+
+        Returns:
+            False instead of raising CacheFullError when the store is full.
+        """
+        try:
+            self.put(key, value)
+            return True
+        except CacheFullError:
+            return False
+
+    def put_if_absent(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Store the value only if the key is not stored yet.
+
+        Args:
+            key: The key to store.
+            value: The value to associate with the key.
+            ttl_seconds: Time-to-live of the entry, for stores that expire
+                entries; stores that keep entries until deleted ignore it.
+
+        Returns:
+            True if the value was stored, False if the key was already present.
+        """
+        if self.get_or(key, MISSING) is not MISSING:
+            return False
+        self.put(key, value)
+        return True
+
+    def keys(self) -> Iterator[K]:
+        """
+        Iterate over the stored keys, oldest write first where the store tracks it.
+        Optional: stores that cannot enumerate their keys raise NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support key enumeration.")
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """
+        Retrieve the values of several keys; keys that are not stored are left out.
+        """
+        found: Dict[K, V] = {}
+        for key in keys:
+            try:
+                found[key] = self.get(key)
+            except NotFoundError:
+                pass
+        return found
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> List[Tuple[K, V]]:
+        """
+        Store several key-value pairs, stopping at the first one that does not fit.
+
+        Returns:
+            The pairs that were not stored, in their original order.
+        """
+        items = list(items)
+        for index, (key, value) in enumerate(items):
+            try:
+                self.put(key, value)
+            except CacheFullError:
+                return items[index:]
+        return []
+
+    def delete_many(self, keys: Iterable[K]) -> List[K]:
+        """
+        Delete several keys, skipping any that are not stored.
+
+        Returns:
+            The keys that were deleted.
+        """
+        deleted: List[K] = []
+        for key in keys:
+            try:
+                self.delete(key)
+                deleted.append(key)
+            except NotFoundError:
+                pass
+        return deleted
@@ -0,0 +1,37 @@
+from cache import Cache
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from storage.memory_store import MemoryStore
+
+
+def make_cache(capacity=10):
+    return Cache(store=MemoryStore(capacity=capacity), eviction_policy=LeastRecentlyUsedPolicy(), stats=True)
+
+
+def test_get_many_counts_repeated_missing_keys():
+    cache = make_cache()
+    found, misses = cache.get_many(['a', 'a'])
+    assert found == {}
+    assert misses == {'a'}
+    stats = cache.stats_snapshot()
+    assert (stats['hits'], stats['misses']) == (0, 2)
+
+
+def test_get_many_counts_repeated_present_keys():
+    cache = make_cache()
+    cache.put('a', 1)
+    found, misses = cache.get_many(['a', 'a', 'b'])
+    assert found == {'a': 1}
+    assert misses == {'b'}
+    stats = cache.stats_snapshot()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+
+
+def test_keys_skips_expired_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('cache.time.time', lambda: now[0])
+    cache = make_cache()
+    cache.put('short', 1, ttl_seconds=5)
+    cache.put('long', 2, ttl_seconds=60)
+    assert sorted(cache.keys()) == ['long', 'short']
+    now[0] += 10
+    assert cache.keys() == ['long']
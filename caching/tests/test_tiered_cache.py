@@ -0,0 +1,53 @@
+from policies.lru_policy import LeastRecentlyUsedPolicy
+from storage.memory_store import MemoryStore
+from tiered_cache import TieredCache
+
+
+class RecordingStore(MemoryStore):
+    def __init__(self):
+        super().__init__(capacity=100)
+        self.demotions = []
+
+    def put_if_absent(self, key, value, ttl_seconds=None):
+        stored = super().put_if_absent(key, value, ttl_seconds)
+        if stored:
+            self.demotions.append((key, value, ttl_seconds))
+        return stored
+
+
+def make_tiered(l2, l1_ttl_seconds=None):
+    return TieredCache(
+        l1_store=MemoryStore(capacity=1),
+        l1_policy=LeastRecentlyUsedPolicy(),
+        l2=l2,
+        l1_ttl_seconds=l1_ttl_seconds,
+    )
+
+
+def test_demotion_keeps_the_remaining_l1_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('cache.time.time', lambda: now[0])
+    monkeypatch.setattr('tiered_cache.time.time', lambda: now[0])
+    l2 = RecordingStore()
+    tiered = make_tiered(l2, l1_ttl_seconds=60)
+    tiered.put('a', 1)
+    l2.delete('a')
+    now[0] += 45
+    tiered.put('b', 2)
+    assert l2.demotions == [('a', 1, 15.0)]
+
+
+def test_queued_demotion_is_dropped_when_the_key_is_invalidated(monkeypatch):
+    l2 = RecordingStore()
+    tiered = make_tiered(l2)
+    tiered.put('a', 1)
+    # Another process deletes the key; the eviction of 'a' is queued but
+    # not flushed before the invalidation arrives.
+    l2.delete('a')
+    flush = tiered._flush_demotions
+    monkeypatch.setattr(tiered, '_flush_demotions', lambda: None)
+    tiered.put('b', 2)
+    tiered.invalidate_local(['a'])
+    flush()
+    assert l2.demotions == []
+    assert l2.get_or('a') is None
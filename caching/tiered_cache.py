@@ -0,0 +1,224 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from cache import Cache, K, V
+from read_through import ReadThroughMixin
+from storage.store import Store, MISSING
+from exceptions.exception import NotFoundError
+from policies.eviction_policy import EvictionPolicy
+
+
+class TieredCache(ReadThroughMixin[K, V]):
+    """
+    Two-tier cache: a small in-process L1 Cache in front of a shared L2 Store.
+
+    The L2 is normally a SocketStore, so every worker process on a host sees
+    the same entries and a key loaded by one worker is an L2 hit for the rest.
+
+    - Reads try L1, then L2. A key is promoted into L1 after `promote_after`
+      L2 hits, so one-off reads do not churn the small L1.
+    - Writes go to L2 first, then L1 (write-through).
+    - Entries evicted from L1 are demoted to L2 if the L2 no longer holds them,
+      with what is left of their L1 TTL. A demotion still queued when the
+      key is written, deleted or invalidated is dropped, so it cannot bring
+      back a value another process removed.
+    - When the L2 supports subscribe(), writes and deletes made by other
+      processes drop the key from this L1. The L1 TTL bounds how stale an
+      entry can get if an invalidation is lost.
+
+    Thread-safe: the L1 is guarded by one lock, which is never held across
+    an L2 round trip.
+    """
+    def __init__(
+        self,
+        l1_store: Store[K, V],
+        l1_policy: EvictionPolicy[K],
+        l2: Store[K, V],
+        l1_ttl_seconds: Optional[float] = None,
+        promote_after: int = 2,
+        demote_on_evict: bool = True,
+        max_tracked_keys: int = 10_000,
+        refresh_beta: float = 1.0,
+    ):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            l1_store: Store for the in-process tier; keep it small.
+            l1_policy: Eviction policy for the in-process tier.
+            l2: The shared tier.
+            l1_ttl_seconds: Optional time-to-live of L1 copies.
+            promote_after: Number of L2 hits after which a key is copied into L1.
+            demote_on_evict: Write entries evicted from L1 back to L2 when
+                the L2 has dropped them.
+            max_tracked_keys: Bound on the per-key L2 hit counters kept for promotion.
+            refresh_beta: Eagerness of probabilistic early refresh in get_or_load;
+                0 disables it.
+        """
+        if promote_after < 1:
+            raise ValueError("promote_after must be at least 1")
+        self._lock = threading.Lock()
+        self._l1: Cache[K, V] = Cache(
+            store=l1_store,
+            eviction_policy=l1_policy,
+            ttl_seconds=l1_ttl_seconds,
+            on_evict=self._queue_demotion if demote_on_evict else None,
+        )
+        self._l2 = l2
+        self._promote_after = promote_after
+        self._max_tracked_keys = max_tracked_keys
+        self._l2_hits: Dict[K, int] = {}
+        # Key -> (evicted value, its L1 expiry time or None), waiting to be demoted.
+        self._demotions: Dict[K, Tuple[V, Optional[float]]] = {}
+        # Bumped by every invalidation; a read that raced one is not promoted.
+        self._generation = 0
+        self._counts = {
+            'l1_hits': 0, 'l2_hits': 0, 'misses': 0,
+            'promotions': 0, 'demotions': 0, 'invalidations': 0,
+        }
+        subscribe = getattr(l2, 'subscribe', None)
+        if subscribe is not None:
+            subscribe(self.invalidate_local)
+        self._init_read_through(refresh_beta)
+
+    def get(self, key: K) -> V:
+        """
+        Retrieve a value from L1 or L2.
+
+        Raises:
+            NotFoundError: If neither tier holds the key.
+        """
+        value = self.get_if_present(key, MISSING)
+        if value is MISSING:
+            raise NotFoundError(f"Key '{key}' not found in cache.")
+        return value
+
+    def get_if_present(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Retrieve a value from L1 or L2 without raising on a miss.
+
+        Args:
+            key: The key to retrieve the value for.
+            default: Value returned when neither tier holds the key.
+
+        Returns:
+            The value associated with the key, or `default`.
+        """
+        value = self._lookup(key, count=True)
+        return default if value is MISSING else value
+
+    def _peek(self, key: K):
+        return self._lookup(key, count=False)
+
+    def _lookup(self, key: K, count: bool):
+        with self._lock:
+            value = self._l1.get_if_present(key, MISSING)
+            if value is not MISSING:
+                if count:
+                    self._counts['l1_hits'] += 1
+                return value
+            generation = self._generation
+
+        value = self._l2.get_or(key, MISSING)
+        with self._lock:
+            if value is MISSING:
+                if count:
+                    self._counts['misses'] += 1
+                return value
+            if count:
+                self._counts['l2_hits'] += 1
+            hits = self._l2_hits.pop(key, 0) + 1
+            if hits < self._promote_after:
+                if len(self._l2_hits) >= self._max_tracked_keys:
+                    self._l2_hits.clear()
+                self._l2_hits[key] = hits
+            elif generation == self._generation:
+                self._l1.put(key, value)
+                self._counts['promotions'] += 1
+        self._flush_demotions()
+        return value
+
+    def put(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Write a key-value pair through to L2 and into L1.
+
+        Args:
+            key: The key to store.
+            value: The value to associate with the key.
+            ttl_seconds: Optional time-to-live of the L1 copy; the L2 applies
+                its own TTL.
+        """
+        self._l2.put(key, value)
+        with self._lock:
+            self._l1.put(key, value, ttl_seconds)
+            self._l2_hits.pop(key, None)
+            self._demotions.pop(key, None)
+        self._flush_demotions()
+
+    def delete(self, key: K) -> None:
+        """
+        Remove a key from both tiers; other processes drop their L1 copies.
+        """
+        self._l2.delete_many([key])
+        with self._lock:
+            self._l1.delete_many([key])
+            self._l2_hits.pop(key, None)
+            self._demotions.pop(key, None)
+
+    def invalidate_local(self, keys: Iterable[K]) -> None:
+        """
+        Drop keys from L1 only, e.g. because another process changed them.
+        """
+        keys = list(keys)
+        with self._lock:
+            self._generation += 1
+            misses = self._l1.delete_many(keys)
+            for key in keys:
+                self._l2_hits.pop(key, None)
+                self._demotions.pop(key, None)
+            self._counts['invalidations'] += len(keys) - len(misses)
+
+    def stats_snapshot(self) -> Dict[str, object]:
+        """
+        Per-tier hit counts and promotion, demotion and invalidation counts.
+        """
+        with self._lock:
+            snapshot: Dict[str, object] = dict(self._counts)
+            snapshot['l1_evictions'] = self._l1.evicted_count
+        lookups = snapshot['l1_hits'] + snapshot['l2_hits'] + snapshot['misses']
+        snapshot['l1_hit_ratio'] = snapshot['l1_hits'] / lookups if lookups else 0.0
+        snapshot['hit_ratio'] = (snapshot['l1_hits'] + snapshot['l2_hits']) / lookups if lookups else 0.0
+        return snapshot
+
+    def _queue_demotion(self, key: K, value: V) -> None:
+        # Runs inside an L1 put, under the lock; the L2 write happens after it is released.
+        self._demotions[key] = (value, self._l1.expires_at(key))
+
+    def _flush_demotions(self) -> None:
+        if not self._demotions:
+            return
+        with self._lock:
+            keys = list(self._demotions)
+        for key in keys:
+            # Taken one at a time so an invalidation can still cancel the rest.
+            with self._lock:
+                demotion = self._demotions.pop(key, None)
+            if demotion is None:
+                continue
+            value, expires_at = demotion
+            ttl_seconds = None
+            if expires_at is not None:
+                ttl_seconds = expires_at - time.time()
+                if ttl_seconds <= 0:
+                    continue
+            if self._l2.put_if_absent(key, value, ttl_seconds):
+                with self._lock:
+                    self._counts['demotions'] += 1
+
+    def _refresh_due(self, key: K, beta: float) -> bool:
+        with self._lock:
+            return self._l1._refresh_due(key, beta)
+
+    def _record_load(self, key: K, seconds: float, succeeded: bool) -> None:
+        with self._lock:
+            self._l1._record_load(key, seconds, succeeded)
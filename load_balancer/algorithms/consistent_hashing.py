@@ -1,44 +1,118 @@
-import hashlib
 from bisect import bisect_right
-from typing import List, Dict
+from heapq import merge
+from typing import Dict, Iterable, List, Set, Tuple
+from .hashing import get_hash_function
 from .server import Server, ServerStatus
 
 
 class ConsistentHashing:
-    def __init__(self, servers: List[Server], num_replicas = 100):
+    """
+    Hash ring with `num_replicas` virtual nodes per active server.
+
+    Each server's virtual node hashes are computed once and cached, so adding
+    a server or bringing it back to active merges its nodes into the ring
+    without rehashing anyone else, and removing it only filters its own out.
+
+    Lookups read an immutable snapshot of the sorted hashes and their owners,
+    which every change replaces in one assignment, so they need no lock.
+    """
+    def __init__(self, servers: List[Server], num_replicas = 100, hash_function: str = "md5"):
         self.num_replicas = num_replicas
+        self._hash = get_hash_function(hash_function)
         self.ring: Dict[int, Server] = {}
         self.sorted_keys: List[int] = []
         self.servers: Dict[str, Server] = {server.id: server for server in servers}
-        self.__build_ring(servers)
-
-    def _hash(self, key: str) -> int:
-        return int(hashlib.md5(key.encode()).hexdigest(), 16)
+        self._vnode_hashes: Dict[str, List[int]] = {}
+        self._on_ring: Set[str] = set()
+        # Hash -> servers on the ring whose virtual node landed on a point
+        # another server already owns, in claim order.
+        self._contenders: Dict[int, List[Server]] = {}
+        self._snapshot: Tuple[List[int], List[Server]] = ([], [])
+        self.__build_ring(self.servers.values())
 
-    def __build_ring(self, servers: List[Server]):
+    def __build_ring(self, servers: Iterable[Server]):
         self.ring.clear()
-        self.sorted_keys.clear()
+        self._on_ring.clear()
+        self._contenders.clear()
         for server in servers:
             if server.status == ServerStatus.ACTIVE:
-                for i in range(self.num_replicas):
-                    virtual_node = f"{server.id}:{i}"
-                    hashed_key = self._hash(virtual_node)
-                    self.ring[hashed_key] = server
-                    self.sorted_keys.append(hashed_key)
-        self.sorted_keys.sort()
+                self.__claim(server)
+        self.sorted_keys = sorted(self.ring)
+        self.__publish()
+
+    def __hashes(self, server: Server) -> List[int]:
+        hashes = self._vnode_hashes.get(server.id)
+        if hashes is None:
+            hashes = sorted({self._hash(f"{server.id}:{i}") for i in range(self.num_replicas)})
+            self._vnode_hashes[server.id] = hashes
+        return hashes
+
+    def __claim(self, server: Server) -> List[int]:
+        # On a hash collision the virtual node stays with its current owner,
+        # and the server waits as a contender to take it over.
+        self._on_ring.add(server.id)
+        claimed = []
+        for hashed_key in self.__hashes(server):
+            if hashed_key not in self.ring:
+                self.ring[hashed_key] = server
+                claimed.append(hashed_key)
+            else:
+                self._contenders.setdefault(hashed_key, []).append(server)
+        return claimed
+
+    def __insert(self, server: Server):
+        if server.id in self._on_ring:
+            return
+        claimed = self.__claim(server)
+        self.sorted_keys = list(merge(self.sorted_keys, claimed))
+        self.__publish()
+
+    def __remove(self, server: Server):
+        if server.id not in self._on_ring:
+            return
+        self._on_ring.discard(server.id)
+        removed = set()
+        for hashed_key in self._vnode_hashes[server.id]:
+            contenders = self._contenders.get(hashed_key)
+            if self.ring[hashed_key].id != server.id:
+                contenders[:] = [s for s in contenders if s.id != server.id]
+            elif contenders:
+                # Hand the point to the next server that hashes there.
+                self.ring[hashed_key] = contenders.pop(0)
+            else:
+                del self.ring[hashed_key]
+                removed.add(hashed_key)
+            if contenders == []:
+                del self._contenders[hashed_key]
+        self.sorted_keys = [h for h in self.sorted_keys if h not in removed]
+        self.__publish()
+
+    def __publish(self):
+        self._snapshot = (self.sorted_keys, [self.ring[h] for h in self.sorted_keys])
 
     def select_server(self, key: str) -> Server:
+        sorted_keys, owners = self._snapshot
+        if not sorted_keys:
+            raise ValueError("No active servers available")
         hash_val = self._hash(key)
-        index = bisect_right(self.sorted_keys, hash_val) % len(self.sorted_keys)
-        return self.ring[self.sorted_keys[index]]
+        return owners[bisect_right(sorted_keys, hash_val) % len(sorted_keys)]
 
     def add_server(self, server: Server):
         self.servers[server.id] = server
-        self.__build_ring(self.servers.values())
-    
+        if server.status == ServerStatus.ACTIVE:
+            self.__insert(server)
+
     def remove_server(self, server: Server):
         if server.id in self.servers:
             del self.servers[server.id]
-            self.__build_ring(self.servers.values())
+            self.__remove(server)
+            self._vnode_hashes.pop(server.id, None)
 
-    
\ No newline at end of file
+    def update_server(self, server: Server):
+        """
+        Brings the ring in line with the server's current status.
+        """
+        if server.status == ServerStatus.ACTIVE:
+            self.__insert(server)
+        else:
+            self.__remove(server)
@@ -0,0 +1,44 @@
+import hashlib
+import zlib
+from typing import Callable, Dict
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+HashFunction = Callable[[str], int]
+
+
+def _md5(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest(), "big")
+
+
+def _blake2b(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def _crc32(key: str) -> int:
+    return zlib.crc32(key.encode())
+
+
+HASH_FUNCTIONS: Dict[str, HashFunction] = {
+    "md5": _md5,
+    "blake2b": _blake2b,
+    "crc32": _crc32,
+}
+if xxhash is not None:
+    HASH_FUNCTIONS["xxhash"] = xxhash.xxh64_intdigest
+
+
+def get_hash_function(name: str) -> HashFunction:
+    """
+    Returns the hash function registered under `name`.
+    md5 matches the original ring layout; blake2b, crc32 and xxhash
+    (if the xxhash package is installed) are faster.
+    """
+    if name not in HASH_FUNCTIONS:
+        if name == "xxhash":
+            raise ValueError("The xxhash hash function requires the xxhash package")
+        raise ValueError(f"Unsupported hash function: {name}")
+    return HASH_FUNCTIONS[name]
@@ -0,0 +1,104 @@
+from itertools import count
+from typing import Dict, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IndexedMinHeap(Generic[T]):
+    """
+    Binary min-heap of items keyed by id. An id -> position index lets an
+    item's priority be changed, or the item removed, in O(log n).
+    Items with equal priority come out least recently pushed or updated first.
+    """
+
+    def __init__(self):
+        # (priority, sequence, id); the unique sequence keeps ids out of comparisons.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._index: Dict[str, int] = {}
+        self._items: Dict[str, T] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._index
+
+    def push(self, item_id: str, item: T, priority: float):
+        """
+        Adds an item, or changes its priority if the id is already present.
+        """
+        if item_id in self._index:
+            self._items[item_id] = item
+            self.update(item_id, priority)
+            return
+        self._items[item_id] = item
+        self._heap.append((priority, next(self._sequence), item_id))
+        self._index[item_id] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def update(self, item_id: str, priority: float):
+        position = self._index[item_id]
+        old_priority = self._heap[position][0]
+        self._heap[position] = (priority, next(self._sequence), item_id)
+        if priority < old_priority:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def remove(self, item_id: str):
+        position = self._index.pop(item_id)
+        del self._items[item_id]
+        last = self._heap.pop()
+        if position < len(self._heap):
+            self._heap[position] = last
+            self._index[last[2]] = position
+            self._sift_up(position)
+            self._sift_down(self._index[last[2]])
+
+    def peek(self) -> T:
+        """
+        Returns the item with the lowest priority; raises IndexError when empty.
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty heap")
+        return self._items[self._heap[0][2]]
+
+    def peek_priority(self) -> float:
+        """
+        Returns the lowest priority; raises IndexError when empty.
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty heap")
+        return self._heap[0][0]
+
+    def _sift_up(self, position: int):
+        heap, index = self._heap, self._index
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[position] = heap[parent]
+            index[heap[position][2]] = position
+            position = parent
+        heap[position] = entry
+        index[entry[2]] = position
+
+    def _sift_down(self, position: int):
+        heap, index = self._heap, self._index
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[position] = heap[child]
+            index[heap[position][2]] = position
+            position = child
+        heap[position] = entry
+        index[entry[2]] = position
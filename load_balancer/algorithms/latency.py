@@ -0,0 +1,44 @@
+import math
+
+
+class DecayingAverage:
+    """
+    Exponentially weighted moving average of latency samples whose memory
+    fades with time rather than with sample count: a sample `decay_time`
+    seconds old keeps about a third (1/e) of its weight, however many samples
+    came since.
+
+    With `peak=True` a sample above the average replaces it outright (peak
+    EWMA), so a server that slows down is penalised at once and only earns
+    its way back gradually. Read it through `value_at` to let the penalty fade
+    with time even while the server gets no new samples.
+    """
+
+    __slots__ = ("value", "decay_time", "peak", "_last_update")
+
+    def __init__(self, decay_time: float, initial: float = 0.0, peak: bool = False):
+        self.value = initial
+        self.decay_time = decay_time
+        self.peak = peak
+        self._last_update = None
+
+    def observe(self, sample: float, now: float) -> float:
+        """
+        Folds in a sample taken at `now` and returns the new average.
+        """
+        if self._last_update is None or (self.peak and sample > self.value):
+            self.value = sample
+        else:
+            weight = math.exp(-max(0.0, now - self._last_update) / self.decay_time)
+            self.value = self.value * weight + sample * (1 - weight)
+        self._last_update = now
+        return self.value
+
+    def value_at(self, now: float) -> float:
+        """
+        The average decayed toward zero for the time since the last sample,
+        as if the server had been idle, without changing it.
+        """
+        if self._last_update is None:
+            return self.value
+        return self.value * math.exp(-max(0.0, now - self._last_update) / self.decay_time)
@@ -1,27 +1,63 @@
+import threading
 from typing import List
+from .indexed_heap import IndexedMinHeap
 from .server import Server, ServerStatus
-import random
 
 class LeastActiveConnection:
     """
     Load Balancing Algorithm: Least Active Connection
     This algorithm selects the server with the least number of active connections.
+    Active servers are kept in a min-heap on their connection count, so picking
+    a server and releasing its connection are O(log n).
     """
 
     def __init__(self, servers: List[Server]):
-        self.servers = servers
+        self.servers = list(servers)
+        self._heap: IndexedMinHeap[Server] = IndexedMinHeap()
+        # Every pick updates the heap, so picks and updates share one lock.
+        self._lock = threading.Lock()
+        for server in servers:
+            self.update_server(server)
 
     def select_server(self) -> Server:
         """
-        Selects the server with the least number of active connections.
+        Selects the server with the least number of active connections and
+        counts a new connection on it; pair every call with release().
+        Ties go to the server picked least recently.
         """
-        active_servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
-        if not active_servers:
-            raise ValueError("No active servers available")
-        
-        min_connections = min(s.active_connections for s in active_servers)
-        least_loaded = [s for s in active_servers if s.active_connections == min_connections]
+        with self._lock:
+            try:
+                selected_server = self._heap.peek()
+            except IndexError:
+                raise ValueError("No active servers available")
+            selected_server.active_connections += 1
+            self._heap.update(selected_server.id, selected_server.active_connections)
+            return selected_server
 
-        selected_server = random.choice(least_loaded)
-        selected_server.active_connections += 1 
-        return selected_server
\ No newline at end of file
+    def release(self, server: Server):
+        """
+        Ends a connection opened by select_server.
+        """
+        with self._lock:
+            if server.active_connections > 0:
+                server.active_connections -= 1
+            if server.id in self._heap:
+                self._heap.update(server.id, server.active_connections)
+
+    def add_server(self, server: Server):
+        self.update_server(server)
+
+    def remove_server(self, server: Server):
+        with self._lock:
+            if server.id in self._heap:
+                self._heap.remove(server.id)
+
+    def update_server(self, server: Server):
+        """
+        Adds the server to the selection heap if it is active, else takes it out.
+        """
+        with self._lock:
+            if server.status == ServerStatus.ACTIVE:
+                self._heap.push(server.id, server, server.active_connections)
+            elif server.id in self._heap:
+                self._heap.remove(server.id)
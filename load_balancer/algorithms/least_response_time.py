@@ -1,23 +1,101 @@
-import random
-from typing import List
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from .indexed_heap import IndexedMinHeap
+from .latency import DecayingAverage
 from .server import Server, ServerStatus
 
 class LeastResponseTime:
     """
     Load balancing algorithm that selects the server with the least response time.
+    Active servers are kept in a min-heap on their response time, which
+    record_latency updates in O(log n). The response time is a time-decayed
+    average of the latency samples, so one outlier does not decide every pick.
+
+    A server only gets a new sample when it is picked, so one that fell behind
+    after a slow response would never be measured again. Whichever server
+    has gone unpicked for `probe_interval` seconds is therefore sent the next
+    request as a probe; a second heap on last-pick time finds it in O(1).
     """
 
-    def __init__(self, servers: List[Server]):
-        self.servers = servers
+    def __init__(
+        self,
+        servers: List[Server],
+        decay_time: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        probe_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            servers: The servers to balance over.
+            decay_time: Seconds after which a latency sample keeps 1/e of its weight.
+            clock: Time source for sample ages and probes.
+            probe_interval: Seconds an active server may go unpicked before it
+                gets a probe request; defaults to `decay_time`.
+        """
+        self.servers = list(servers)
+        self.decay_time = decay_time
+        self.probe_interval = decay_time if probe_interval is None else probe_interval
+        self._clock = clock
+        self._latency: Dict[str, DecayingAverage] = {}
+        self._heap: IndexedMinHeap[Server] = IndexedMinHeap()
+        # Active servers keyed on when they were last picked.
+        self._last_picked: IndexedMinHeap[Server] = IndexedMinHeap()
+        # Every pick updates the heap, so picks and updates share one lock.
+        self._lock = threading.Lock()
+        for server in servers:
+            self.update_server(server)
 
     def select_server(self) -> Server:
         """
-        Selects the server with the least response time.
+        Selects the server with the least response time, or probes the one
+        left unpicked for `probe_interval`.
+        Ties go to the server picked least recently.
+        """
+        with self._lock:
+            try:
+                selected_server = self._heap.peek()
+            except IndexError:
+                raise ValueError("No active servers available")
+            now = self._clock()
+            if now - self._last_picked.peek_priority() >= self.probe_interval:
+                selected_server = self._last_picked.peek()
+            # Re-pushing at the same priority rotates among tied servers.
+            self._heap.update(selected_server.id, selected_server.response_time)
+            self._last_picked.update(selected_server.id, now)
+            return selected_server
+
+    def record_latency(self, server: Server, seconds: float):
+        """
+        Folds a latency sample into the server's response time.
         """
-        active_servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
-        if not active_servers:
-            raise ValueError("No active servers available")
+        with self._lock:
+            average = self._latency.get(server.id)
+            if average is None:
+                average = self._latency[server.id] = DecayingAverage(self.decay_time)
+            server.response_time = average.observe(seconds, self._clock())
+            if server.id in self._heap:
+                self._heap.update(server.id, server.response_time)
+
+    def add_server(self, server: Server):
+        self.update_server(server)
+
+    def remove_server(self, server: Server):
+        with self._lock:
+            self._latency.pop(server.id, None)
+            if server.id in self._heap:
+                self._heap.remove(server.id)
+                self._last_picked.remove(server.id)
 
-        min_response_time = min(s.response_time for s in active_servers)
-        least_loaded = [s for s in active_servers if s.response_time == min_response_time]
-        return random.choice(least_loaded)
\ No newline at end of file
+    def update_server(self, server: Server):
+        """
+        Adds the server to the selection heap if it is active, else takes it out.
+        """
+        with self._lock:
+            if server.status == ServerStatus.ACTIVE:
+                self._heap.push(server.id, server, server.response_time)
+                if server.id not in self._last_picked:
+                    self._last_picked.push(server.id, server, self._clock())
+            elif server.id in self._heap:
+                self._heap.remove(server.id)
+                self._last_picked.remove(server.id)
@@ -0,0 +1,103 @@
+from typing import Dict, FrozenSet, List, Tuple
+from .hashing import get_hash_function
+from .server import Server, ServerStatus
+
+# Prime table sizes keep every skip coprime with the size, so each server's
+# preference list visits every slot.
+DEFAULT_TABLE_SIZE = 65537
+
+
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    divisor = 3
+    while divisor * divisor <= n:
+        if n % divisor == 0:
+            return False
+        divisor += 2
+    return True
+
+
+class MaglevHashing:
+    """
+    Load Balancing Algorithm: Maglev hashing
+    Selects servers through a precomputed lookup table of `table_size` slots,
+    so each pick is one hash and one index. Every active server fills slots in
+    the order of its own permutation of the table, which spreads keys evenly
+    and moves few of them when a server joins or leaves.
+    """
+
+    def __init__(self, servers: List[Server], table_size: int = DEFAULT_TABLE_SIZE, hash_function: str = "md5"):
+        # With a composite size a skip sharing one of its factors only visits
+        # some of the slots, and filling the table would never finish.
+        if not _is_prime(table_size):
+            raise ValueError(f"table_size must be a prime number, got {table_size}")
+        self.table_size = table_size
+        self._hash = get_hash_function(hash_function)
+        self.servers: Dict[str, Server] = {server.id: server for server in servers}
+        self._permutations: Dict[str, Tuple[int, int]] = {}
+        self.table: List[Server] = []
+        self._active_ids: FrozenSet[str] = frozenset()
+        self._build_table()
+
+    def _permutation(self, server: Server) -> Tuple[int, int]:
+        permutation = self._permutations.get(server.id)
+        if permutation is None:
+            offset = self._hash(f"{server.id}:offset") % self.table_size
+            skip = self._hash(f"{server.id}:skip") % (self.table_size - 1) + 1
+            permutation = self._permutations[server.id] = (offset, skip)
+        return permutation
+
+    def _build_table(self):
+        active = sorted(
+            (s for s in self.servers.values() if s.status == ServerStatus.ACTIVE),
+            key=lambda s: s.id,
+        )
+        self._active_ids = frozenset(s.id for s in active)
+        if not active:
+            self.table = []
+            return
+
+        size = self.table_size
+        permutations = [self._permutation(s) for s in active]
+        positions = [offset for offset, _ in permutations]
+        skips = [skip for _, skip in permutations]
+        table: List[Server] = [None] * size
+        filled = 0
+        while True:
+            for i, server in enumerate(active):
+                slot = positions[i]
+                while table[slot] is not None:
+                    slot = (slot + skips[i]) % size
+                table[slot] = server
+                positions[i] = (slot + skips[i]) % size
+                filled += 1
+                if filled == size:
+                    self.table = table
+                    return
+
+    def select_server(self, key: str) -> Server:
+        # The table is replaced, never modified, so one read sees a consistent table.
+        table = self.table
+        if not table:
+            raise ValueError("No active servers available")
+        return table[self._hash(key) % len(table)]
+
+    def add_server(self, server: Server):
+        self.servers[server.id] = server
+        if server.status == ServerStatus.ACTIVE:
+            self._build_table()
+
+    def remove_server(self, server: Server):
+        if self.servers.pop(server.id, None) is not None:
+            self._permutations.pop(server.id, None)
+            self._build_table()
+
+    def update_server(self, server: Server):
+        """
+        Rebuilds the table if the server's status change altered the active set.
+        """
+        if (server.status == ServerStatus.ACTIVE) != (server.id in self._active_ids):
+            self._build_table()
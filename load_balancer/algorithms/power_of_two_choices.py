@@ -0,0 +1,105 @@
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from .latency import DecayingAverage
+from .server import Server, ServerStatus
+
+
+class PowerOfTwoChoices:
+    """
+    Load Balancing Algorithm: Power of Two Random Choices
+    Samples two distinct active servers at random and picks the one with
+    fewer active connections. Nearly as even as least connections, but O(1)
+    per pick, and balancers working from stale counts do not all pile onto
+    the same "best" server. Picks read an immutable snapshot of the active
+    servers and take no lock; connection counts may be off by a request
+    under contention, which only blurs the comparison.
+    """
+
+    def __init__(self, servers: List[Server], rng: Optional[random.Random] = None):
+        self.servers = list(servers)
+        self._rng = rng or random.Random()
+        self._active: Tuple[Server, ...] = ()
+        self._refresh()
+
+    def _refresh(self):
+        self._active = tuple(s for s in self.servers if s.status == ServerStatus.ACTIVE)
+
+    def _cost(self, server: Server) -> float:
+        return server.active_connections
+
+    def select_server(self) -> Server:
+        """
+        Selects the cheaper of two random active servers and counts a new
+        connection on it; pair every call with release().
+        """
+        active = self._active
+        if not active:
+            raise ValueError("No active servers available")
+        if len(active) == 1:
+            selected_server = active[0]
+        else:
+            first, second = self._rng.sample(active, 2)
+            selected_server = first if self._cost(first) <= self._cost(second) else second
+        selected_server.active_connections += 1
+        return selected_server
+
+    def release(self, server: Server):
+        """
+        Ends a connection opened by select_server.
+        """
+        if server.active_connections > 0:
+            server.active_connections -= 1
+
+    def add_server(self, server: Server):
+        self.servers = self.servers + [server]
+        self._refresh()
+
+    def remove_server(self, server: Server):
+        self.servers = [s for s in self.servers if s.id != server.id]
+        self._refresh()
+
+    def update_server(self, server: Server):
+        self._refresh()
+
+
+class PeakEwma(PowerOfTwoChoices):
+    """
+    Load Balancing Algorithm: Peak-EWMA weighted Power of Two Choices
+    Like PowerOfTwoChoices, but compares servers by expected wait: the peak
+    EWMA of their latency times (active connections + 1). Latency comes in
+    through record_latency; a server with no samples yet counts as fast so
+    that it gets probed. The latency term keeps decaying between samples, so
+    a server penalised for one slow response gets picked again, and
+    re-measured, once the penalty has faded below its peers' latency.
+    """
+
+    def __init__(
+        self,
+        servers: List[Server],
+        decay_time: float = 10.0,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.decay_time = decay_time
+        self._clock = clock
+        self._latency: Dict[str, DecayingAverage] = {}
+        super().__init__(servers, rng)
+
+    def _cost(self, server: Server) -> float:
+        average = self._latency.get(server.id)
+        latency = server.response_time if average is None else average.value_at(self._clock())
+        return latency * (server.active_connections + 1)
+
+    def record_latency(self, server: Server, seconds: float):
+        """
+        Folds a request's latency into the server's peak EWMA.
+        """
+        average = self._latency.get(server.id)
+        if average is None:
+            average = self._latency[server.id] = DecayingAverage(self.decay_time, peak=True)
+        server.response_time = average.observe(seconds, self._clock())
+
+    def remove_server(self, server: Server):
+        super().remove_server(server)
+        self._latency.pop(server.id, None)
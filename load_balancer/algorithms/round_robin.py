@@ -1,12 +1,37 @@
-from typing import List
+from itertools import count
+from typing import List, Tuple
 from .server import Server,ServerStatus
 
 class RoundRobin:
+    """
+    Load Balancing Algorithm: Round Robin
+    Cycles through the active servers. The active servers are an immutable
+    snapshot rebuilt only when membership or status changes, so picks never
+    filter by status and need no lock.
+    """
     def __init__(self, servers: List[Server]):
-        self.servers = servers
-        self.current_index = -1
-    
+        self.servers = list(servers)
+        # next() on itertools.count is atomic, so concurrent picks still take turns.
+        self._counter = count()
+        self._active: Tuple[Server, ...] = ()
+        self._refresh()
+
+    def _refresh(self):
+        self._active = tuple(s for s in self.servers if s.status == ServerStatus.ACTIVE)
+
     def select_server(self) -> Server:
-        self.servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
-        self.current_index = (self.current_index + 1) % len(self.servers)
-        return self.servers[self.current_index]
\ No newline at end of file
+        active = self._active
+        if not active:
+            raise ValueError("No active servers available")
+        return active[next(self._counter) % len(active)]
+
+    def add_server(self, server: Server):
+        self.servers = self.servers + [server]
+        self._refresh()
+
+    def remove_server(self, server: Server):
+        self.servers = [s for s in self.servers if s.id != server.id]
+        self._refresh()
+
+    def update_server(self, server: Server):
+        self._refresh()
@@ -1,24 +1,66 @@
-from typing import List, Optional
+from functools import reduce
+from itertools import count
+from math import gcd
+from typing import List, Tuple
 from .server import Server, ServerStatus
 
 class WeightedRoundRobin:
+    """
+    Load Balancing Algorithm: Weighted Round Robin
+    Serves active servers in proportion to their weights from a precomputed
+    interleaved schedule. A server of weight w gets w evenly spaced turns per
+    cycle, at positions (k + phase) / w, so heavy servers are not picked in
+    long runs; each server's phase is distinct so that equal positions
+    interleave instead of bunching up. The schedule is rebuilt only when
+    membership, status or weights change; a pick is one lock-free index into it.
+    """
     def __init__(self, servers: List[Server]):
-        self.servers = servers
-        self.current_index = -1
-        self.current_weight = 0
+        self.servers = list(servers)
+        # next() on itertools.count is atomic, so concurrent picks still take turns.
+        self._counter = count()
+        self._schedule: Tuple[Server, ...] = ()
+        self._weights: Tuple[Tuple[str, int], ...] = ()
+        self._refresh()
 
-    def select_server(self) -> Optional[Server]:
-        active_servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
-        if not active_servers:
-            return None
+    def _refresh(self):
+        active = [s for s in self.servers if s.status == ServerStatus.ACTIVE and s.weight > 0]
+        self._weights = tuple((s.id, s.weight) for s in active)
+        if not active:
+            self._schedule = ()
+            return
 
-        weights = [s.weight for s in active_servers]
+        divisor = reduce(gcd, (s.weight for s in active))
+        positions: List[float] = []
+        owners: List[Server] = []
+        for index, server in enumerate(active):
+            weight = server.weight // divisor
+            phase = (index + 1) / (len(active) + 1)
+            step = 1.0 / weight
+            positions.extend([(k + phase) * step for k in range(weight)])
+            owners.extend([server] * weight)
+        order = sorted(range(len(positions)), key=positions.__getitem__)
+        self._schedule = tuple(owners[i] for i in order)
 
-        while True:
-            self.current_index = (self.current_index + 1) % len(active_servers)
-            if self.current_index == 0:
-                self.current_weight -= 1
-                if self.current_weight <= 0:
-                    self.current_weight = max(weights)
-            if weights[self.current_index] >= self.current_weight:
-                return active_servers[self.current_index]
+    def select_server(self) -> Server:
+        schedule = self._schedule
+        if not schedule:
+            raise ValueError("No active servers available")
+        return schedule[next(self._counter) % len(schedule)]
+
+    def add_server(self, server: Server):
+        self.servers = self.servers + [server]
+        self._refresh()
+
+    def remove_server(self, server: Server):
+        self.servers = [s for s in self.servers if s.id != server.id]
+        self._refresh()
+
+    def update_server(self, server: Server):
+        """
+        Rebuilds the schedule if the server's status or weight changed.
+        """
+        active = tuple(
+            (s.id, s.weight) for s in self.servers if s.status == ServerStatus.ACTIVE and s.weight > 0
+        )
+        if active != self._weights:
+            self._refresh()
@@ -0,0 +1,88 @@
+"""
+Selection throughput with many request threads while health checks flip
+server status, for each strategy.
+
+Selector threads call get_server (and release, where the strategy counts
+connections) as fast as they can; a flipper thread marks a random server
+inactive or active every --flip-interval seconds, as a health checker would.
+Any exception raised by a pick is counted as an error; there should be none.
+
+Run from the load_balancer directory:
+    python -m benchmarks.contention --threads 8 --servers 100
+"""
+import argparse
+import random
+import threading
+import time
+from algorithms.server import Server, ServerStatus
+from load_balancer import KEYED_STRATEGIES, LoadBalancer, StrategyType
+
+STRATEGIES = [
+    StrategyType.ROUND_ROBIN,
+    StrategyType.WEIGHTED_ROUND_ROBIN,
+    StrategyType.LEAST_CONNECTIONS,
+    StrategyType.LEAST_RESPONSE_TIME,
+    StrategyType.POWER_OF_TWO_CHOICES,
+    StrategyType.PEAK_EWMA,
+    StrategyType.CONSISTENT_HASH,
+    StrategyType.MAGLEV,
+]
+
+
+def run(strategy: str, args) -> tuple:
+    servers = [Server(id=str(i), name=f"server-{i}", weight=1 + i % 5) for i in range(args.servers)]
+    lb = LoadBalancer(servers, strategy)
+    keyed = strategy in KEYED_STRATEGIES
+    stop = threading.Event()
+    picks = [0] * args.threads
+    errors = [0] * args.threads
+    flips = [0]
+
+    def select(index: int):
+        keys = [f"user-{i}" for i in range(1024)]
+        count = 0
+        while not stop.is_set():
+            try:
+                server = lb.get_server(keys[count & 1023]) if keyed else lb.get_server()
+                lb.release(server)
+            except Exception:
+                errors[index] += 1
+            count += 1
+        picks[index] = count
+
+    def flip():
+        rng = random.Random(7)
+        # Keep at least half the servers active so picks can always succeed.
+        while not stop.wait(args.flip_interval):
+            server = rng.choice(servers[: args.servers // 2])
+            status = ServerStatus.INACTIVE if server.status == ServerStatus.ACTIVE else ServerStatus.ACTIVE
+            lb.set_server_status(server.id, status)
+            flips[0] += 1
+
+    threads = [threading.Thread(target=select, args=(i,)) for i in range(args.threads)]
+    threads.append(threading.Thread(target=flip))
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(picks) / args.duration, sum(errors), flips[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--servers", type=int, default=100)
+    parser.add_argument("--flip-interval", type=float, default=0.01)
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'strategy':>21} {'picks/s':>10} {'errors':>7} {'flips':>6}")
+    for strategy in STRATEGIES:
+        rate, errors, flips = run(strategy, args)
+        print(f"{strategy:>21} {rate:>10,.0f} {errors:>7} {flips:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Rebuild time, status-flip time, lookup time and key movement of the hash strategies.
+
+A "flip" marks one server inactive and back active through update_server,
+which is what a health-check change costs; "rebuild" constructs the strategy
+from scratch, which is what every change used to cost. "moved" is the share
+of keys that change server when one server leaves; 1/N is the minimum.
+
+Run from the load_balancer directory:
+    python -m benchmarks.hash_ring --servers 50 500 --hashes md5 blake2b crc32
+"""
+import argparse
+import time
+from algorithms.consistent_hashing import ConsistentHashing
+from algorithms.hashing import HASH_FUNCTIONS
+from algorithms.maglev import MaglevHashing
+from algorithms.server import Server, ServerStatus
+
+STRATEGIES = {
+    "ring": lambda servers, hash_function: ConsistentHashing(servers, hash_function=hash_function),
+    "maglev": lambda servers, hash_function: MaglevHashing(servers, hash_function=hash_function),
+}
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def flip(strategy, server: Server) -> None:
+    server.status = ServerStatus.INACTIVE
+    strategy.update_server(server)
+    server.status = ServerStatus.ACTIVE
+    strategy.update_server(server)
+
+
+def moved_share(strategy, server: Server, keys: list) -> float:
+    before = [strategy.select_server(key).id for key in keys]
+    server.status = ServerStatus.INACTIVE
+    strategy.update_server(server)
+    after = [strategy.select_server(key).id for key in keys]
+    server.status = ServerStatus.ACTIVE
+    strategy.update_server(server)
+    return sum(b != a for b, a in zip(before, after)) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--hashes", nargs="+", default=list(HASH_FUNCTIONS))
+    parser.add_argument("--keys", type=int, default=50_000)
+    args = parser.parse_args()
+
+    keys = [f"user-{i}" for i in range(args.keys)]
+    print(f"{'strategy':>8} {'hash':>8} {'servers':>8} {'rebuild ms':>11} {'flip ms':>8} {'lookup ns':>10} {'moved':>7} {'1/N':>6}")
+    for count in args.servers:
+        servers = [Server(id=f"s{i}", name=f"server-{i}", weight=1) for i in range(count)]
+        for name, build in STRATEGIES.items():
+            for hash_function in args.hashes:
+                strategy = build(servers, hash_function)
+                rebuild = timed(lambda: build(servers, hash_function))
+                flip_s = timed(lambda: flip(strategy, servers[count // 2]))
+                lookup = timed(lambda: [strategy.select_server(key) for key in keys]) / len(keys)
+                moved = moved_share(strategy, servers[count // 3], keys)
+                print(f"{name:>8} {hash_function:>8} {count:>8} {rebuild * 1e3:>11.1f} {flip_s * 1e3:>8.2f} "
+                      f"{lookup * 1e9:>10.0f} {moved:>7.2%} {1 / count:>6.2%}")
+
+
+if __name__ == "__main__":
+    main()
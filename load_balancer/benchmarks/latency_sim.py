@@ -0,0 +1,107 @@
+"""
+Discrete-event simulation of request latency under each balancing strategy
+with backends of unequal speed.
+
+Requests arrive as a Poisson stream at --load times the backends' combined
+capacity. Each backend serves --workers requests at a time in arrival order,
+with exponential service times; --slow-share of the backends are
+--slow-factor times slower. Requests are spread over --balancers independent
+balancer instances, each seeing only its own connections and latency
+samples, the way separate balancer threads or hosts would. Strategies run
+on the simulation clock, so results are deterministic for a seed.
+
+Run from the load_balancer directory:
+    python -m benchmarks.latency_sim --servers 20 --load 0.8 --balancers 4
+"""
+import argparse
+import heapq
+import random
+from algorithms.least_active_connection import LeastActiveConnection
+from algorithms.least_response_time import LeastResponseTime
+from algorithms.power_of_two_choices import PeakEwma, PowerOfTwoChoices
+from algorithms.round_robin import RoundRobin
+from algorithms.server import Server
+
+STRATEGIES = {
+    "round_robin": lambda servers, rng, clock: RoundRobin(servers),
+    "least_connections": lambda servers, rng, clock: LeastActiveConnection(servers),
+    "least_response_time": lambda servers, rng, clock: LeastResponseTime(servers, decay_time=1.0, clock=clock),
+    "power_of_two_choices": lambda servers, rng, clock: PowerOfTwoChoices(servers, rng),
+    "peak_ewma": lambda servers, rng, clock: PeakEwma(servers, decay_time=1.0, rng=rng, clock=clock),
+}
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def simulate(build, args, speeds: list, seed: int) -> list:
+    rng = random.Random(seed)
+    clock = SimClock()
+    balancers = []
+    for _ in range(args.balancers):
+        # Each balancer tracks its own view of every backend.
+        servers = [Server(id=str(i), name=f"server-{i}", weight=1) for i in range(len(speeds))]
+        balancers.append(build(servers, random.Random(rng.random()), clock))
+    workers = [[0.0] * args.workers for _ in speeds]
+    arrival_rate = args.load * sum(speed * args.workers for speed in speeds) / args.service_time
+    completions = []
+    latencies = []
+
+    t = 0.0
+    for request in range(args.requests):
+        t += rng.expovariate(arrival_rate)
+        while completions and completions[0][0] <= t:
+            finish, _, balancer, server, latency = heapq.heappop(completions)
+            clock.now = finish
+            if hasattr(balancer, "release"):
+                balancer.release(server)
+            if hasattr(balancer, "record_latency"):
+                balancer.record_latency(server, latency)
+        clock.now = t
+
+        balancer = balancers[request % len(balancers)]
+        server = balancer.select_server()
+        backend = int(server.id)
+        free_at = heapq.heappop(workers[backend])
+        finish = max(t, free_at) + rng.expovariate(speeds[backend] / args.service_time)
+        heapq.heappush(workers[backend], finish)
+        heapq.heappush(completions, (finish, request, balancer, server, finish - t))
+        latencies.append(finish - t)
+    # The first tenth of the requests is warm-up and left out.
+    return sorted(latencies[len(latencies) // 10:])
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4, help="concurrent requests per backend")
+    parser.add_argument("--slow-share", type=float, default=0.2)
+    parser.add_argument("--slow-factor", type=float, default=5.0)
+    parser.add_argument("--service-time", type=float, default=0.01, help="mean seconds per request on a fast backend")
+    parser.add_argument("--load", type=float, default=0.7)
+    parser.add_argument("--balancers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    slow = int(args.servers * args.slow_share)
+    speeds = [1 / args.slow_factor] * slow + [1.0] * (args.servers - slow)
+    print(f"{'strategy':>21} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8} {'p99.9 ms':>9}")
+    for name, build in STRATEGIES.items():
+        latencies = simulate(build, args, speeds, args.seed)
+        mean = sum(latencies) / len(latencies)
+        print(f"{name:>21} {mean * 1e3:>8.1f} {percentile(latencies, 0.5) * 1e3:>8.1f} "
+              f"{percentile(latencies, 0.99) * 1e3:>8.1f} {percentile(latencies, 0.999) * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
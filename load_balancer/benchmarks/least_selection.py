@@ -0,0 +1,90 @@
+"""
+Per-request cost of least-connections and least-response-time selection,
+heap-indexed against the full scan they replaced, at growing backend counts.
+
+Each least-connections request picks a server and releases a random earlier
+connection, keeping about two connections per server open. Each
+least-response-time request picks a server and records a latency sample.
+
+Run from the load_balancer directory:
+    python -m benchmarks.least_selection --servers 10 100 1000 5000
+"""
+import argparse
+import random
+import time
+from algorithms.least_active_connection import LeastActiveConnection
+from algorithms.least_response_time import LeastResponseTime
+from algorithms.server import Server, ServerStatus
+
+
+class ScanLeastConnections:
+    def __init__(self, servers):
+        self.servers = servers
+
+    def select_server(self):
+        active_servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
+        min_connections = min(s.active_connections for s in active_servers)
+        selected = random.choice([s for s in active_servers if s.active_connections == min_connections])
+        selected.active_connections += 1
+        return selected
+
+    def release(self, server):
+        server.active_connections -= 1
+
+
+class ScanLeastResponseTime:
+    def __init__(self, servers):
+        self.servers = servers
+
+    def select_server(self):
+        active_servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
+        min_response_time = min(s.response_time for s in active_servers)
+        return random.choice([s for s in active_servers if s.response_time == min_response_time])
+
+    def record_latency(self, server, seconds):
+        server.response_time = seconds
+
+
+def connections(strategy_class, count: int, requests: int) -> float:
+    rng = random.Random(3)
+    strategy = strategy_class([Server(id=f"s{i}", name=f"server-{i}", weight=1) for i in range(count)])
+    open_connections = [strategy.select_server() for _ in range(2 * count)]
+    start = time.perf_counter()
+    for _ in range(requests):
+        server = strategy.select_server()
+        position = rng.randrange(len(open_connections))
+        strategy.release(open_connections[position])
+        open_connections[position] = server
+    return (time.perf_counter() - start) / requests
+
+
+def response_times(strategy_class, count: int, requests: int) -> float:
+    rng = random.Random(3)
+    strategy = strategy_class([Server(id=f"s{i}", name=f"server-{i}", weight=1) for i in range(count)])
+    samples = [rng.expovariate(20) for _ in range(4096)]
+    start = time.perf_counter()
+    for i in range(requests):
+        server = strategy.select_server()
+        strategy.record_latency(server, samples[i & 4095])
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'strategy':>20} {'servers':>8} {'scan ns/req':>12} {'heap ns/req':>12} {'speedup':>8}")
+    for count in args.servers:
+        for name, run, scan, heap in (
+            ("least connections", connections, ScanLeastConnections, LeastActiveConnection),
+            ("least response time", response_times, ScanLeastResponseTime, LeastResponseTime),
+        ):
+            scan_s = run(scan, count, args.requests)
+            heap_s = run(heap, count, args.requests)
+            print(f"{name:>20} {count:>8} {scan_s * 1e9:>12.0f} {heap_s * 1e9:>12.0f} {scan_s / heap_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
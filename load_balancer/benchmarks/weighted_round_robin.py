@@ -0,0 +1,87 @@
+"""
+Pick cost, rebuild cost and spread of the precomputed weighted round robin
+schedule, against the spinning selector it replaced.
+
+Weights are drawn uniformly from --min-weight to --max-weight. "share err"
+is the largest relative gap between a server's picks over one full cycle and
+its weight share; "max gap" is the longest run between two picks of the
+same server, relative to the even spacing its weight implies (1.0 is ideal).
+
+Run from the load_balancer directory:
+    python -m benchmarks.weighted_round_robin --servers 10 100 1000
+"""
+import argparse
+import random
+import time
+from algorithms.server import Server, ServerStatus
+from algorithms.weighted_round_robin import WeightedRoundRobin
+
+
+class SpinningWeightedRoundRobin:
+    def __init__(self, servers):
+        self.servers = servers
+        self.current_index = -1
+        self.current_weight = 0
+
+    def select_server(self):
+        active_servers = [s for s in self.servers if s.status == ServerStatus.ACTIVE]
+        weights = [s.weight for s in active_servers]
+        while True:
+            self.current_index = (self.current_index + 1) % len(active_servers)
+            if self.current_index == 0:
+                self.current_weight -= 1
+                if self.current_weight <= 0:
+                    self.current_weight = max(weights)
+            if weights[self.current_index] >= self.current_weight:
+                return active_servers[self.current_index]
+
+
+def pick_ns(strategy, picks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(picks):
+        strategy.select_server()
+    return (time.perf_counter() - start) / picks * 1e9
+
+
+def spread(strategy, servers: list) -> tuple:
+    total = sum(s.weight for s in servers)
+    last_seen = {}
+    counts = {s.id: 0 for s in servers}
+    worst_gap = 0.0
+    for position in range(total):
+        server = strategy.select_server()
+        counts[server.id] += 1
+        if server.id in last_seen:
+            worst_gap = max(worst_gap, (position - last_seen[server.id]) * server.weight / total)
+        last_seen[server.id] = position
+    share_error = max(abs(counts[s.id] - s.weight) / s.weight for s in servers)
+    return share_error, worst_gap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--min-weight", type=int, default=1)
+    parser.add_argument("--max-weight", type=int, default=1000)
+    parser.add_argument("--picks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    print(f"{'servers':>8} {'rebuild ms':>11} {'spin ns':>10} {'schedule ns':>12} {'share err':>10} {'max gap':>8}")
+    for count in args.servers:
+        servers = [
+            Server(id=str(i), name=f"server-{i}", weight=rng.randint(args.min_weight, args.max_weight))
+            for i in range(count)
+        ]
+        start = time.perf_counter()
+        strategy = WeightedRoundRobin(servers)
+        rebuild = time.perf_counter() - start
+        # The spinning selector can loop for a long time per pick; sample fewer picks.
+        spin = pick_ns(SpinningWeightedRoundRobin(servers), max(1, args.picks // 10))
+        scheduled = pick_ns(strategy, args.picks)
+        share_error, worst_gap = spread(WeightedRoundRobin(servers), servers)
+        print(f"{count:>8} {rebuild * 1e3:>11.1f} {spin:>10.0f} {scheduled:>12.0f} {share_error:>10.2%} {worst_gap:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
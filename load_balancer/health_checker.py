@@ -0,0 +1,184 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Set
+from algorithms.server import Server, ServerStatus
+
+
+class HealthChecker:
+    """
+    Probes every server concurrently and flips its status with hysteresis.
+
+    Each round submits one probe per server to a thread pool, so a slow
+    backend delays no one else. A probe gets `timeout` seconds from the moment
+    it starts running, not from when it was queued, so a pool smaller than the
+    server list never fails probes that simply had to wait for a worker. A
+    probe still running past its timeout counts as a failure, once per round,
+    and the server is not probed again until it answers. A server is
+    marked inactive after `fall` consecutive failures and active again after
+    `rise` consecutive successes, and `on_change` is called only when the
+    status actually flips.
+
+    Request outcomes reported through `record` (passive checks) feed the
+    same counters, so live traffic can take a failing server out between
+    probe rounds.
+    """
+
+    def __init__(
+        self,
+        servers: Callable[[], List[Server]],
+        on_change: Callable[[Server, str], None],
+        rise: int = 2,
+        fall: int = 3,
+        timeout: float = 1.0,
+        max_workers: int = 16,
+    ):
+        """
+        Args:
+            servers: Returns the servers to check; read every round.
+            on_change: Called with a server and its new status when the status flips.
+            rise: Consecutive successes that bring an inactive server back.
+            fall: Consecutive failures that take an active server out.
+            timeout: Seconds a running probe has to answer.
+            max_workers: Probes run at the same time.
+        """
+        if rise < 1 or fall < 1:
+            raise ValueError("rise and fall must be at least 1")
+        self._servers = servers
+        self._on_change = on_change
+        self.rise = rise
+        self.fall = fall
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        # Server id -> consecutive successes (positive) or failures (negative).
+        self._streaks: Dict[str, int] = {}
+        self._pending: Dict[str, Future] = {}
+        # Server id -> monotonic time its pending probe started running.
+        self._started: Dict[str, float] = {}
+        # Pending probes already counted as timed out.
+        self._overdue: Set[Future] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def record(self, server: Server, healthy: bool):
+        """
+        Counts one probe result or request outcome for the server.
+        """
+        with self._lock:
+            streak = self._streaks.get(server.id, 0)
+            if healthy:
+                streak = streak + 1 if streak > 0 else 1
+            else:
+                streak = streak - 1 if streak < 0 else -1
+            self._streaks[server.id] = streak
+
+            if server.status == ServerStatus.ACTIVE and streak <= -self.fall:
+                new_status = ServerStatus.INACTIVE
+            elif server.status != ServerStatus.ACTIVE and streak >= self.rise:
+                new_status = ServerStatus.ACTIVE
+            else:
+                return
+        self._on_change(server, new_status)
+
+    def forget(self, server: Server):
+        """
+        Drops the server's counters and pending probe, e.g. once it is removed.
+        """
+        with self._lock:
+            self._streaks.pop(server.id, None)
+            future = self._pending.pop(server.id, None)
+            self._started.pop(server.id, None)
+            self._overdue.discard(future)
+
+    def check_all(self, check_function: Callable[[Server], bool]):
+        """
+        Runs one probe round over all servers and waits for it to finish.
+
+        The round ends when every probe has answered or timed out. Probes
+        still queued behind hung ones when no probe has answered or timed out
+        for `timeout` seconds are left to a later round, uncounted.
+        """
+        executor = self._executor or ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            waiting: Dict[Future, Server] = {}
+            for server in self._servers():
+                future = self._pending.get(server.id)
+                if future is not None and future in self._overdue:
+                    if not future.done():
+                        self.record(server, False)
+                        continue
+                    self._overdue.discard(future)
+                    future = None
+                if future is None:
+                    self._started.pop(server.id, None)
+                    future = executor.submit(self._probe, check_function, server)
+                    self._pending[server.id] = future
+                # Probes left from an earlier round are carried over, not resubmitted.
+                waiting[future] = server
+
+            last_progress = time.monotonic()
+            while waiting:
+                now = time.monotonic()
+                deadline = last_progress + self.timeout
+                for server in waiting.values():
+                    started = self._started.get(server.id)
+                    if started is not None:
+                        deadline = min(deadline, started + self.timeout)
+                done, _ = wait(waiting, timeout=max(0.0, deadline - now), return_when=FIRST_COMPLETED)
+
+                now = time.monotonic()
+                for future in done:
+                    server = waiting.pop(future)
+                    if self._pending.get(server.id) is future:
+                        del self._pending[server.id]
+                        self.record(server, future.exception() is None and bool(future.result()))
+                for future, server in list(waiting.items()):
+                    started = self._started.get(server.id)
+                    if started is not None and now - started >= self.timeout:
+                        del waiting[future]
+                        self._overdue.add(future)
+                        if self._pending.get(server.id) is future:
+                            self.record(server, False)
+                        done.add(future)
+                if done:
+                    last_progress = now
+                elif now - last_progress >= self.timeout:
+                    # Only probes that never got a worker are left.
+                    break
+        finally:
+            if executor is not self._executor:
+                executor.shutdown(wait=False)
+
+    def _probe(self, check_function: Callable[[Server], bool], server: Server) -> bool:
+        self._started[server.id] = time.monotonic()
+        return check_function(server)
+
+    def start(self, check_function: Callable[[Server], bool], interval: float = 5.0):
+        """
+        Starts probing all servers every `interval` seconds in the background.
+        """
+        def health_loop():
+            while not self._stop.is_set():
+                self.check_all(check_function)
+                self._stop.wait(interval)
+
+        self.stop()
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="health-probe")
+        self._thread = threading.Thread(target=health_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self._executor:
+            # Hung probes are abandoned rather than waited for.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+        self._started.clear()
+        self._overdue.clear()
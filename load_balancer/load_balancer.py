@@ -1,26 +1,45 @@
 import threading
-import time
 from typing import List, Callable, Optional
-from algorithms.server import Server, ServerStatus
+from algorithms.server import Server
 from algorithms.round_robin import RoundRobin
 from algorithms.least_active_connection import LeastActiveConnection
+from algorithms.least_response_time import LeastResponseTime
 from algorithms.weighted_round_robin import WeightedRoundRobin
 from algorithms.consistent_hashing import ConsistentHashing
+from algorithms.maglev import MaglevHashing
+from algorithms.power_of_two_choices import PeakEwma, PowerOfTwoChoices
+from health_checker import HealthChecker
 
 
 class StrategyType:
     ROUND_ROBIN = "round_robin"
     WEIGHTED_ROUND_ROBIN = "weighted_round_robin"
     LEAST_CONNECTIONS = "least_connections"
+    LEAST_RESPONSE_TIME = "least_response_time"
+    POWER_OF_TWO_CHOICES = "power_of_two_choices"
+    PEAK_EWMA = "peak_ewma"
     CONSISTENT_HASH = "consistent_hash"
+    MAGLEV = "maglev"
+
+# Strategies that route by request key.
+KEYED_STRATEGIES = {StrategyType.CONSISTENT_HASH, StrategyType.MAGLEV}
 
 class LoadBalancer:
-    def __init__(self, servers: List[Server], strategy: str = StrategyType.ROUND_ROBIN):
-        self.servers = servers
-        self.strategy_name = strategy
-        self.strategy = self._get_strategy(strategy)
-        self.health_check_thread: Optional[threading.Thread] = None
-        self.stop_health_checks = threading.Event()
+    """
+    Routes requests to servers with a pluggable strategy.
+
+    Membership and status changes are serialised by a lock and published by
+    replacing `servers` and the strategy's derived tables rather than editing
+    them, so get_server never takes that lock and never sees a half-applied
+    change. A request racing a change may still go to the server just taken
+    out, as it would over the network anyway.
+    """
+    def __init__(self, servers: List[Server], strategy: str = StrategyType.ROUND_ROBIN, hash_function: str = "md5"):
+        self.servers = list(servers)
+        self.hash_function = hash_function
+        self._lock = threading.RLock()
+        self.set_strategy(strategy)
+        self.health_checker = HealthChecker(lambda: self.servers, self._apply_health)
 
     def _get_strategy(self, strategy: str):
         if strategy == StrategyType.ROUND_ROBIN:
@@ -29,54 +48,134 @@ class LoadBalancer:
             return WeightedRoundRobin(self.servers)
         elif strategy == StrategyType.LEAST_CONNECTIONS:
             return LeastActiveConnection(self.servers)
+        elif strategy == StrategyType.LEAST_RESPONSE_TIME:
+            return LeastResponseTime(self.servers)
+        elif strategy == StrategyType.POWER_OF_TWO_CHOICES:
+            return PowerOfTwoChoices(self.servers)
+        elif strategy == StrategyType.PEAK_EWMA:
+            return PeakEwma(self.servers)
         elif strategy == StrategyType.CONSISTENT_HASH:
-            return ConsistentHashing(self.servers)
+            return ConsistentHashing(self.servers, hash_function=self.hash_function)
+        elif strategy == StrategyType.MAGLEV:
+            return MaglevHashing(self.servers, hash_function=self.hash_function)
         else:
             raise ValueError(f"Unsupported strategy: {strategy}")
 
     def set_strategy(self, strategy: str):
-        self.strategy_name = strategy
-        self.strategy = self._get_strategy(strategy)
+        with self._lock:
+            selected = self._get_strategy(strategy)
+            self.strategy_name = strategy
+            self.strategy = selected
+            # Read as one value by get_server, so it never pairs a name with the wrong strategy.
+            self._selection = (strategy, selected)
 
     def get_server(self, key: Optional[str] = None) -> Server:
-        if self.strategy_name in {StrategyType.CONSISTENT_HASH}:
+        strategy_name, strategy = self._selection
+        if strategy_name in KEYED_STRATEGIES:
             if key is None:
-                raise ValueError(f"{self.strategy_name} requires a key")
-            return self.strategy.select_server(key)
-        return self.strategy.select_server()
+                raise ValueError(f"{strategy_name} requires a key")
+            return strategy.select_server(key)
+        return strategy.select_server()
+
+    def release(self, server: Server):
+        """
+        Reports that a request sent to `server` by get_server has finished.
+        """
+        if hasattr(self.strategy, "release"):
+            self.strategy.release(server)
+
+    def record_latency(self, server: Server, seconds: float):
+        """
+        Reports how long `server` took to answer a request; latency-aware
+        strategies fold it into a decaying average.
+        """
+        if hasattr(self.strategy, "record_latency"):
+            self.strategy.record_latency(server, seconds)
+        else:
+            server.response_time = seconds
 
     def add_server(self, server: Server):
-        self.servers.append(server)
-        self._refresh_strategy()
+        with self._lock:
+            self.servers = self.servers + [server]
+            if hasattr(self.strategy, "add_server"):
+                self.strategy.add_server(server)
+            else:
+                self._refresh_strategy()
 
     def remove_server(self, server_id: str):
-        self.servers = [s for s in self.servers if s.id != server_id]
-        self._refresh_strategy()
+        with self._lock:
+            removed = [s for s in self.servers if s.id == server_id]
+            self.servers = [s for s in self.servers if s.id != server_id]
+            if hasattr(self.strategy, "remove_server"):
+                for server in removed:
+                    self.strategy.remove_server(server)
+            else:
+                self._refresh_strategy()
+        for server in removed:
+            self.health_checker.forget(server)
 
     def set_server_status(self, server_id: str, status: str):
-        for s in self.servers:
-            if s.id == server_id:
-                s.status = status
-                break
-        self._refresh_strategy()
+        with self._lock:
+            for s in self.servers:
+                if s.id == server_id:
+                    self._set_status(s, status)
+                    break
+
+    def set_server_weight(self, server_id: str, weight: int):
+        with self._lock:
+            for s in self.servers:
+                if s.id == server_id:
+                    if s.weight != weight:
+                        s.weight = weight
+                        self._server_changed(s)
+                    break
+
+    def report_outcome(self, server: Server, success: bool):
+        """
+        Passive health signal: reports whether a request to `server` succeeded.
+        Enough consecutive failures take the server out, as failed probes would.
+        """
+        self.health_checker.record(server, success)
+
+    def _apply_health(self, server: Server, status: str):
+        with self._lock:
+            # A probe or request outcome can land after the server was removed;
+            # applying it would put the server back into the strategy.
+            if any(s is server for s in self.servers):
+                self._set_status(server, status)
+
+    def _set_status(self, server: Server, status: str):
+        if server.status != status:
+            server.status = status
+            self._server_changed(server)
+
+    def _server_changed(self, server: Server):
+        # Strategies that can update in place avoid a full rebuild.
+        if hasattr(self.strategy, "update_server"):
+            self.strategy.update_server(server)
+        else:
+            self._refresh_strategy()
 
     def _refresh_strategy(self):
         self.set_strategy(self.strategy_name)
 
-    def start_health_checks(self, check_function: Callable[[Server], bool], interval: float = 5.0):
-        def health_loop():
-            while not self.stop_health_checks.is_set():
-                for server in self.servers:
-                    healthy = check_function(server)
-                    server.status = ServerStatus.ACTIVE if healthy else ServerStatus.INACTIVE
-                self._refresh_strategy()
-                time.sleep(interval)
-
-        self.stop_health_checks.clear()
-        self.health_check_thread = threading.Thread(target=health_loop, daemon=True)
-        self.health_check_thread.start()
+    def start_health_checks(
+        self,
+        check_function: Callable[[Server], bool],
+        interval: float = 5.0,
+        timeout: float = 1.0,
+        rise: int = 2,
+        fall: int = 3,
+    ):
+        """
+        Probes all servers concurrently every `interval` seconds. A server goes
+        inactive after `fall` failed (or timed out) probes in a row and active
+        after `rise` successful ones; strategies refresh only on such a flip.
+        """
+        self.health_checker.rise = rise
+        self.health_checker.fall = fall
+        self.health_checker.timeout = timeout
+        self.health_checker.start(check_function, interval)
 
     def stop_health_checks(self):
-        self.stop_health_checks.set()
-        if self.health_check_thread:
-            self.health_check_thread.join()
+        self.health_checker.stop()
@@ -0,0 +1,42 @@
+from algorithms.least_response_time import LeastResponseTime
+from algorithms.server import Server, ServerStatus
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_server_behind_after_a_slow_response_gets_probed():
+    clock = FakeClock()
+    fast = Server("fast", "Fast", 1)
+    slow = Server("slow", "Slow", 1)
+    balancer = LeastResponseTime([fast, slow], decay_time=1.0, clock=clock)
+    balancer.record_latency(fast, 0.01)
+    balancer.record_latency(slow, 1.0)
+
+    probes = []
+    for step in range(30):
+        clock.now = step / 10
+        server = balancer.select_server()
+        if server is slow:
+            probes.append(clock.now)
+            balancer.record_latency(slow, 1.0)
+        else:
+            balancer.record_latency(fast, 0.01)
+
+    # Still slow, so it is only probed, once every probe_interval.
+    assert probes == [1.0, 2.0]
+
+
+def test_inactive_servers_are_not_probed():
+    clock = FakeClock()
+    up = Server("up", "Up", 1)
+    down = Server("down", "Down", 1, status=ServerStatus.INACTIVE)
+    balancer = LeastResponseTime([up, down], decay_time=1.0, clock=clock)
+    for _ in range(50):
+        assert balancer.select_server() is up
+        clock.now += 0.1
@@ -0,0 +1,21 @@
+import pytest
+from algorithms.maglev import MaglevHashing
+from algorithms.server import Server
+
+
+def make_servers(count):
+    return [Server(f"server-{i}", f"Server {i}", 1) for i in range(count)]
+
+
+@pytest.mark.parametrize("table_size", [0, 1, 4, 100, 65536])
+def test_rejects_table_sizes_that_are_not_prime(table_size):
+    with pytest.raises(ValueError):
+        MaglevHashing(make_servers(3), table_size=table_size)
+
+
+@pytest.mark.parametrize("table_size", [2, 3, 13, 251])
+def test_prime_table_is_filled_by_active_servers(table_size):
+    servers = make_servers(5)
+    maglev = MaglevHashing(servers, table_size=table_size)
+    assert len(maglev.table) == table_size
+    assert all(server in servers for server in maglev.table)
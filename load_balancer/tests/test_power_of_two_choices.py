@@ -0,0 +1,35 @@
+import random
+from algorithms.power_of_two_choices import PeakEwma
+from algorithms.server import Server
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_peak_ewma_penalty_decays_without_new_samples():
+    clock = FakeClock()
+    fast = Server("fast", "Fast", 1)
+    slow = Server("slow", "Slow", 1)
+    balancer = PeakEwma([fast, slow], decay_time=1.0, rng=random.Random(0), clock=clock)
+    balancer.record_latency(fast, 0.01)
+    balancer.record_latency(slow, 1.0)
+
+    picked_slow_at = None
+    while clock.now < 20.0:
+        server = balancer.select_server()
+        balancer.release(server)
+        if server is slow:
+            picked_slow_at = clock.now
+            break
+        balancer.record_latency(fast, 0.01)
+        clock.now += 0.1
+
+    # The 1 s penalty falls below the fast server's 10 ms after about
+    # ln(100) = 4.6 decay times, with no sample ever taken from the slow one.
+    assert picked_slow_at is not None
+    assert 4.0 <= picked_slow_at <= 6.0
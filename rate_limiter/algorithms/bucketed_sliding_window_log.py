@@ -0,0 +1,75 @@
+import math
+import time
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
+
+class BucketedSlidingWindowLog(RateLimiter):
+    """
+    Approximate SlidingWindowLog in O(buckets) memory per key.
+
+    The window is split into `buckets` sub-windows of width window_size / buckets,
+    and a ring of buckets + 1 counters holds the requests of the current
+    sub-window and the `buckets` before it. Those counters cover the whole
+    window plus at most one sub-window of older requests, so the count never
+    underestimates the exact log: the limiter never admits more than
+    SlidingWindowLog would. It may reject a request the exact log admits,
+    but only while requests older than the window, by less than one
+    sub-window width, are still counted.
+
+    Each decision clears at most buckets + 1 counters, whatever the request rate.
+    """
+    def __init__(self, window_size: int, max_request: int, buckets: int = 10, store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        self.window_size = window_size
+        self.max_request = max_request
+        self.buckets = buckets
+        self.bucket_width = window_size / buckets
+        # Every counter of a key idle for a window and one more sub-window has expired.
+        super().__init__(store_factory, window_size + self.bucket_width, clock)
+
+    def _defaults(self, now: float):
+        return {'counts': [0] * (self.buckets + 1), 'bucket': int(now // self.bucket_width), 'total': 0}
+
+    def _advance(self, user, bucket: int) -> None:
+        steps = bucket - user['bucket']
+        if steps <= 0:
+            # An earlier clock read in a batch counts into the newest bucket.
+            return
+        counts = user['counts']
+        ring = len(counts)
+        if steps >= ring:
+            counts[:] = [0] * ring
+            user['total'] = 0
+        else:
+            for offset in range(1, steps + 1):
+                index = (user['bucket'] + offset) % ring
+                user['total'] -= counts[index]
+                counts[index] = 0
+        user['bucket'] = bucket
+
+    def _wait_time(self, user, now: float, cost: int) -> float:
+        self._advance(user, int(now // self.bucket_width))
+        excess = user['total'] + cost - self.max_request
+        if excess <= 0:
+            return 0.0
+        if cost > self.max_request:
+            return math.inf
+        # Counters drop out oldest first; counter k stops counting once bucket k + ring starts.
+        counts = user['counts']
+        ring = len(counts)
+        current = user['bucket']
+        freed = 0
+        for oldest in range(current - ring + 1, current + 1):
+            freed += counts[oldest % ring]
+            if freed >= excess:
+                return (oldest + ring) * self.bucket_width - now
+        return math.inf
+
+    def _commit(self, user, now: float, cost: int) -> None:
+        user['counts'][user['bucket'] % len(user['counts'])] += cost
+        user['total'] += cost
+
+    def _remaining(self, user, now: float) -> int:
+        return self.max_request - user['total']
\ No newline at end of file
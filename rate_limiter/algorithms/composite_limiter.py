@@ -0,0 +1,47 @@
+import time
+from typing import Any, List, Optional, Sequence
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
+
+class CompositeLimiter(RateLimiter):
+    """
+    Enforces several rules on the same keys at once, e.g. a per-second burst
+    limit, a per-minute and a per-day quota.
+
+    All rules' state for a key lives in one record guarded by one lock, and
+    each decision reads the clock once. A request consumes from every rule
+    only if every rule has room for its cost; otherwise nothing is consumed
+    and check() reports the longest wait among the rules.
+
+    Rules are limiters that implement `_wait_time` and `_commit` (TokenBucket,
+    SlidingWindowCounter); they only serve as definitions here, and their
+    own stores stay unused.
+    """
+    def __init__(self, rules: Sequence[RateLimiter], store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
+        if not rules:
+            raise ValueError("CompositeLimiter needs at least one rule")
+        self.rules: List[RateLimiter] = list(rules)
+        # Forgetting a key is exact once the slowest-decaying rule has forgotten it.
+        super().__init__(store_factory, max(rule.idle_ttl for rule in self.rules), clock)
+
+    def _defaults(self, now: float):
+        return [rule._defaults(now) for rule in self.rules]
+
+    def _prepare(self, now: float) -> List[Any]:
+        return [rule._prepare(now) for rule in self.rules]
+
+    def _wait_time(self, records, ctxs: List[Any], cost: int) -> float:
+        wait = 0.0
+        for rule, record, ctx in zip(self.rules, records, ctxs):
+            wait = max(wait, rule._wait_time(record, ctx, cost))
+        return wait
+
+    def _commit(self, records, ctxs: List[Any], cost: int) -> None:
+        for rule, record, ctx in zip(self.rules, records, ctxs):
+            rule._commit(record, ctx, cost)
+
+    def _remaining(self, records, ctxs: List[Any]) -> Optional[int]:
+        known = [rule._remaining(record, ctx) for rule, record, ctx in zip(self.rules, records, ctxs)]
+        known = [remaining for remaining in known if remaining is not None]
+        return min(known) if known else None
@@ -0,0 +1,225 @@
+import logging
+import math
+import threading
+import time
+import uuid
+from typing import Dict, Hashable, List, Optional, Tuple
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
+from ..storage.sync_backend import SyncBackend
+
+logger = logging.getLogger(__name__)
+
+class DistributedSlidingWindowCounter(RateLimiter):
+    """
+    Sliding window counter whose limit holds across many nodes.
+
+    Each node decides locally from the global counts it saw at its last
+    sync plus what it admitted since, and a background thread pushes those
+    local counts to a shared SyncBackend every `sync_interval` seconds. A
+    node therefore pays one backend round trip per interval, not per request.
+
+    Between syncs a node admits at most `local_share` of the quota that was
+    still free at its last sync (by default 1 / number of active nodes,
+    rounded up to a whole request). The nodes together can thus over-admit
+    by roughly the quota that frees up within one sync interval plus one
+    request per node; a larger share serves skewed traffic better at the
+    cost of more over-admission.
+    """
+    def __init__(
+        self,
+        window_size: int,
+        max_request: int,
+        backend: SyncBackend,
+        sync_interval: Optional[float] = 0.1,
+        local_share: Optional[float] = None,
+        node_id: Optional[str] = None,
+        store_factory: StoreFactory = StripedStateStore,
+        clock: Clock = time.time,
+    ):
+        """
+        Args:
+            window_size: Window length in seconds.
+            max_request: Requests allowed per window across all nodes.
+            backend: Where the nodes' counts are aggregated.
+            sync_interval: Seconds between background syncs, or None to only
+                sync when sync() is called.
+            local_share: Fraction of the free quota one node may admit between
+                syncs; defaults to 1 / active nodes.
+            node_id: Identifies this node to the backend; random by default.
+            store_factory: Builds the per-key state store.
+        """
+        self.window_size = window_size
+        self.max_request = max_request
+        self.backend = backend
+        self.local_share = local_share
+        self.node_id = node_id or uuid.uuid4().hex
+        self.active_nodes = 1
+        self.sync_interval = sync_interval
+        super().__init__(store_factory, 2 * window_size, clock)
+        self._sync_lock = threading.Lock()
+        self._stop_sync = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
+        if sync_interval is not None:
+            self.start_sync(sync_interval)
+
+    def _defaults(self, now: float):
+        return {
+            'window': int(now // self.window_size),
+            # Global counts of this and the previous window as of the last sync.
+            'global': 0,
+            'previous': 0,
+            # Admitted here: sent in the sync under way, and not sent yet.
+            'inflight': 0,
+            'local': 0,
+            # Unsent local count of a window the key rolled past.
+            'late': 0,
+            'late_window': 0,
+        }
+
+    def _prepare(self, now: float) -> Tuple[float, int, float]:
+        return now, int(now // self.window_size), (now % self.window_size) / self.window_size
+
+    def _roll(self, record, window: int) -> None:
+        if window <= record['window']:
+            return
+        if record['local']:
+            record['late'] = record['local']
+            record['late_window'] = record['window']
+        if window == record['window'] + 1:
+            record['previous'] = record['global'] + record['inflight'] + record['local']
+        else:
+            record['previous'] = 0
+        record['global'] = record['inflight'] = record['local'] = 0
+        record['window'] = window
+
+    def _wait_time(self, record, ctx: Tuple[float, int, float], cost: int) -> float:
+        now, window, window_elapsed = ctx
+        self._roll(record, window)
+        synced = record['previous'] * (1 - window_elapsed) + record['global'] + record['inflight']
+        limit = self.max_request - cost + 1
+        if limit <= 0:
+            return math.inf
+        if synced + record['local'] >= limit:
+            # Wait for the previous window's weight to decay, or for the next window.
+            previous = record['previous']
+            current = record['global'] + record['inflight'] + record['local']
+            if current < limit:
+                return (1 - (limit - current) / previous - window_elapsed) * self.window_size
+            return (1 - window_elapsed + max(0.0, 1 - limit / current)) * self.window_size
+
+        share = self.local_share if self.local_share is not None else 1 / self.active_nodes
+        budget = math.ceil(max(0.0, self.max_request - synced) * share)
+        if record['local'] + cost > budget:
+            # This node's share is used up until the next sync shows the others' counts.
+            return self.sync_interval or self.window_size * (1 - window_elapsed)
+        return 0.0
+
+    def _commit(self, record, ctx: Tuple[float, int, float], cost: int) -> None:
+        record['local'] += cost
+
+    def _remaining(self, record, ctx: Tuple[float, int, float]) -> int:
+        _, _, window_elapsed = ctx
+        estimate = record['previous'] * (1 - window_elapsed) + record['global'] + record['inflight'] + record['local']
+        return max(0, math.ceil(self.max_request + 1 - estimate) - 1)
+
+    def sync(self) -> None:
+        """
+        Push the local counts to the backend and adopt the global counts it returns.
+        """
+        with self._sync_lock:
+            window = int(self.clock() // self.window_size)
+            store = self.store
+            deltas: Dict[int, Dict[Hashable, int]] = {}
+            sent: Dict[Hashable, int] = {}
+            late: Dict[Hashable, Tuple[int, int]] = {}
+            keys: List[Hashable] = []
+            for index in range(store.num_stripes):
+                with store.stripe_lock(index):
+                    for key, record in store.records(index):
+                        self._roll(record, window)
+                        keys.append(key)
+                        if record['local']:
+                            deltas.setdefault(window, {})[key] = record['local']
+                            sent[key] = record['local']
+                            record['inflight'] += record['local']
+                            record['local'] = 0
+                        if record['late']:
+                            deltas.setdefault(record['late_window'], {})[key] = record['late']
+                            late[key] = (record['late_window'], record['late'])
+                            record['late'] = 0
+
+            try:
+                totals, nodes = self.backend.sync(self.node_id, deltas, window, keys)
+            except Exception:
+                self._restore(window, sent, late)
+                raise
+            self.active_nodes = max(1, nodes)
+
+            for index in range(store.num_stripes):
+                with store.stripe_lock(index):
+                    for key, record in store.records(index):
+                        counts = totals.get(key)
+                        if counts is None or record['window'] != window:
+                            continue
+                        record['global'], record['previous'] = counts
+                        record['inflight'] -= sent.get(key, 0)
+
+    def _restore(self, window: int, sent: Dict[Hashable, int], late: Dict[Hashable, Tuple[int, int]]) -> None:
+        # The backend never saw these counts; send them again next time.
+        for index in range(self.store.num_stripes):
+            with self.store.stripe_lock(index):
+                for key, record in self.store.records(index):
+                    count = sent.get(key)
+                    if count:
+                        if record['window'] == window:
+                            record['inflight'] -= count
+                            record['local'] += count
+                        else:
+                            # The key rolled past the window while the sync was out.
+                            self._add_late(record, window, count)
+                    if key in late:
+                        self._add_late(record, *late[key])
+
+    @staticmethod
+    def _add_late(record, window: int, count: int) -> None:
+        if not record['late'] or record['late_window'] == window:
+            record['late'] += count
+            record['late_window'] = window
+        elif window > record['late_window']:
+            # Only one late window is kept; counts two or more windows old
+            # no longer weigh on any decision.
+            record['late'] = count
+            record['late_window'] = window
+
+    def start_sync(self, interval: float) -> None:
+        """
+        Start the background thread that syncs every `interval` seconds.
+        """
+        def sync_loop():
+            delay = interval
+            while not self._stop_sync.wait(delay):
+                try:
+                    self.sync()
+                except Exception:
+                    # Keep deciding locally, and back off, while the backend fails.
+                    delay = min(delay * 2, max(interval, self.window_size))
+                    logger.warning("Sync of node %s failed; retrying in %.2fs", self.node_id, delay, exc_info=True)
+                else:
+                    delay = interval
+
+        self.stop_sync()
+        self.sync_interval = interval
+        self._stop_sync.clear()
+        self._sync_thread = threading.Thread(target=sync_loop, daemon=True)
+        self._sync_thread.start()
+
+    def stop_sync(self) -> None:
+        """
+        Stop the background sync thread, if one is running.
+        """
+        self._stop_sync.set()
+        if self._sync_thread:
+            self._sync_thread.join()
+            self._sync_thread = None
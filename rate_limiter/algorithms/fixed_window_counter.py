@@ -1,26 +1,37 @@
+import math
 import time
-from collections import defaultdict
-import threading
+from typing import Tuple
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
 
-class FixedWindowCounter:
-    def __init__(self, window_size: int, max_request: int):
+class FixedWindowCounter(RateLimiter):
+    def __init__(self, window_size: int, max_request: int, store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
         self.window_size = window_size
         self.max_request = max_request
-        self.users = defaultdict(lambda: {'window': 0, 'count': 0})
-        self.lock = threading.Lock()
-    
-    def allow_request(self, user_ip: str) -> bool:
-        with self.lock:
-            current_time = time.time()
-            current_window = int(current_time // self.window_size)
-            user = self.users[user_ip]
+        # A key idle for a whole window starts the next one from zero anyway.
+        super().__init__(store_factory, window_size, clock)
 
-            if user['window'] != current_window:
-                user['window'] = current_window
-                user['count'] = 0
-            
-            if user['count'] < self.max_request:
-                user['count'] += 1
-                return True
+    def _defaults(self, now: float):
+        return {'window': 0, 'count': 0}
 
-            return False
\ No newline at end of file
+    def _prepare(self, current_time: float) -> Tuple[float, int]:
+        return current_time, int(current_time // self.window_size)
+
+    def _wait_time(self, user, ctx: Tuple[float, int], cost: int) -> float:
+        current_time, current_window = ctx
+        if user['window'] != current_window:
+            user['window'] = current_window
+            user['count'] = 0
+
+        if user['count'] + cost <= self.max_request:
+            return 0.0
+        if cost > self.max_request:
+            return math.inf
+        return (current_window + 1) * self.window_size - current_time
+
+    def _commit(self, user, ctx: Tuple[float, int], cost: int) -> None:
+        user['count'] += cost
+
+    def _remaining(self, user, ctx: Tuple[float, int]) -> int:
+        return int(self.max_request - user['count'])
\ No newline at end of file
@@ -1,26 +1,61 @@
-from collections import deque, defaultdict
-import threading
+import math
 import time
+from typing import Hashable, Optional
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
 
-class LeakyBucket:
-    def __init__(self, capacity: int, leak_rate: int):
+class LeakyBucket(RateLimiter):
+    """
+    Leaky bucket kept as a water level that drains at `leak_rate` units per
+    second, so every decision is O(1) whatever the capacity.
+
+    allow_request and check use it as a meter: a request is admitted if its
+    units still fit in the bucket. `schedule` uses it as a queue: the request
+    is admitted the same way, but released only once the water ahead of it
+    has drained, which smooths a burst out to the leak rate instead of
+    dropping it.
+    """
+    def __init__(self, capacity: int, leak_rate: int, store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
         self.capacity = capacity
         self.leak_rate = leak_rate
-        self.buckets = defaultdict(lambda: {'tokens': deque(), 'last_leak': time.time()})
-        self.lock = threading.Lock()
-
-    def allow_request(self, key: str) -> bool:
-        with self.lock:
-            now = time.time()
-            bucket = self.buckets[key]
-            leak_time = now - bucket['last_leak']
-            leaked = int(leak_time * self.leak_rate)
-            if leaked > 0:
-                for _ in range(min(self.capacity, leaked)):
-                    bucket['tokens'].popleft()
-                bucket['last_leak'] = now
-
-            if len(bucket['tokens']) < self.capacity:
-                bucket['tokens'].append(now)
-                return True
-            return False
\ No newline at end of file
+        # A full bucket has drained after capacity / leak_rate seconds.
+        super().__init__(store_factory, capacity / leak_rate, clock)
+
+    def _defaults(self, now: float):
+        return {'level': 0.0, 'last_leak': now}
+
+    def _wait_time(self, bucket, now: float, cost: int) -> float:
+        # A batch decided at an earlier clock read must not move the bucket back in time.
+        if now > bucket['last_leak']:
+            leaked = (now - bucket['last_leak']) * self.leak_rate
+            bucket['level'] = max(0.0, bucket['level'] - leaked)
+            bucket['last_leak'] = now
+
+        if cost > self.capacity:
+            return math.inf
+        overflow = bucket['level'] + cost - self.capacity
+        return overflow / self.leak_rate if overflow > 0 else 0.0
+
+    def _commit(self, bucket, now: float, cost: int) -> None:
+        bucket['level'] += cost
+
+    def _remaining(self, bucket, now: float) -> int:
+        return int(self.capacity - bucket['level'])
+
+    def schedule(self, key: Hashable, cost: int = 1) -> Optional[float]:
+        """
+        Queue a request and return when it may proceed.
+
+        Returns:
+            The clock time at which the water ahead of the request has
+            drained, or None if the bucket is too full to queue it.
+        """
+        with self.store.lock_for(key):
+            now = self.clock()
+            bucket = self.store.get(key, now)
+            if self._wait_time(bucket, now, cost) > 0:
+                return None
+            release = now + bucket['level'] / self.leak_rate
+            self._commit(bucket, now, cost)
+            return release
@@ -0,0 +1,147 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence
+from ..storage.state_store import StateStore, StoreFactory
+
+# Source of the current time in seconds; injectable so benchmarks and simulations can replay traces.
+Clock = Callable[[], float]
+
+class Decision(NamedTuple):
+    allowed: bool
+    # Seconds until the same request would be allowed; 0 when allowed, inf if never.
+    retry_after: float
+    # Units left for the key after this decision, when the limiter can tell.
+    remaining: Optional[int] = None
+
+class RateLimiter(ABC):
+    """
+    Base class of the limiters: per-key state lives in a StateStore, and the
+    subclass decides a single request against one key's record.
+
+    Subclasses implement `_wait_time` and `_commit`; the split lets `check`
+    report a retry-after time and lets CompositeLimiter commit only when every
+    rule passes.
+    """
+    def __init__(self, store_factory: StoreFactory, idle_ttl: Optional[float], clock: Clock = time.time):
+        """
+        Args:
+            store_factory: Builds the state store from `_defaults` and `idle_ttl`.
+            idle_ttl: Seconds of inactivity after which a key's state has fully
+                decayed, so dropping it cannot change any decision.
+            clock: Returns the current time in seconds.
+        """
+        self.idle_ttl = idle_ttl
+        self.clock = clock
+        self.store: StateStore = store_factory(self._defaults, idle_ttl)
+
+    @abstractmethod
+    def _defaults(self, now: float) -> Dict[str, Any]:
+        """
+        State of a key seen for the first time at `now`.
+        """
+        pass
+
+    def _prepare(self, now: float) -> Any:
+        """
+        Per-clock-read values shared by every decision made at `now`, e.g. the
+        current window. allow_requests computes them once per batch.
+        """
+        return now
+
+    def _try_consume(self, record: Dict[str, Any], ctx: Any, cost: int) -> bool:
+        """
+        Admit `cost` units against the key's record if the limit allows,
+        updating the record; `ctx` comes from _prepare.
+        """
+        if self._wait_time(record, ctx, cost) > 0:
+            return False
+        self._commit(record, ctx, cost)
+        return True
+
+    @abstractmethod
+    def _wait_time(self, record: Dict[str, Any], ctx: Any, cost: int) -> float:
+        """
+        Bring the record up to date and return the seconds until `cost` units
+        fit, 0 if they fit now, without consuming anything.
+        """
+        pass
+
+    @abstractmethod
+    def _commit(self, record: Dict[str, Any], ctx: Any, cost: int) -> None:
+        """
+        Consume `cost` units; only called after _wait_time returned 0.
+        """
+        pass
+
+    def _remaining(self, record: Dict[str, Any], ctx: Any) -> Optional[int]:
+        """
+        Whole units the key could still consume now, or None if unknown.
+        """
+        return None
+
+    def allow_request(self, key: Hashable, cost: int = 1) -> bool:
+        with self.store.lock_for(key):
+            now = self.clock()
+            return self._try_consume(self.store.get(key, now), self._prepare(now), cost)
+
+    def check(self, key: Hashable, cost: int = 1) -> Decision:
+        """
+        Like allow_request, but also says how long a rejected request should wait.
+        """
+        with self.store.lock_for(key):
+            now = self.clock()
+            record = self.store.get(key, now)
+            ctx = self._prepare(now)
+            wait = self._wait_time(record, ctx, cost)
+            if wait > 0:
+                return Decision(False, wait, self._remaining(record, ctx))
+            self._commit(record, ctx, cost)
+            return Decision(True, 0.0, self._remaining(record, ctx))
+
+    def allow_requests(
+        self,
+        keys: Iterable[Hashable],
+        costs: Optional[Sequence[int]] = None,
+        now: Optional[float] = None,
+    ) -> List[bool]:
+        """
+        Decide a batch of requests under one clock read, taking each stripe lock once.
+
+        Requests for the same key are decided in batch order, so a key that
+        appears more often than its limit allows is rejected for the excess.
+
+        Args:
+            keys: Key of each request.
+            costs: Optional units consumed by each request; defaults to 1 each.
+            now: Decision time; defaults to the limiter's clock.
+
+        Returns:
+            Whether each request is allowed, in the order of `keys`.
+        """
+        keys = list(keys)
+        if costs is not None and len(costs) != len(keys):
+            raise ValueError("costs must have one entry per key")
+        if now is None:
+            now = self.clock()
+        ctx = self._prepare(now)
+        store = self.store
+        stripe_index = store.stripe_index
+        groups: Dict[int, List[int]] = {}
+        for position, key in enumerate(keys):
+            index = stripe_index(key)
+            group = groups.get(index)
+            if group is None:
+                groups[index] = [position]
+            else:
+                group.append(position)
+
+        results = [False] * len(keys)
+        if costs is None:
+            costs = [1] * len(keys)
+        get = store.get
+        try_consume = self._try_consume
+        for index, positions in groups.items():
+            with store.stripe_lock(index):
+                for position in positions:
+                    results[position] = try_consume(get(keys[position], now), ctx, costs[position])
+        return results
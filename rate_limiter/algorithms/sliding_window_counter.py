@@ -1,30 +1,52 @@
+import math
 import time
-import threading
-from collections import defaultdict
+from typing import Tuple
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
 
-class SlidingWindowCounter:
-    def __init__(self, window_size: int, max_request: int):
+class SlidingWindowCounter(RateLimiter):
+    def __init__(self, window_size: int, max_request: int, store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
         self.window_size = window_size
         self.max_request = max_request
-        self.user_requests = defaultdict(lambda: {'current_window': time.time(), 'current_count': 0, 'previous_count': 0})
-        self.lock = threading.Lock()
-
-    def allow_request(self, user_ip: str) -> bool:
-        with self.lock:
-            now = time.time()
-            window = now // self.window_size
-            user_request = self.user_requests[user_ip]
-
-            if window != user_request['current_window']:
-                user_request['previous_count'] = user_request['current_count']
-                user_request['current_count'] = 0
-                user_request['current_window'] = window
-            
-            window_elapsed = (now % self.window_size) / self.window_size
-            threshold = user_request['previous_count'] * (1 - window_elapsed) + user_request['current_count']
-
-            if threshold < self.max_request:
-                user_request['current_count'] += 1
-                return True
-
-            return False
\ No newline at end of file
+        # After two idle windows neither the current nor the previous count matters.
+        super().__init__(store_factory, 2 * window_size, clock)
+
+    def _defaults(self, now: float):
+        return {'current_window': now // self.window_size, 'current_count': 0, 'previous_count': 0}
+
+    def _prepare(self, now: float) -> Tuple[float, float]:
+        window = now // self.window_size
+        window_elapsed = (now % self.window_size) / self.window_size
+        return window, window_elapsed
+
+    def _wait_time(self, user_request, ctx: Tuple[float, float], cost: int) -> float:
+        window, window_elapsed = ctx
+        if window != user_request['current_window']:
+            user_request['previous_count'] = user_request['current_count']
+            user_request['current_count'] = 0
+            user_request['current_window'] = window
+
+        threshold = user_request['previous_count'] * (1 - window_elapsed) + user_request['current_count']
+
+        # Equivalent to threshold < max_request for a single request.
+        limit = self.max_request - cost + 1
+        if threshold < limit:
+            return 0.0
+        if limit <= 0:
+            return math.inf
+        previous, current = user_request['previous_count'], user_request['current_count']
+        if current < limit:
+            # The previous window's weight decays enough later in this window.
+            return (1 - (limit - current) / previous - window_elapsed) * self.window_size
+        # Wait for the next window, where this window's count becomes the decaying one.
+        return (1 - window_elapsed + max(0.0, 1 - limit / current)) * self.window_size
+
+    def _commit(self, user_request, ctx: Tuple[float, float], cost: int) -> None:
+        user_request['current_count'] += cost
+
+    def _remaining(self, user_request, ctx: Tuple[float, float]) -> int:
+        _, window_elapsed = ctx
+        threshold = user_request['previous_count'] * (1 - window_elapsed) + user_request['current_count']
+        # Largest cost that still passes threshold < max_request - cost + 1.
+        return max(0, math.ceil(self.max_request + 1 - threshold) - 1)
\ No newline at end of file
@@ -1,24 +1,34 @@
+import math
 import time
-import threading
-from collections import defaultdict, deque
+from collections import deque
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
 
-class SlidingWindowLog:
-    def __init__(self, window_size: int, max_request: int):
+class SlidingWindowLog(RateLimiter):
+    def __init__(self, window_size: int, max_request: int, store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
         self.window_size = window_size
         self.max_request = max_request
-        self.users_request = defaultdict(lambda: {'request_log': deque()})
-        self.lock = threading.Lock()
-    
-    def allow_request(self, user_ip: str) -> bool:
-        with self.lock:
-            now = time.time()
-            user = self.users_request[user_ip]
+        # Every logged request of a key idle for a whole window has expired.
+        super().__init__(store_factory, window_size, clock)
 
-            while user['request_log'] and now - user['request_log'][0] >= self.window_size:
-                user['request_log'].popleft()
-            
-            if len(user['request_log']) < self.max_request:
-                user['request_log'].append(now)
-                return True
+    def _defaults(self, now: float):
+        return {'request_log': deque()}
 
-            return False
\ No newline at end of file
+    def _wait_time(self, user, now: float, cost: int) -> float:
+        while user['request_log'] and now - user['request_log'][0] >= self.window_size:
+            user['request_log'].popleft()
+
+        excess = len(user['request_log']) + cost - self.max_request
+        if excess <= 0:
+            return 0.0
+        if cost > self.max_request:
+            return math.inf
+        # The oldest `excess` requests have to leave the window first.
+        return user['request_log'][excess - 1] + self.window_size - now
+
+    def _commit(self, user, now: float, cost: int) -> None:
+        user['request_log'].extend([now] * cost)
+
+    def _remaining(self, user, now: float) -> int:
+        return self.max_request - len(user['request_log'])
\ No newline at end of file
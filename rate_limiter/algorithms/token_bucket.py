@@ -1,24 +1,35 @@
+import math
 import time
-import threading
-from collections import defaultdict
+from .rate_limiter import Clock, RateLimiter
+from ..storage.state_store import StoreFactory
+from ..storage.striped_state_store import StripedStateStore
 
-class TokenBucket:
-    def __init__(self, capacity: int, refill_rate: int):
+class TokenBucket(RateLimiter):
+    def __init__(self, capacity: int, refill_rate: int, store_factory: StoreFactory = StripedStateStore, clock: Clock = time.time):
         self.capacity = capacity
         self.refill_rate = refill_rate
-        self.buckets = defaultdict(lambda: {'tokens': capacity, 'last_checked': time.time()})
-        self.lock = threading.Lock()
+        # An idle bucket is full again after capacity / refill_rate seconds, so forgetting it then is exact.
+        super().__init__(store_factory, capacity / refill_rate, clock)
 
-    def allow_request(self, key: str) -> bool:
-        with self.lock:
-            now = time.time()
-            bucket = self.buckets[key]
+    def _defaults(self, now: float):
+        return {'tokens': self.capacity, 'last_checked': now}
+
+    def _wait_time(self, bucket, now: float, cost: int) -> float:
+        # A batch decided at an earlier clock read must not move the bucket back in time.
+        if now > bucket['last_checked']:
             time_passed = now - bucket['last_checked']
             refill = time_passed * self.refill_rate
             bucket['tokens'] = min(self.capacity, bucket['tokens'] + refill)
             bucket['last_checked'] = now
-    
-            if bucket['tokens'] >= 1:
-                bucket['tokens'] -= 1
-                return True
-            return False
\ No newline at end of file
+
+        if bucket['tokens'] >= cost:
+            return 0.0
+        if cost > self.capacity:
+            return math.inf
+        return (cost - bucket['tokens']) / self.refill_rate
+
+    def _commit(self, bucket, now: float, cost: int) -> None:
+        bucket['tokens'] -= cost
+
+    def _remaining(self, bucket, now: float) -> int:
+        return int(bucket['tokens'])
\ No newline at end of file
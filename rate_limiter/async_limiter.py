@@ -0,0 +1,72 @@
+import asyncio
+import math
+from contextlib import nullcontext
+from functools import partial
+from typing import Hashable, Optional
+from .algorithms.rate_limiter import Decision, RateLimiter
+from .storage.striped_state_store import StripedStateStore
+
+# State store for limiters used only from one event loop: every decision runs
+# to completion without awaiting, so no lock is needed and none can block the loop.
+event_loop_store = partial(StripedStateStore, stripes=1, lock_factory=nullcontext)
+
+class AsyncRateLimiter:
+    """
+    asyncio front end for a RateLimiter.
+
+    `allow` decides immediately. `acquire` waits for capacity instead of
+    rejecting, sleeping for the limiter's retry-after time between attempts.
+    `shape` queues the request on a limiter with a `schedule` method, such as
+    LeakyBucket, and sleeps until its release time.
+
+    Build the limiter with `store_factory=event_loop_store` when it is only
+    used from the event loop; a limiter shared with other threads keeps its
+    thread locks, which the loop may then wait on briefly.
+    """
+    def __init__(self, limiter: RateLimiter):
+        self.limiter = limiter
+
+    def allow(self, key: Hashable, cost: int = 1) -> Decision:
+        """
+        Decide a request without waiting.
+        """
+        return self.limiter.check(key, cost)
+
+    async def acquire(self, key: Hashable, cost: int = 1, timeout: Optional[float] = None) -> Decision:
+        """
+        Wait until the request is admitted.
+
+        Args:
+            key: The key to consume from.
+            cost: Units to consume.
+            timeout: Give up once waiting longer would exceed this many seconds.
+
+        Returns:
+            The admitting decision, or the last rejection if the timeout or an
+            impossible cost (retry_after of inf) made waiting pointless.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            decision = self.limiter.check(key, cost)
+            if decision.allowed:
+                return decision
+            wait = decision.retry_after
+            if wait == math.inf or (deadline is not None and loop.time() + wait > deadline):
+                return decision
+            await asyncio.sleep(wait)
+
+    async def shape(self, key: Hashable, cost: int = 1) -> bool:
+        """
+        Queue the request and wait until the limiter releases it.
+
+        Returns:
+            True once the request may proceed, or False at once if the queue is full.
+        """
+        release = self.limiter.schedule(key, cost)
+        if release is None:
+            return False
+        delay = release - self.limiter.clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
@@ -0,0 +1,62 @@
+"""
+Per-decision cost of allow_requests compared with a loop of allow_request calls.
+
+The batch path reads the clock once, computes window math once and takes
+each stripe lock once per batch; the loop pays for all three per request.
+
+Run from the repository root:
+    python -m rate_limiter.benchmarks.batch_decisions --batch-sizes 16 256
+"""
+import argparse
+import random
+import time
+from ..algorithms.fixed_window_counter import FixedWindowCounter
+from ..algorithms.leaky_bucket import LeakyBucket
+from ..algorithms.sliding_window_counter import SlidingWindowCounter
+from ..algorithms.sliding_window_log import SlidingWindowLog
+from ..algorithms.token_bucket import TokenBucket
+
+LIMITERS = {
+    "TokenBucket": lambda: TokenBucket(capacity=100, refill_rate=50),
+    "LeakyBucket": lambda: LeakyBucket(capacity=100, leak_rate=50),
+    "FixedWindowCounter": lambda: FixedWindowCounter(window_size=1, max_request=100),
+    "SlidingWindowLog": lambda: SlidingWindowLog(window_size=1, max_request=100),
+    "SlidingWindowCounter": lambda: SlidingWindowCounter(window_size=1, max_request=100),
+}
+
+
+def loop(limiter, batches: list) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        for key in batch:
+            limiter.allow_request(key)
+    return time.perf_counter() - start
+
+
+def batched(limiter, batches: list) -> float:
+    start = time.perf_counter()
+    for batch in batches:
+        limiter.allow_requests(batch)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 256])
+    parser.add_argument("--decisions", type=int, default=200_000)
+    parser.add_argument("--key-space", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rng = random.Random(9)
+    print(f"{'limiter':>21} {'batch':>6} {'loop ns/dec':>12} {'batch ns/dec':>13} {'speedup':>8}")
+    for name, build in LIMITERS.items():
+        for size in args.batch_sizes:
+            batches = [[f"user-{rng.randrange(args.key_space)}" for _ in range(size)] for _ in range(args.decisions // size)]
+            total = len(batches) * size
+            loop_s = loop(build(), batches)
+            batch_s = batched(build(), batches)
+            print(f"{name:>21} {size:>6} {loop_s / total * 1e9:>12.0f} {batch_s / total * 1e9:>13.0f} {loop_s / batch_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
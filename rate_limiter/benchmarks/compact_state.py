@@ -0,0 +1,64 @@
+"""
+Memory per key and decisions/sec: CompactStateStore vs the dict-record StripedStateStore.
+
+Memory is traced while a limiter tracks --keys distinct keys; the keys
+themselves are created up front so only the limiter state is counted.
+
+Run from the repository root:
+    python -m rate_limiter.benchmarks.compact_state --keys 200000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from ..algorithms.fixed_window_counter import FixedWindowCounter
+from ..algorithms.sliding_window_counter import SlidingWindowCounter
+from ..algorithms.token_bucket import TokenBucket
+from ..storage.compact_state_store import CompactStateStore
+from ..storage.striped_state_store import StripedStateStore
+
+LIMITERS = {
+    "TokenBucket": lambda factory: TokenBucket(capacity=100, refill_rate=10, store_factory=factory),
+    "FixedWindowCounter": lambda factory: FixedWindowCounter(window_size=60, max_request=100, store_factory=factory),
+    "SlidingWindowCounter": lambda factory: SlidingWindowCounter(window_size=60, max_request=100, store_factory=factory),
+}
+STORES = {"dict records": StripedStateStore, "compact": CompactStateStore}
+
+
+def bytes_per_key(build, factory, keys: list) -> float:
+    tracemalloc.start()
+    limiter = build(factory)
+    for key in keys:
+        limiter.allow_request(key)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used / len(keys)
+
+
+def decisions_per_sec(build, factory, keys: list, ops: int) -> float:
+    limiter = build(factory)
+    rng = random.Random(5)
+    trace = [rng.choice(keys) for _ in range(ops)]
+    start = time.perf_counter()
+    for key in trace:
+        limiter.allow_request(key)
+    return ops / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=200_000)
+    parser.add_argument("--ops", type=int, default=500_000)
+    args = parser.parse_args()
+
+    keys = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.keys)]
+    print(f"{'limiter':>21} {'store':>13} {'bytes/key':>10} {'decisions/s':>12}")
+    for name, build in LIMITERS.items():
+        for store_name, factory in STORES.items():
+            per_key = bytes_per_key(build, factory, keys)
+            rate = decisions_per_sec(build, factory, keys, args.ops)
+            print(f"{name:>21} {store_name:>13} {per_key:>10.0f} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Multi-process simulation of DistributedSlidingWindowCounter.
+
+Starts a SyncServer and N node processes that each run their own limiter
+against the same keys. Every node offers `--rate` requests per second per
+key (node 0 offers `--skew` times as many) and records which it admitted;
+the admitted counts are then tallied per key and fixed window and compared
+with the limit, next to a static split where each node enforces
+max_request / N on its own and never syncs.
+
+Run from the repository root:
+    python -m rate_limiter.benchmarks.distributed_sim --nodes 4 --sync-interval 0.05
+"""
+import argparse
+import multiprocessing
+import time
+from collections import Counter
+from ..algorithms.distributed_sliding_window_counter import DistributedSlidingWindowCounter
+from ..algorithms.sliding_window_counter import SlidingWindowCounter
+from ..storage.sync_backend import InProcessSyncBackend, SocketSyncBackend, SyncServer
+
+
+def run_server(endpoint_queue) -> None:
+    server = SyncServer(InProcessSyncBackend())
+    endpoint_queue.put((server.address, server.authkey))
+    server.serve_forever()
+
+
+def run_node(index: int, args, endpoint, start_at: float, results) -> None:
+    if endpoint is None:
+        limiter = SlidingWindowCounter(args.window, args.max_request // args.nodes)
+    else:
+        limiter = DistributedSlidingWindowCounter(
+            args.window, args.max_request, SocketSyncBackend(*endpoint),
+            sync_interval=args.sync_interval, node_id=f"node-{index}",
+        )
+    keys = [f"user-{k}" for k in range(args.keys)]
+    rate = args.rate * (args.skew if index == 0 else 1)
+    interval = 1 / rate
+    admitted: Counter = Counter()
+    decisions = 0
+
+    time.sleep(max(0.0, start_at - time.time()))
+    next_tick = start_at
+    while next_tick < start_at + args.duration:
+        now = time.time()
+        if now < next_tick:
+            time.sleep(next_tick - now)
+        for key, allowed in zip(keys, limiter.allow_requests(keys)):
+            if allowed:
+                admitted[key, int(time.time() // args.window)] += 1
+        decisions += len(keys)
+        next_tick += interval
+
+    if endpoint is not None:
+        limiter.stop_sync()
+    results.put((decisions, admitted))
+
+
+def simulate(args, endpoint) -> dict:
+    results = multiprocessing.Queue()
+    start_at = time.time() + 0.5
+    nodes = [
+        multiprocessing.Process(target=run_node, args=(i, args, endpoint, start_at, results))
+        for i in range(args.nodes)
+    ]
+    for node in nodes:
+        node.start()
+    admitted: Counter = Counter()
+    decisions = 0
+    for _ in nodes:
+        node_decisions, node_admitted = results.get()
+        decisions += node_decisions
+        admitted.update(node_admitted)
+    for node in nodes:
+        node.join()
+
+    first = int(start_at // args.window)
+    last = int((start_at + args.duration) // args.window)
+    # Only whole windows: the first and last are cut short by the run itself.
+    counts = [count for (_, window), count in admitted.items() if first < window < last]
+    return {
+        "decisions/s": decisions / args.duration,
+        "max/limit": max(counts) / args.max_request if counts else 0.0,
+        "mean/limit": sum(counts) / len(counts) / args.max_request if counts else 0.0,
+        "over-admitted": sum(max(0, count - args.max_request) for count in counts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--keys", type=int, default=20)
+    parser.add_argument("--window", type=int, default=1)
+    parser.add_argument("--max-request", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=10.0, help="requests per second per key and node")
+    parser.add_argument("--skew", type=float, default=20.0, help="rate multiplier for node 0")
+    parser.add_argument("--sync-interval", type=float, default=0.05)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    endpoint_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=run_server, args=(endpoint_queue,), daemon=True)
+    server.start()
+    endpoint = endpoint_queue.get()
+
+    print(f"{'mode':>12} {'decisions/s':>12} {'max/limit':>10} {'mean/limit':>11} {'over-admitted':>14}")
+    for mode, mode_endpoint in (("synced", endpoint), ("static split", None)):
+        result = simulate(args, mode_endpoint)
+        print(
+            f"{mode:>12} {result['decisions/s']:>12.0f} {result['max/limit']:>10.2f} "
+            f"{result['mean/limit']:>11.2f} {result['over-admitted']:>14}"
+        )
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
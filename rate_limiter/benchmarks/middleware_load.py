@@ -0,0 +1,116 @@
+"""
+Load test of RateLimitMiddleware: request latency with the limiter disabled and enabled.
+
+Requests are driven straight into a Starlette app's ASGI interface by
+--concurrency client tasks, so the numbers are the app's and the
+middleware's own cost with no network in between. Modes:
+
+- disabled: no middleware.
+- event loop store: limiter with lock-free, event-loop-only state.
+- shared thread store: limiter with thread locks, also hammered by a
+  background thread, as happens when sync code shares the limiter; the
+  event loop then waits on those locks.
+
+Needs starlette installed. Run from the repository root:
+    python -m rate_limiter.benchmarks.middleware_load --requests 20000
+"""
+import argparse
+import asyncio
+import random
+import threading
+import time
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from ..algorithms.token_bucket import TokenBucket
+from ..async_limiter import AsyncRateLimiter, event_loop_store
+from ..middleware import RateLimitMiddleware
+
+
+async def hello(request):
+    return PlainTextResponse("ok")
+
+
+def build_app(limiter=None):
+    app = Starlette(routes=[Route("/", hello)])
+    if limiter is not None:
+        app.add_middleware(RateLimitMiddleware, limiter=AsyncRateLimiter(limiter))
+    return app
+
+
+async def request(app, client: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/", "raw_path": b"/", "root_path": "", "query_string": b"",
+        "headers": [], "client": (client, 40000), "server": ("127.0.0.1", 8000),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def drive(app, requests: int, concurrency: int, clients: int) -> tuple:
+    rng = random.Random(2)
+    latencies = []
+    rejected = 0
+    remaining = requests
+
+    async def client_task():
+        nonlocal remaining, rejected
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            if await request(app, f"10.0.0.{rng.randrange(clients)}") == 429:
+                rejected += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_task() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return (
+        requests / elapsed,
+        latencies[len(latencies) // 2] * 1e6,
+        latencies[int(len(latencies) * 0.99)] * 1e6,
+        rejected,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--rate", type=int, default=1_000, help="requests per second allowed per client")
+    args = parser.parse_args()
+
+    print(f"{'mode':>20} {'req/s':>9} {'p50 us':>8} {'p99 us':>8} {'429s':>6}")
+    modes = [
+        ("disabled", lambda: None),
+        ("event loop store", lambda: TokenBucket(args.rate, args.rate, store_factory=event_loop_store)),
+        ("shared thread store", lambda: TokenBucket(args.rate, args.rate)),
+    ]
+    for name, build in modes:
+        limiter = build()
+        stop = threading.Event()
+        if name == "shared thread store":
+            def hammer():
+                while not stop.is_set():
+                    limiter.allow_requests([f"10.0.0.{i}" for i in range(args.clients)])
+            threading.Thread(target=hammer, daemon=True).start()
+        rate, p50, p99, rejected = asyncio.run(drive(build_app(limiter), args.requests, args.concurrency, args.clients))
+        stop.set()
+        print(f"{name:>20} {rate:>9,.0f} {p50:>8.0f} {p99:>8.0f} {rejected:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Accuracy, throughput and memory of BucketedSlidingWindowLog against the exact SlidingWindowLog.
+
+Each key gets Poisson traffic at --load times its limit. The clock is the
+trace time, passed to allow_requests, so runs are deterministic.
+Accuracy is the share of the exact log's admissions the bucketed log
+also admits; "max/window" is the most admissions found in any window,
+which must never exceed the limit. Memory is traced with the log full.
+
+Run from the repository root:
+    python -m rate_limiter.benchmarks.sliding_log_accuracy --buckets 4 10 60
+"""
+import argparse
+import bisect
+import random
+import time
+import tracemalloc
+from ..algorithms.bucketed_sliding_window_log import BucketedSlidingWindowLog
+from ..algorithms.sliding_window_log import SlidingWindowLog
+
+
+def poisson_trace(keys: int, rate: float, duration: float, seed: int) -> list:
+    rng = random.Random(seed)
+    trace = []
+    for key in range(keys):
+        t = 0.0
+        while True:
+            t += rng.expovariate(rate)
+            if t >= duration:
+                break
+            trace.append((t, f"user-{key}"))
+    trace.sort()
+    return trace
+
+
+def replay(limiter, trace: list, window: float) -> tuple:
+    admitted = {}
+    start = time.perf_counter()
+    for now, key in trace:
+        if limiter.allow_requests((key,), now=now)[0]:
+            admitted.setdefault(key, []).append(now)
+    elapsed = time.perf_counter() - start
+    worst = 0
+    for times in admitted.values():
+        for t in times:
+            worst = max(worst, bisect.bisect_right(times, t) - bisect.bisect_right(times, t - window))
+    return sum(len(times) for times in admitted.values()), worst, len(trace) / elapsed
+
+
+def bytes_per_key(limiter, keys: int, max_request: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for key in range(keys):
+        limiter.allow_requests([f"user-{key}"] * max_request, now=1.0)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--buckets", type=int, nargs="+", default=[4, 10, 60])
+    parser.add_argument("--window", type=float, default=10.0)
+    parser.add_argument("--max-request", type=int, default=100)
+    parser.add_argument("--load", type=float, default=1.5, help="offered load relative to the limit")
+    parser.add_argument("--keys", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=120.0)
+    args = parser.parse_args()
+
+    trace = poisson_trace(args.keys, args.load * args.max_request / args.window, args.duration, seed=4)
+    limiters = [("exact log", lambda: SlidingWindowLog(args.window, args.max_request))]
+    for buckets in args.buckets:
+        limiters.append((f"{buckets} buckets", lambda b=buckets: BucketedSlidingWindowLog(args.window, args.max_request, buckets=b)))
+
+    exact_admitted = None
+    print(f"{'limiter':>11} {'admitted':>9} {'accuracy':>9} {'max/window':>11} {'decisions/s':>12} {'bytes/key':>10}")
+    for name, build in limiters:
+        admitted, worst, rate = replay(build(), trace, args.window)
+        exact_admitted = exact_admitted or admitted
+        per_key = bytes_per_key(build(), 1_000, args.max_request)
+        print(f"{name:>11} {admitted:>9,} {admitted / exact_admitted:>8.1%} {worst:>11} {rate:>12,.0f} {per_key:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Limiter state store benchmark: lock striping under threads, memory under key churn.
+
+Throughput compares one stripe (a single global lock, like the old
+limiters) with a striped store. Under CPython's GIL the gain comes from
+fewer lock hand-offs, not from parallel execution.
+
+The churn test feeds a stream of never-repeating keys and samples the
+number of tracked keys and traced memory. The unbounded store grows with
+every key; the idle-TTL and max_keys stores stay flat.
+
+Run from the repository root:
+    python -m rate_limiter.benchmarks.state_store
+"""
+import argparse
+import random
+import threading
+import time
+import tracemalloc
+from functools import partial
+from ..algorithms.fixed_window_counter import FixedWindowCounter
+from ..algorithms.sliding_window_counter import SlidingWindowCounter
+from ..algorithms.token_bucket import TokenBucket
+from ..storage.striped_state_store import StripedStateStore
+
+
+def unbounded(defaults, idle_ttl):
+    return StripedStateStore(defaults, idle_ttl=None)
+
+
+def throughput(limiter_cls, stripes: int, threads: int, ops: int, key_space: int) -> float:
+    limiter = limiter_cls(100, 1_000, store_factory=partial(StripedStateStore, stripes=stripes))
+    rng = random.Random(7)
+    key_lists = [[f"10.0.{k // 256}.{k % 256}" for k in (rng.randrange(key_space) for _ in range(ops))] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(keys):
+        barrier.wait()
+        for key in keys:
+            limiter.allow_request(key)
+
+    workers = [threading.Thread(target=worker, args=(keys,)) for keys in key_lists]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def churn(name: str, store_factory, keys: int, samples: int) -> None:
+    # Refill to full in 10 ms, so a key is idle long before the run ends.
+    limiter = TokenBucket(capacity=10, refill_rate=1_000, store_factory=store_factory)
+    tracemalloc.start()
+    readings = []
+    for i in range(keys):
+        limiter.allow_request(f"client-{i}")
+        if (i + 1) % (keys // samples) == 0:
+            readings.append((len(limiter.store), tracemalloc.get_traced_memory()[0]))
+    tracemalloc.stop()
+    print(f"{name:>14} " + " ".join(f"{count:>8,}/{mem / 1e6:5.1f}MB" for count, mem in readings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ops", type=int, default=100_000, help="decisions per thread")
+    parser.add_argument("--key-space", type=int, default=10_000)
+    parser.add_argument("--stripes", type=int, default=64)
+    parser.add_argument("--churn-keys", type=int, default=400_000)
+    args = parser.parse_args()
+
+    for limiter_cls in (TokenBucket, FixedWindowCounter, SlidingWindowCounter):
+        print(limiter_cls.__name__)
+        print(f"{'threads':>8} {'1-stripe dec/s':>15} {f'{args.stripes}-stripe dec/s':>16} {'speedup':>8}")
+        for threads in args.threads:
+            single = throughput(limiter_cls, 1, threads, args.ops, args.key_space)
+            striped = throughput(limiter_cls, args.stripes, threads, args.ops, args.key_space)
+            print(f"{threads:>8} {single:>15,.0f} {striped:>16,.0f} {striped / single:>7.2f}x")
+
+    print("\nunique-key churn: tracked keys / traced memory at evenly spaced points")
+    churn("unbounded", unbounded, args.churn_keys, 4)
+    churn("idle ttl", StripedStateStore, args.churn_keys, 4)
+    churn("max 10k keys", lambda defaults, idle_ttl: StripedStateStore(defaults, idle_ttl=None, max_keys=10_000),
+          args.churn_keys, 4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Replay request traces through every limiter and report throughput, latency,
+memory and accuracy as JSON, for tracking regressions between commits.
+
+All limiters enforce the same limit, --max-request per --window seconds
+(the buckets refill or leak at max_request / window per second), and run on
+a ReplayClock that follows the trace's timestamps, so runs are deterministic
+and take no longer than the decisions themselves.
+
+Traces:
+    poisson   Independent arrivals at --load times the limit per key.
+    bursty    On/off traffic: bursts at --burst-factor times the Poisson rate,
+              silence in between, the same mean rate.
+    zipf      Poisson arrivals over all keys, with keys drawn from a Zipf
+              distribution (--zipf-s), so a few keys are far over their limit.
+    file      A recorded trace given with --trace-file: one "timestamp,key[,cost]" per line.
+
+Accuracy is measured against an ideal sliding window: "ideal_admitted" is how
+many requests an exact per-key log of the last `window` seconds admits, and
+"violations" counts admitted requests that made a key exceed max_request in
+some window-long span.
+
+Run from the repository root:
+    python -m rate_limiter.benchmarks.trace_replay --traces poisson zipf --output results.json
+"""
+import argparse
+import bisect
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Dict, List, Tuple
+from ..algorithms.bucketed_sliding_window_log import BucketedSlidingWindowLog
+from ..algorithms.fixed_window_counter import FixedWindowCounter
+from ..algorithms.leaky_bucket import LeakyBucket
+from ..algorithms.sliding_window_counter import SlidingWindowCounter
+from ..algorithms.sliding_window_log import SlidingWindowLog
+from ..algorithms.token_bucket import TokenBucket
+
+# (timestamp, key, cost), in timestamp order.
+Trace = List[Tuple[float, str, int]]
+
+
+class ReplayClock:
+    """
+    Clock that reads whatever time the replay last set.
+    """
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def limiters(window: float, max_request: int) -> dict:
+    rate = max_request / window
+    return {
+        "TokenBucket": lambda clock: TokenBucket(max_request, rate, clock=clock),
+        "LeakyBucket": lambda clock: LeakyBucket(max_request, rate, clock=clock),
+        "FixedWindowCounter": lambda clock: FixedWindowCounter(window, max_request, clock=clock),
+        "SlidingWindowLog": lambda clock: SlidingWindowLog(window, max_request, clock=clock),
+        "SlidingWindowCounter": lambda clock: SlidingWindowCounter(window, max_request, clock=clock),
+        "BucketedSlidingWindowLog": lambda clock: BucketedSlidingWindowLog(window, max_request, clock=clock),
+    }
+
+
+def poisson_trace(keys: int, rate: float, duration: float, rng: random.Random) -> Trace:
+    trace = []
+    for key in range(keys):
+        t = rng.expovariate(rate)
+        while t < duration:
+            trace.append((t, f"user-{key}", 1))
+            t += rng.expovariate(rate)
+    trace.sort()
+    return trace
+
+
+def bursty_trace(keys: int, rate: float, duration: float, burst_factor: float, rng: random.Random) -> Trace:
+    # Bursts average one second; the silences are sized to keep the mean rate.
+    trace = []
+    for key in range(keys):
+        t = rng.uniform(0, burst_factor)
+        while t < duration:
+            burst_end = t + rng.expovariate(1.0)
+            while t < min(burst_end, duration):
+                trace.append((t, f"user-{key}", 1))
+                t += rng.expovariate(rate * burst_factor)
+            t = burst_end + rng.expovariate(1 / (burst_factor - 1))
+    trace.sort()
+    return trace
+
+
+def zipf_trace(keys: int, rate: float, duration: float, s: float, rng: random.Random) -> Trace:
+    weights = [1 / (rank + 1) ** s for rank in range(keys)]
+    names = [f"user-{key}" for key in range(keys)]
+    total_rate = rate * keys
+    trace = []
+    t = rng.expovariate(total_rate)
+    while t < duration:
+        trace.append((t, rng.choices(names, weights)[0], 1))
+        t += rng.expovariate(total_rate)
+    return trace
+
+
+def file_trace(path: str) -> Trace:
+    trace = []
+    with open(path) as f:
+        for line in f:
+            fields = line.strip().split(",")
+            if len(fields) < 2 or fields[0] == "timestamp":
+                continue
+            cost = int(fields[2]) if len(fields) > 2 else 1
+            trace.append((float(fields[0]), fields[1], cost))
+    trace.sort(key=lambda event: event[0])
+    return trace
+
+
+def ideal_admitted(trace: Trace, window: float, max_request: int) -> int:
+    logs: Dict[str, deque] = {}
+    admitted = 0
+    for now, key, cost in trace:
+        log = logs.setdefault(key, deque())
+        while log and log[0] <= now - window:
+            log.popleft()
+        if len(log) + cost <= max_request:
+            log.extend([now] * cost)
+            admitted += 1
+    return admitted
+
+
+def violations(admitted: Dict[str, List[Tuple[float, int]]], window: float, max_request: int) -> int:
+    count = 0
+    for events in admitted.values():
+        times = [t for t, _ in events]
+        units = [0]
+        for _, cost in events:
+            units.append(units[-1] + cost)
+        for i, (t, _) in enumerate(events):
+            start = bisect.bisect_right(times, t - window)
+            if units[i + 1] - units[start] > max_request:
+                count += 1
+    return count
+
+
+def percentile(sorted_values: List[int], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def replay(build, trace: Trace, window: float, max_request: int) -> dict:
+    clock = ReplayClock(trace[0][0] if trace else 0.0)
+    limiter = build(clock)
+    allow = limiter.allow_request
+    perf = time.perf_counter_ns
+    latencies = [0] * len(trace)
+    admitted: Dict[str, List[Tuple[float, int]]] = {}
+    start = time.perf_counter()
+    for i, (now, key, cost) in enumerate(trace):
+        clock.now = now
+        before = perf()
+        allowed = allow(key, cost)
+        latencies[i] = perf() - before
+        if allowed:
+            admitted.setdefault(key, []).append((now, cost))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "decisions_per_sec": len(trace) / elapsed if elapsed else 0.0,
+        "p50_ns": percentile(latencies, 0.50) if latencies else 0,
+        "p99_ns": percentile(latencies, 0.99) if latencies else 0,
+        "admitted": sum(len(events) for events in admitted.values()),
+        "violations": violations(admitted, window, max_request),
+    }
+
+
+def bytes_per_active_key(build, trace: Trace) -> float:
+    # A separate pass: tracing allocations would distort the latencies.
+    clock = ReplayClock(trace[0][0] if trace else 0.0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    limiter = build(clock)
+    for now, key, cost in trace:
+        clock.now = now
+        limiter.allow_request(key, cost)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    keys = len(limiter.store)
+    return used / keys if keys else 0.0
+
+
+def build_traces(args) -> Dict[str, Trace]:
+    rng = random.Random(args.seed)
+    rate = args.load * args.max_request / args.window
+    traces = {}
+    for name in args.traces:
+        if name == "poisson":
+            traces[name] = poisson_trace(args.keys, rate, args.duration, rng)
+        elif name == "bursty":
+            traces[name] = bursty_trace(args.keys, rate, args.duration, args.burst_factor, rng)
+        elif name == "zipf":
+            traces[name] = zipf_trace(args.keys, rate, args.duration, args.zipf_s, rng)
+        elif name == "file":
+            if not args.trace_file:
+                raise SystemExit("the file trace needs --trace-file")
+            traces[name] = file_trace(args.trace_file)
+    return traces
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--traces", nargs="+", choices=["poisson", "bursty", "zipf", "file"], default=["poisson", "bursty", "zipf"])
+    parser.add_argument("--trace-file", help="recorded trace for --traces file")
+    parser.add_argument("--limiters", nargs="+", help="subset of limiters to run; all by default")
+    parser.add_argument("--window", type=float, default=10.0)
+    parser.add_argument("--max-request", type=int, default=100)
+    parser.add_argument("--load", type=float, default=1.5, help="offered load per key relative to the limit")
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--burst-factor", type=float, default=5.0)
+    parser.add_argument("--zipf-s", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    if args.burst_factor <= 1:
+        parser.error("--burst-factor must be above 1")
+
+    candidates = limiters(args.window, args.max_request)
+    names = args.limiters or list(candidates)
+    unknown = set(names) - set(candidates)
+    if unknown:
+        parser.error(f"unknown limiters: {', '.join(sorted(unknown))}")
+
+    report = {"config": {k: v for k, v in vars(args).items() if k != "output"}, "results": {}}
+    for trace_name, trace in build_traces(args).items():
+        ideal = ideal_admitted(trace, args.window, args.max_request)
+        results = {"requests": len(trace), "ideal_admitted": ideal, "limiters": {}}
+        for name in names:
+            result = replay(candidates[name], trace, args.window, args.max_request)
+            result["admitted_vs_ideal"] = result["admitted"] / ideal if ideal else math.nan
+            result["bytes_per_active_key"] = bytes_per_active_key(candidates[name], trace)
+            results["limiters"][name] = result
+            print(f"{trace_name:>8} {name:>24} {result['decisions_per_sec']:>10,.0f}/s "
+                  f"p99 {result['p99_ns']:>6,}ns admitted {result['admitted_vs_ideal']:>6.1%} of ideal", file=sys.stderr)
+        report["results"][trace_name] = results
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from algorithms.sliding_window_counter import SlidingWindowCounter
+from .algorithms.sliding_window_counter import SlidingWindowCounter
 import time
 
 def main():
@@ -0,0 +1,90 @@
+import math
+from typing import Callable, Dict, Hashable, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .async_limiter import AsyncRateLimiter
+
+def client_host(scope: Scope) -> Hashable:
+    client = scope.get('client')
+    return client[0] if client else 'unknown'
+
+class RateLimitMiddleware:
+    """
+    Starlette/FastAPI middleware that rate limits HTTP requests per key.
+
+    Admitted responses get X-RateLimit-Limit and X-RateLimit-Remaining headers;
+    rejected requests get a 429 with Retry-After and X-RateLimit-Reset. Written
+    as plain ASGI middleware rather than BaseHTTPMiddleware to keep the
+    per-request overhead low.
+
+    Usage:
+        app.add_middleware(RateLimitMiddleware, limiter=AsyncRateLimiter(...))
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: AsyncRateLimiter,
+        key_func: Callable[[Scope], Hashable] = client_host,
+        cost_func: Optional[Callable[[Scope], int]] = None,
+        limit: Optional[int] = None,
+        max_wait: float = 0.0,
+    ):
+        """
+        Args:
+            app: The wrapped ASGI application.
+            limiter: Decides each request.
+            key_func: Maps a request scope to its rate-limit key; defaults to the client IP.
+            cost_func: Optional cost of a request; defaults to 1.
+            limit: Value of X-RateLimit-Limit; defaults to the limiter's
+                max_request or capacity.
+            max_wait: Seconds a request may wait for capacity before being
+                rejected; 0 rejects immediately.
+        """
+        self.app = app
+        self.limiter = limiter
+        self.key_func = key_func
+        self.cost_func = cost_func
+        if limit is None:
+            limit = getattr(limiter.limiter, 'max_request', None) or getattr(limiter.limiter, 'capacity', None)
+        self.limit = limit
+        self.max_wait = max_wait
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        key = self.key_func(scope)
+        cost = 1 if self.cost_func is None else self.cost_func(scope)
+        if self.max_wait > 0:
+            decision = await self.limiter.acquire(key, cost, timeout=self.max_wait)
+        else:
+            decision = self.limiter.allow(key, cost)
+        headers = self._headers(decision.remaining)
+
+        if not decision.allowed:
+            if decision.retry_after != math.inf:
+                retry_after = str(math.ceil(decision.retry_after))
+                headers['Retry-After'] = retry_after
+                headers['X-RateLimit-Reset'] = retry_after
+            response = JSONResponse({'detail': 'Too Many Requests'}, status_code=429, headers=headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers.append(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _headers(self, remaining: Optional[int]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.limit is not None:
+            headers['X-RateLimit-Limit'] = str(self.limit)
+        if remaining is not None:
+            headers['X-RateLimit-Remaining'] = str(max(0, remaining))
+        return headers
@@ -0,0 +1,166 @@
+import threading
+from array import array
+from typing import Callable, ContextManager, Dict, Hashable, Iterator, List, Optional, Tuple
+from .state_store import StateStore, Defaults
+from .striped_state_store import SWEEP_BATCH
+
+class _Row:
+    """
+    View of one key's state; reads and writes go straight to the columns.
+    """
+    __slots__ = ('_columns', '_slot')
+
+    def __init__(self, columns: Dict[str, array], slot: int):
+        self._columns = columns
+        self._slot = slot
+
+    def __getitem__(self, field: str) -> float:
+        return self._columns[field][self._slot]
+
+    def __setitem__(self, field: str, value: float) -> None:
+        self._columns[field][self._slot] = value
+
+class _Table:
+    __slots__ = ('slots', 'keys', 'columns', 'touched', 'free', 'cursor')
+
+    def __init__(self, fields: List[str]):
+        self.slots: Dict[Hashable, int] = {}
+        # Key stored in each slot, None for a free slot.
+        self.keys: List[Optional[Hashable]] = []
+        self.columns: Dict[str, array] = {field: array('d') for field in fields}
+        self.touched = array('d')
+        self.free: List[int] = []
+        # Next slot the incremental idle sweep looks at.
+        self.cursor = 0
+
+class CompactStateStore(StateStore):
+    """
+    StateStore keeping numeric per-key state in typed columns instead of dicts.
+
+    Each stripe maps keys to slot numbers; every field of the defaults is an
+    array('d') column indexed by slot, and freed slots are reused. get()
+    returns a small row view, so limiters index it like the dict records of
+    StripedStateStore. A key costs about 8 bytes per field plus its dict
+    entry and slot number, against several hundred bytes for a dict record.
+
+    Only numeric fields are supported; values read back as floats, which
+    compare equal to the ints that were written.
+
+    Idle keys are reclaimed by a cursor that visits SWEEP_BATCH slots per
+    inserted key. Once a stripe holds `max_keys / stripes` keys, the least
+    recently used of the next SWEEP_BATCH slots is evicted, which
+    approximates LRU.
+    """
+    def __init__(
+        self,
+        defaults: Defaults,
+        idle_ttl: Optional[float] = None,
+        stripes: int = 64,
+        max_keys: Optional[int] = None,
+        lock_factory: Callable[[], ContextManager] = threading.Lock,
+    ):
+        """
+        Args:
+            defaults: Builds the state of a new key from the current time; all values must be numbers.
+            idle_ttl: Seconds after the last access at which a key may be dropped,
+                or None to keep idle keys until max_keys forces them out.
+            stripes: Number of independent stripes (and locks).
+            max_keys: Optional bound on the number of keys.
+            lock_factory: Builds one stripe lock.
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        sample = defaults(0.0)
+        for field, value in sample.items():
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"CompactStateStore only stores numbers; field '{field}' is {type(value).__name__}.")
+        self._defaults = defaults
+        self._fields = list(sample)
+        self._idle_ttl = idle_ttl
+        self._num_stripes = stripes
+        self._max_per_stripe = None if max_keys is None else max(1, max_keys // stripes)
+        self._tables: List[_Table] = [_Table(self._fields) for _ in range(stripes)]
+        self._locks: List[ContextManager] = [lock_factory() for _ in range(stripes)]
+
+    def stripe_index(self, key: Hashable) -> int:
+        return hash(key) % self._num_stripes
+
+    def stripe_lock(self, index: int) -> ContextManager:
+        return self._locks[index]
+
+    def lock_for(self, key: Hashable) -> ContextManager:
+        return self._locks[hash(key) % self._num_stripes]
+
+    def get(self, key: Hashable, now: float) -> _Row:
+        table = self._tables[hash(key) % self._num_stripes]
+        slot = table.slots.get(key)
+        if slot is None:
+            slot = self._allocate(table, key, now)
+        table.touched[slot] = now
+        return _Row(table.columns, slot)
+
+    def sweep(self, now: float) -> int:
+        if self._idle_ttl is None:
+            return 0
+        cutoff = now - self._idle_ttl
+        dropped = 0
+        for index, table in enumerate(self._tables):
+            with self._locks[index]:
+                for slot, key in enumerate(table.keys):
+                    if key is not None and table.touched[slot] <= cutoff:
+                        self._release(table, slot)
+                        dropped += 1
+        return dropped
+
+    @property
+    def num_stripes(self) -> int:
+        return self._num_stripes
+
+    def records(self, index: int) -> Iterator[Tuple[Hashable, _Row]]:
+        table = self._tables[index]
+        return iter([(key, _Row(table.columns, slot)) for key, slot in table.slots.items()])
+
+    def __len__(self) -> int:
+        return sum(len(table.slots) for table in self._tables)
+
+    def _allocate(self, table: _Table, key: Hashable, now: float) -> int:
+        self._make_room(table, now)
+        if table.free:
+            slot = table.free.pop()
+            table.keys[slot] = key
+            for field, value in self._defaults(now).items():
+                table.columns[field][slot] = value
+        else:
+            slot = len(table.keys)
+            table.keys.append(key)
+            for field, value in self._defaults(now).items():
+                table.columns[field].append(value)
+            table.touched.append(now)
+        table.slots[key] = slot
+        return slot
+
+    def _make_room(self, table: _Table, now: float) -> None:
+        size = len(table.keys)
+        if not size:
+            return
+        cutoff = None if self._idle_ttl is None else now - self._idle_ttl
+        full = self._max_per_stripe is not None and len(table.slots) >= self._max_per_stripe
+        oldest = None
+        for _ in range(min(SWEEP_BATCH, size)):
+            slot = table.cursor
+            table.cursor = (slot + 1) % size
+            if table.keys[slot] is None:
+                continue
+            if cutoff is not None and table.touched[slot] <= cutoff:
+                self._release(table, slot)
+                full = False
+            elif oldest is None or table.touched[slot] < table.touched[oldest]:
+                oldest = slot
+        if full:
+            # Fall back to the oldest insertion when every sampled slot was free.
+            self._release(table, oldest if oldest is not None else next(iter(table.slots.values())))
+
+    def _release(self, table: _Table, slot: int) -> None:
+        del table.slots[table.keys[slot]]
+        table.keys[slot] = None
+        table.free.append(slot)
@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, ContextManager, Dict, Hashable, Iterator, Optional, Tuple
+
+# Builds the initial state of a key that has not been seen yet, given the current time.
+Defaults = Callable[[float], Dict[str, Any]]
+
+class StateStore(ABC):
+    """
+    Per-key limiter state, partitioned into stripes that each have their own lock.
+
+    A limiter holds `lock_for(key)` while it reads and updates the record
+    returned by `get(key, now)`. Keys whose state has been idle for
+    `idle_ttl` seconds may be dropped and later recreated from the defaults,
+    so limiters pass an idle TTL after which a fresh record behaves exactly
+    like the old one.
+    """
+    @abstractmethod
+    def stripe_index(self, key: Hashable) -> int:
+        """
+        Index of the stripe that owns the key.
+        """
+        pass
+
+    @abstractmethod
+    def stripe_lock(self, index: int) -> ContextManager:
+        """
+        Lock guarding every key of one stripe.
+        """
+        pass
+
+    def lock_for(self, key: Hashable) -> ContextManager:
+        """
+        Lock guarding the key's stripe.
+        """
+        return self.stripe_lock(self.stripe_index(key))
+
+    @abstractmethod
+    def get(self, key: Hashable, now: float) -> Dict[str, Any]:
+        """
+        Mutable state of the key, created from the defaults if absent.
+        Must be called with the key's stripe lock held.
+        """
+        pass
+
+    @abstractmethod
+    def sweep(self, now: float) -> int:
+        """
+        Drop the keys that have been idle for longer than the idle TTL.
+
+        Returns:
+            The number of keys dropped.
+        """
+        pass
+
+    @property
+    def num_stripes(self) -> int:
+        """
+        Number of stripes; stripe indexes run from 0 to num_stripes - 1.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not expose its stripes.")
+
+    def records(self, index: int) -> Iterator[Tuple[Hashable, Dict[str, Any]]]:
+        """
+        Iterate over the (key, state) pairs of one stripe without touching them.
+        Must be called with that stripe's lock held.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support iterating its records.")
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+# Builds a store from the defaults of a limiter and the idle TTL after which
+# its state has fully decayed, e.g. StripedStateStore or a functools.partial of it.
+StoreFactory = Callable[[Defaults, Optional[float]], StateStore]
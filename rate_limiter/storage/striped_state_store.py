@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, ContextManager, Dict, Hashable, Iterator, List, Optional, Tuple
+from .state_store import StateStore, Defaults
+
+# Idle keys reclaimed by a single get() that inserts a key, so no call pays for a full sweep.
+SWEEP_BATCH = 8
+
+class _Stripe:
+    __slots__ = ('records', 'touched')
+
+    def __init__(self):
+        # Key -> state, least recently used first.
+        self.records: 'OrderedDict[Hashable, Dict[str, Any]]' = OrderedDict()
+        self.touched: Dict[Hashable, float] = {}
+
+class StripedStateStore(StateStore):
+    """
+    StateStore with lock striping by key hash and bounded memory.
+
+    Each stripe keeps its keys in least-recently-used order, so idle keys
+    are found at the front: inserting a key reclaims up to SWEEP_BATCH keys
+    idle for longer than `idle_ttl`, and evicts the least recently used key
+    once the stripe holds `max_keys / stripes` keys.
+    """
+    def __init__(
+        self,
+        defaults: Defaults,
+        idle_ttl: Optional[float] = None,
+        stripes: int = 64,
+        max_keys: Optional[int] = None,
+        lock_factory: Callable[[], ContextManager] = threading.Lock,
+    ):
+        """
+        Args:
+            defaults: Builds the state of a new key from the current time.
+            idle_ttl: Seconds after the last access at which a key may be dropped,
+                or None to keep idle keys until max_keys forces them out.
+            stripes: Number of independent stripes (and locks).
+            max_keys: Optional bound on the number of keys. Evicting a key that is
+                not idle forgets its state, so size this above the active key count.
+            lock_factory: Builds one stripe lock; e.g. contextlib.nullcontext
+                for single-threaded or asyncio use.
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._defaults = defaults
+        self._idle_ttl = idle_ttl
+        self._num_stripes = stripes
+        self._max_per_stripe = None if max_keys is None else max(1, max_keys // stripes)
+        self._stripes: List[_Stripe] = [_Stripe() for _ in range(stripes)]
+        self._locks: List[ContextManager] = [lock_factory() for _ in range(stripes)]
+
+    def stripe_index(self, key: Hashable) -> int:
+        return hash(key) % self._num_stripes
+
+    def stripe_lock(self, index: int) -> ContextManager:
+        return self._locks[index]
+
+    def lock_for(self, key: Hashable) -> ContextManager:
+        return self._locks[hash(key) % self._num_stripes]
+
+    def get(self, key: Hashable, now: float) -> Dict[str, Any]:
+        stripe = self._stripes[hash(key) % self._num_stripes]
+        record = stripe.records.get(key)
+        if record is None:
+            self._make_room(stripe, now)
+            record = stripe.records[key] = self._defaults(now)
+        else:
+            stripe.records.move_to_end(key)
+        stripe.touched[key] = now
+        return record
+
+    def sweep(self, now: float) -> int:
+        dropped = 0
+        for index, stripe in enumerate(self._stripes):
+            with self._locks[index]:
+                dropped += self._drop_idle(stripe, now, None)
+        return dropped
+
+    @property
+    def num_stripes(self) -> int:
+        return self._num_stripes
+
+    def records(self, index: int) -> Iterator[Tuple[Hashable, Dict[str, Any]]]:
+        return iter(list(self._stripes[index].records.items()))
+
+    def __len__(self) -> int:
+        return sum(len(stripe.records) for stripe in self._stripes)
+
+    def _make_room(self, stripe: _Stripe, now: float) -> None:
+        self._drop_idle(stripe, now, SWEEP_BATCH)
+        if self._max_per_stripe is not None and len(stripe.records) >= self._max_per_stripe:
+            key, _ = stripe.records.popitem(last=False)
+            del stripe.touched[key]
+
+    def _drop_idle(self, stripe: _Stripe, now: float, limit: Optional[int]) -> int:
+        if self._idle_ttl is None:
+            return 0
+        cutoff = now - self._idle_ttl
+        records, touched = stripe.records, stripe.touched
+        dropped = 0
+        while records and (limit is None or dropped < limit):
+            key = next(iter(records))
+            if touched[key] > cutoff:
+                break
+            del records[key]
+            del touched[key]
+            dropped += 1
+        return dropped
@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+# Per key: (requests counted in the queried window, requests counted in the one before it).
+Totals = Dict[Hashable, Tuple[int, int]]
+
+class SyncBackend(ABC):
+    """
+    Shared per-window request counts that the nodes of a distributed limiter sync with.
+    """
+    @abstractmethod
+    def sync(
+        self,
+        node_id: str,
+        deltas: Dict[int, Dict[Hashable, int]],
+        window: int,
+        keys: Iterable[Hashable],
+    ) -> Tuple[Totals, int]:
+        """
+        Add a node's new counts and read back the global ones.
+
+        Args:
+            node_id: Identifies the calling node.
+            deltas: Requests the node admitted since its last sync, by window and key.
+            window: The window the node is in now.
+            keys: Keys whose global counts the node wants.
+
+        Returns:
+            The global counts of `keys` for `window` and the window before it,
+            and the number of nodes that synced recently.
+        """
+        pass
+
+class InProcessSyncBackend(SyncBackend):
+    """
+    SyncBackend held in memory; shared by nodes in one process, or served
+    to other processes by SyncServer.
+    """
+    def __init__(self, node_ttl: float = 10.0):
+        """
+        Args:
+            node_ttl: Seconds after its last sync at which a node stops counting as active.
+        """
+        self._lock = threading.Lock()
+        self._counts: Dict[int, Dict[Hashable, int]] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._node_ttl = node_ttl
+
+    def sync(self, node_id, deltas, window, keys):
+        now = time.monotonic()
+        with self._lock:
+            for delta_window, counts in deltas.items():
+                if delta_window < window - 1:
+                    # Too old to affect any decision.
+                    continue
+                totals = self._counts.setdefault(delta_window, {})
+                for key, count in counts.items():
+                    totals[key] = totals.get(key, 0) + count
+            for old_window in [w for w in self._counts if w < window - 1]:
+                del self._counts[old_window]
+
+            current = self._counts.get(window, {})
+            previous = self._counts.get(window - 1, {})
+            result = {key: (current.get(key, 0), previous.get(key, 0)) for key in keys}
+
+            self._last_seen[node_id] = now
+            for node, seen in list(self._last_seen.items()):
+                if now - seen > self._node_ttl:
+                    del self._last_seen[node]
+            return result, len(self._last_seen)
+
+class SyncServer:
+    """
+    Serves a SyncBackend to SocketSyncBackend clients over a local socket.
+
+    Messages are pickled, so the authkey is what stops other local users from
+    running code in the server; there is no shared default.
+    """
+    def __init__(self, backend: SyncBackend, address: Optional[Any] = None, authkey: Optional[bytes] = None):
+        """
+        Args:
+            backend: The backend holding the counts.
+            address: Listener address; None picks a fresh Unix socket path.
+            authkey: Shared secret clients must present; None generates a
+                random one, readable from `authkey` to hand to clients.
+        """
+        self._backend = backend
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+
+    def start(self) -> None:
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def serve_forever(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                # A client with the wrong key is turned away; keep serving.
+                continue
+            except OSError:
+                break
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def close(self) -> None:
+        self._listener.close()
+
+    def _serve(self, conn: Connection) -> None:
+        try:
+            while True:
+                args = conn.recv()
+                conn.send(self._backend.sync(*args))
+        except (EOFError, OSError):
+            conn.close()
+
+class SocketSyncBackend(SyncBackend):
+    """
+    Client of a SyncServer; each sync is one round trip.
+    """
+    def __init__(self, address: Any, authkey: bytes):
+        """
+        Args:
+            address: The server's `address`.
+            authkey: The server's `authkey`.
+        """
+        self._conn = Client(address, authkey=authkey)
+        self._lock = threading.Lock()
+
+    def sync(self, node_id, deltas, window, keys):
+        with self._lock:
+            self._conn.send((node_id, deltas, window, list(keys)))
+            return self._conn.recv()
+
+    def close(self) -> None:
+        self._conn.close()